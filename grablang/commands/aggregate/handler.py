@@ -0,0 +1,104 @@
+"""
+Handler principal pour les commandes d'agrégation (SUM, AVG, MIN, MAX, PERCENTILE)
+"""
+from typing import List, Dict, Any
+
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.numeric import Aggregates
+
+class AggregateHandler(BaseCommand):
+    """Handler principal pour les agrégats calculés sur une liste ou un tableau de nombres"""
+
+    # Commandes disponibles (alias déclarés par l'exécuteur)
+    OPERATIONS = ("SUM", "AVG", "MIN", "MAX", "PERCENTILE")
+
+    def __init__(self):
+        self.debug_mode = False
+
+    def set_debug_mode(self, debug_mode: bool):
+        """Active ou désactive le mode debug"""
+        self.debug_mode = debug_mode
+
+    def _debug_print(self, message: str):
+        """Affiche un message seulement en mode debug avec couleur"""
+        if self.debug_mode:
+            colored_prefix = CommandColors.colorize_prefix("AGGREGATE", "COUNT")
+            print(f"{colored_prefix} {message}")
+
+    def _clean_quotes(self, text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
+            return text[1:-1]
+        return text
+
+    def _resolve_values(self, operation: str, args: List[str], variables: Dict[str, Any]) -> Any:
+        """Retourne la variable nommée, ou _last_result sans argument"""
+        if not args:
+            if variables.get('_last_result') is None:
+                raise ValueError(f"{operation}: Aucun résultat précédent à agréger")
+            return variables['_last_result']
+
+        if len(args) > 1:
+            raise ValueError(f"{operation}: Trop d'arguments. Utilisez {operation} ou {operation} variable_name")
+
+        var_name = args[0]
+        if var_name not in variables:
+            available_vars = [name for name in variables.keys() if not name.startswith('_')]
+            available_str = ", ".join(available_vars) if available_vars else "aucune"
+            raise ValueError(f"{operation}: Variable '{var_name}' non trouvée. Variables disponibles: {available_str}")
+        return variables[var_name]
+
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> Any:
+        """
+        Exécute SUM, AVG, MIN, MAX [variable_name] ou PERCENTILE q [variable_name]
+
+        Args:
+            args: [opération, ...] - L'opération (ajoutée par l'exécuteur) et ses arguments
+            variables: Variables disponibles
+
+        Returns:
+            Le nombre calculé
+
+        Exemples:
+            EXTRACT NUMBERS AS FLOAT
+            SUM                 -> Somme de _last_result
+            AVG prix            -> Moyenne de la variable prix
+            PERCENTILE 90 prix  -> 90e percentile (interpolation linéaire)
+
+        Les tableaux produits par EXTRACT NUMBERS AS FLOAT|INT sont agrégés en bloc
+        (NumPy si disponible); une liste de chaînes numériques est convertie une fois.
+        """
+        if len(args) < 1 or args[0].upper() not in self.OPERATIONS:
+            raise ValueError(f"AGGREGATE: Opération inconnue. Disponibles: {', '.join(self.OPERATIONS)}")
+
+        operation = args[0].upper()
+        args = args[1:]
+
+        q = None
+        if operation == "PERCENTILE":
+            if not args:
+                raise ValueError("PERCENTILE: Percentile requis. Usage: PERCENTILE q [variable_name] (q entre 0 et 100)")
+            try:
+                q = float(self._clean_quotes(args[0]))
+            except ValueError:
+                raise ValueError(f"PERCENTILE: Le percentile doit être un nombre, reçu '{args[0]}'")
+            args = args[1:]
+
+        values = Aggregates.as_numbers(self._resolve_values(operation, args, variables), operation)
+
+        if operation == "SUM":
+            result = Aggregates.sum(values)
+        elif operation == "AVG":
+            result = Aggregates.avg(values)
+        elif operation == "MIN":
+            result = Aggregates.min(values)
+        elif operation == "MAX":
+            result = Aggregates.max(values)
+        else:
+            result = Aggregates.percentile(values, q)
+
+        self._debug_print(f"{operation} sur {len(values)} valeur(s): {result}")
+
+        return result
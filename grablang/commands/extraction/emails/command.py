@@ -1,15 +1,18 @@
 """
 Commande EXTRACT EMAILS pour extraire toutes les adresses email d'un contenu HTML ou texte
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
-from typing import List, Dict, Any, Union
-import re
+from bs4 import BeautifulSoup, Tag
+from typing import List, Dict, Any, Iterable, Union
 import sys
 from pathlib import Path
 
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.regex_cache import Patterns
+from grablang.utils.raw_body import RawBody
+from grablang.utils.element_list import is_element_list
+from grablang.utils.text_stream import TextStream
 
 class ExtractionEmailsCommand(BaseCommand):
     """Commande pour extraire toutes les adresses email présentes dans le texte des éléments HTML"""
@@ -31,13 +34,24 @@ class ExtractionEmailsCommand(BaseCommand):
         """Extrait toutes les adresses email d'un texte"""
         if not text:
             return []
-        
-        # Pattern pour capturer les adresses email
-        # Supporte la plupart des formats d'email valides
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        
-        # Supprime les doublons tout en gardant l'ordre
+        return self._extract_emails_from_chunks((text,))
+
+    def _extract_emails_from_chunks(self, chunks: Iterable[str]) -> List[str]:
+        """Extrait les adresses email d'un flux de fragments de texte, sans les joindre"""
+        # Pattern précompilé pour capturer les adresses email
+        emails = (match.group() for match in TextStream.finditer(Patterns.EMAIL, chunks))
+        return self._unique_emails(emails)
+
+    def _extract_emails_raw(self, variables: Dict[str, Any]) -> List[str]:
+        """Extrait les emails du corps brut chargé par LOAD (texte et attributs), sans arbre HTML"""
+        body = RawBody.get(variables, "EXTRACT EMAILS RAW")
+        encoding = RawBody.encoding(variables)
+        # Motif bytes sur une vue sans copie: seules les zones trouvées sont décodées
+        emails = (RawBody.decode(match.group(), encoding) for match in RawBody.EMAIL.finditer(body))
+        return self._unique_emails(emails)
+
+    def _unique_emails(self, emails: Iterable[str]) -> List[str]:
+        """Supprime les doublons (sans tenir compte de la casse) tout en gardant l'ordre"""
         unique_emails = []
         seen = set()
         for email in emails:
@@ -78,12 +92,18 @@ class ExtractionEmailsCommand(BaseCommand):
         Exécute EXTRACT EMAILS
         
         Args:
-            args: Arguments supplémentaires (généralement vide)
+            args: [] ou ["RAW"] pour chercher dans le corps brut chargé par LOAD
             variables: Variables disponibles
             
         Returns:
             List[str] contenant toutes les adresses email trouvées
         """
+        # EXTRACT EMAILS RAW: recherche directe dans le corps brut de la réponse
+        if args and args[0].upper() == "RAW":
+            emails = self._extract_emails_raw(variables)
+            self._debug_print(f"{len(emails)} email(s) unique(s) trouvé(s) dans le corps brut")
+            return emails
+
         # Récupère les éléments depuis _last_result
         last_result = variables.get('_last_result')
         if last_result is None:
@@ -106,7 +126,7 @@ class ExtractionEmailsCommand(BaseCommand):
         
         # Support des éléments HTML
         elements_to_process = []
-        if isinstance(last_result, ResultSet):
+        if is_element_list(last_result):
             elements_to_process = list(last_result)
         elif isinstance(last_result, Tag):
             elements_to_process = [last_result]
@@ -122,9 +142,8 @@ class ExtractionEmailsCommand(BaseCommand):
         # Extrait tous les emails de tous les éléments
         all_emails = []
         for element in elements_to_process:
-            # Extrait depuis le texte
-            text = element.get_text()
-            text_emails = self._extract_emails_from_text(text)
+            # Extrait depuis le texte, parcouru en flux (pas de get_text() complet)
+            text_emails = self._extract_emails_from_chunks(TextStream.element_chunks(element))
             all_emails.extend(text_emails)
             
             # Extrait depuis les attributs
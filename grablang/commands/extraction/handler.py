@@ -38,7 +38,7 @@ class ExtractionHandler(BaseCommand):
         
         # Liste des sous-commandes attendues
         expected_subcommands = [
-            'text', 'text_clean', 'numbers', 'emails', 'urls', 'regex'
+            'text', 'text_clean', 'numbers', 'emails', 'urls', 'regex', 'multi', 'keywords', 'jsonld', 'microdata', 'table'
         ]
         
         for subcommand_name in expected_subcommands:
@@ -102,9 +102,24 @@ class ExtractionHandler(BaseCommand):
         elif args[0].upper() == "REGEX":
             subcommand_key = "regex"
             remaining_args = args[1:]
+        elif args[0].upper() == "MULTI":
+            subcommand_key = "multi"
+            remaining_args = args[1:]
+        elif args[0].upper() == "KEYWORDS":
+            subcommand_key = "keywords"
+            remaining_args = args[1:]
+        elif args[0].upper() == "JSONLD":
+            subcommand_key = "jsonld"
+            remaining_args = args[1:]
+        elif args[0].upper() == "MICRODATA":
+            subcommand_key = "microdata"
+            remaining_args = args[1:]
+        elif args[0].upper() == "TABLE":
+            subcommand_key = "table"
+            remaining_args = args[1:]
         else:
             available_commands = list(self.subcommands.keys())
-            raise ValueError(f"EXTRACT: Type d'extraction non reconnu '{args[0]}'. Disponibles: TEXT, TEXT CLEAN, NUMBERS, EMAILS, URLS, REGEX")
+            raise ValueError(f"EXTRACT: Type d'extraction non reconnu '{args[0]}'. Disponibles: TEXT, TEXT CLEAN, NUMBERS, EMAILS, URLS, REGEX, MULTI, KEYWORDS, JSONLD, MICRODATA, TABLE")
         
         # Vérifie que la sous-commande existe
         if subcommand_key not in self.subcommands:
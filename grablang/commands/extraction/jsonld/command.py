@@ -0,0 +1,72 @@
+"""
+Commande EXTRACT JSONLD pour extraire les blocs JSON-LD (<script type="application/ld+json">) de la page
+"""
+from typing import List, Dict, Any
+
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.structured_data import StructuredData
+
+class ExtractionJsonldCommand(BaseCommand):
+    """Commande pour extraire les données JSON-LD directement du corps de la page"""
+
+    def __init__(self):
+        self.debug_mode = False
+
+    def set_debug_mode(self, debug_mode: bool):
+        """Active ou désactive le mode debug"""
+        self.debug_mode = debug_mode
+
+    def _debug_print(self, message: str):
+        """Affiche un message seulement en mode debug avec couleur"""
+        if self.debug_mode:
+            colored_prefix = CommandColors.colorize_prefix("EXTRACT JSONLD", "EXTRACT")
+            print(f"{colored_prefix} {message}")
+
+    def _clean_quotes(self, text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
+            return text[1:-1]
+        return text
+
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> List[Any]:
+        """
+        Exécute EXTRACT JSONLD ["Type"]
+
+        Args:
+            args: [type_optionnel] - Ne garde que les objets de ce @type (ex: "Product")
+            variables: Variables disponibles
+
+        Returns:
+            List des objets JSON-LD (dict) de la page, dans l'ordre des blocs;
+            les tableaux et les @graph sont aplatis
+
+        Exemples:
+            LOAD URL "https://shop.example.com/produit"
+            EXTRACT JSONLD "Product"
+            JSON "produit.json"
+
+        Les blocs sont trouvés dans le corps brut chargé par LOAD, sans arbre HTML
+        (fonctionne aussi après LOAD URL "..." RAW). Les blocs invalides sont ignorés.
+        """
+        if len(args) > 1:
+            raise ValueError("EXTRACT JSONLD: Trop d'arguments. Usage: EXTRACT JSONLD [\"Type\"]")
+
+        body, encoding = StructuredData.source(variables, "EXTRACT JSONLD")
+        items, invalid = StructuredData.jsonld(body, encoding)
+        self._debug_print(f"{len(items)} objet(s) JSON-LD trouvé(s)")
+        if invalid:
+            self._debug_print(f"  {invalid} bloc(s) JSON-LD invalide(s) ignoré(s)")
+
+        if args:
+            wanted = self._clean_quotes(args[0])
+            items = [item for item in items if StructuredData.has_type(item, wanted)]
+            self._debug_print(f"{len(items)} objet(s) de type '{wanted}'")
+
+        # Si debug activé, affiche un aperçu des types trouvés
+        if self.debug_mode and items:
+            types = [str(item.get('@type', '?')) if isinstance(item, dict) else type(item).__name__ for item in items[:5]]
+            self._debug_print(f"  Types: {', '.join(types)}")
+
+        return items
@@ -0,0 +1,111 @@
+"""
+Commande EXTRACT KEYWORDS FROM pour rechercher un dictionnaire de mots-clés dans le texte
+"""
+from bs4 import BeautifulSoup, Tag
+from typing import List, Dict, Any
+
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import is_element_list
+from grablang.utils.keyword_automaton import KeywordAutomaton
+from grablang.utils.text_normalizer import TextNormalizer
+
+class ExtractionKeywordsCommand(BaseCommand):
+    """Commande pour trouver les mots-clés d'un fichier (marques, modèles...) dans le texte des éléments"""
+
+    def __init__(self):
+        self.debug_mode = False
+
+    def set_debug_mode(self, debug_mode: bool):
+        """Active ou désactive le mode debug"""
+        self.debug_mode = debug_mode
+
+    def _debug_print(self, message: str):
+        """Affiche un message seulement en mode debug avec couleur"""
+        if self.debug_mode:
+            colored_prefix = CommandColors.colorize_prefix("EXTRACT KEYWORDS", "EXTRACT")
+            print(f"{colored_prefix} {message}")
+
+    def _clean_quotes(self, text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
+            return text[1:-1]
+        return text
+
+    def _texts_to_scan(self, last_result: Any) -> List[str]:
+        """Textes parcourus, un par élément, nettoyés comme EXTRACT TEXT CLEAN"""
+        if isinstance(last_result, str):
+            return [TextNormalizer.collapse((last_result,))]
+        if is_element_list(last_result):
+            return TextNormalizer.normalize_all(last_result)
+        if isinstance(last_result, BeautifulSoup):
+            # Si c'est une page complète, on prend le body ou html
+            return TextNormalizer.normalize_all([last_result.body if last_result.body else last_result])
+        if isinstance(last_result, Tag):
+            return TextNormalizer.normalize_all([last_result])
+        if isinstance(last_result, list):
+            # Liste issue d'une extraction précédente (EXTRACT TEXT, GET TEXT...)
+            return [TextNormalizer.collapse((str(item),)) for item in last_result]
+        raise ValueError(f"EXTRACT KEYWORDS: Type de données non supporté: {type(last_result).__name__}. Supporté: str, Tag, ResultSet, BeautifulSoup, list")
+
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Exécute EXTRACT KEYWORDS FROM "fichier"
+
+        Args:
+            args: ["FROM", fichier] - Fichier texte UTF-8, un mot-clé par ligne (# pour les commentaires)
+            variables: Variables disponibles
+
+        Returns:
+            Une entrée par mot-clé trouvé, dans l'ordre de première apparition:
+            {"keyword": mot-clé, "count": nombre d'occurrences,
+             "offsets": [[index de l'élément, position dans son texte], ...]}
+            Les positions se rapportent au texte nettoyé (celui de EXTRACT TEXT CLEAN).
+
+        Exemples:
+            SELECT ALL ".product-title"
+            EXTRACT KEYWORDS FROM "brands.txt"
+            SAVE brands
+
+        La recherche est insensible à la casse et ne retient que les mots entiers.
+        L'automate est construit une fois par contenu de fichier et mis en cache sur disque.
+        """
+        if len(args) != 2 or args[0].upper() != "FROM":
+            raise ValueError("EXTRACT KEYWORDS: Usage: EXTRACT KEYWORDS FROM \"fichier.txt\"")
+
+        filename = self._clean_quotes(args[1])
+        automaton = KeywordAutomaton.load(filename, "EXTRACT KEYWORDS")
+        self._debug_print(f"{len(automaton.keywords)} mot(s)-clé(s) chargé(s) depuis '{filename}'")
+
+        last_result = variables.get('_last_result')
+        if last_result is None:
+            raise ValueError("EXTRACT KEYWORDS: Aucun élément à traiter")
+
+        texts = self._texts_to_scan(last_result)
+        self._debug_print(f"Recherche dans {len(texts)} texte(s)")
+
+        # Indice du mot-clé -> entrée du résultat (ordre d'insertion = première apparition)
+        found: Dict[int, Dict[str, Any]] = {}
+        for element_index, text in enumerate(texts):
+            # find() produit les correspondances par position de fin: tri par début pour chaque texte
+            for start, keyword_index in sorted(automaton.find(text)):
+                entry = found.get(keyword_index)
+                if entry is None:
+                    entry = found[keyword_index] = {
+                        "keyword": automaton.keywords[keyword_index], "count": 0, "offsets": []
+                    }
+                entry["count"] += 1
+                entry["offsets"].append([element_index, start])
+
+        results = list(found.values())
+        self._debug_print(f"{len(results)} mot(s)-clé(s) différent(s) trouvé(s)")
+
+        # Si debug activé, affiche un aperçu
+        if self.debug_mode and results:
+            for entry in results[:5]:
+                self._debug_print(f"  {entry['keyword']}: {entry['count']} occurrence(s)")
+            if len(results) > 5:
+                self._debug_print(f"  ... et {len(results) - 5} autre(s)")
+
+        return results
@@ -0,0 +1,71 @@
+"""
+Commande EXTRACT MICRODATA pour extraire les items microdata (itemscope, itemprop) de la page
+"""
+from typing import List, Dict, Any
+
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.structured_data import StructuredData
+
+class ExtractionMicrodataCommand(BaseCommand):
+    """Commande pour extraire les items microdata directement du corps de la page"""
+
+    def __init__(self):
+        self.debug_mode = False
+
+    def set_debug_mode(self, debug_mode: bool):
+        """Active ou désactive le mode debug"""
+        self.debug_mode = debug_mode
+
+    def _debug_print(self, message: str):
+        """Affiche un message seulement en mode debug avec couleur"""
+        if self.debug_mode:
+            colored_prefix = CommandColors.colorize_prefix("EXTRACT MICRODATA", "EXTRACT")
+            print(f"{colored_prefix} {message}")
+
+    def _clean_quotes(self, text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
+            return text[1:-1]
+        return text
+
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Exécute EXTRACT MICRODATA ["Type"]
+
+        Args:
+            args: [type_optionnel] - Ne garde que les items de ce type (ex: "Product" ou l'URL schema.org)
+            variables: Variables disponibles
+
+        Returns:
+            List des items de premier niveau, au format JSON microdata:
+            {"type": [...], "id": ..., "properties": {nom: [valeurs ou items imbriqués]}}
+
+        Exemples:
+            LOAD URL "https://shop.example.com/produit"
+            EXTRACT MICRODATA "Product"
+            SAVE produits
+        """
+        if len(args) > 1:
+            raise ValueError("EXTRACT MICRODATA: Trop d'arguments. Usage: EXTRACT MICRODATA [\"Type\"]")
+
+        body, encoding = StructuredData.source(variables, "EXTRACT MICRODATA")
+        items = StructuredData.microdata(body, encoding)
+        self._debug_print(f"{len(items)} item(s) microdata trouvé(s)")
+
+        if args:
+            wanted = self._clean_quotes(args[0])
+            items = [item for item in items
+                     if StructuredData.has_type({'@type': item.get('type', [])}, wanted)
+                     or wanted in item.get('type', [])]
+            self._debug_print(f"{len(items)} item(s) de type '{wanted}'")
+
+        # Si debug activé, affiche un aperçu des propriétés
+        if self.debug_mode and items:
+            for item in items[:3]:
+                self._debug_print(f"  {', '.join(item.get('type', ['?']))}: {', '.join(item['properties'])}")
+            if len(items) > 3:
+                self._debug_print(f"  ... et {len(items) - 3} autre(s)")
+
+        return items
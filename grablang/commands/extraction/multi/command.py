@@ -0,0 +1,193 @@
+"""
+Commande EXTRACT MULTI pour lancer plusieurs extractions en un seul parcours du texte
+"""
+from bs4 import Tag
+from typing import List, Dict, Any, Optional, Pattern
+import re
+
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import is_element_list
+from grablang.utils.regex_cache import Patterns, RegexCache
+from grablang.utils.text_cache import TextCache
+
+# Références arrière (\1, (?P=nom)): elles ne survivent pas à l'insertion dans une alternance
+BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+class ExtractionMultiCommand(BaseCommand):
+    """Commande pour extraire emails, URLs, nombres et regex en une seule alternance"""
+
+    # Extracteurs intégrés: mot-clé -> motif précompilé
+    BUILTIN_PATTERNS = {
+        "EMAILS": Patterns.EMAIL,
+        "URLS": Patterns.URL,
+        "NUMBERS": Patterns.NUMBER,
+    }
+
+    def __init__(self):
+        self.debug_mode = False
+
+    def set_debug_mode(self, debug_mode: bool):
+        """Active ou désactive le mode debug"""
+        self.debug_mode = debug_mode
+
+    def _debug_print(self, message: str):
+        """Affiche un message seulement en mode debug avec couleur"""
+        if self.debug_mode:
+            colored_prefix = CommandColors.colorize_prefix("EXTRACT MULTI", "EXTRACT")
+            print(f"{colored_prefix} {message}")
+
+    def _clean_quotes(self, text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
+            return text[1:-1]
+        return text
+
+    def _parse_extractors(self, args: List[str]) -> Dict[str, str]:
+        """Parse la liste des extracteurs en correspondance nom -> motif, dans l'ordre donné"""
+        extractors = {}
+        i = 0
+        while i < len(args):
+            keyword = args[i].upper()
+
+            if keyword == "REGEX":
+                if i + 1 >= len(args):
+                    raise ValueError("EXTRACT MULTI: Pattern requis après REGEX")
+                name, pattern = "regex", self._clean_quotes(args[i + 1])
+                i += 2
+            elif keyword in self.BUILTIN_PATTERNS:
+                name, pattern = keyword.lower(), self.BUILTIN_PATTERNS[keyword].pattern
+                i += 1
+            else:
+                raise ValueError(f"EXTRACT MULTI: Extracteur '{args[i]}' non reconnu. Disponibles: EMAILS, URLS, NUMBERS, REGEX \"pattern\"")
+
+            if name in extractors:
+                raise ValueError(f"EXTRACT MULTI: L'extracteur {keyword} est demandé plusieurs fois")
+            extractors[name] = pattern
+
+        if not extractors:
+            raise ValueError("EXTRACT MULTI: Spécifiez au moins un extracteur. Exemple: EXTRACT MULTI EMAILS URLS NUMBERS")
+        return extractors
+
+    def _collect_texts(self, last_result: Any) -> List[str]:
+        """Rassemble une fois le texte de chaque élément à analyser"""
+        if isinstance(last_result, str):
+            return [last_result]
+        if is_element_list(last_result):
+            return [TextCache.text(element) for element in last_result]
+        if isinstance(last_result, Tag):
+            return [TextCache.text(last_result)]
+        if isinstance(last_result, list):
+            # Résultat d'extraction précédente: analysé comme un seul texte
+            return [' '.join(str(item) for item in last_result)]
+        raise ValueError(f"EXTRACT MULTI: Type de données non supporté: {type(last_result).__name__}. Supporté: str, Tag, liste d'éléments, list")
+
+    def _regex_value(self, match: re.Match, first_group: int, group_count: int) -> str:
+        """Valeur d'une correspondance REGEX, comme EXTRACT REGEX (groupes joints s'il y en a)"""
+        if group_count == 0:
+            return match.group(first_group - 1)
+        groups = [match.group(index) for index in range(first_group, first_group + group_count)]
+        if group_count == 1:
+            return groups[0] or ""
+        return ' '.join(str(group) for group in groups if group)
+
+    def _post_process(self, results: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Applique les nettoyages des commandes EXTRACT EMAILS, URLS et NUMBERS"""
+        if "emails" in results:
+            # Doublons supprimés sans tenir compte de la casse
+            seen = set()
+            unique_emails = []
+            for email in results["emails"]:
+                if email.lower() not in seen:
+                    seen.add(email.lower())
+                    unique_emails.append(email)
+            results["emails"] = unique_emails
+
+        if "urls" in results:
+            # Ponctuation de fin retirée, doublons supprimés
+            cleaned_urls = (Patterns.URL_TRAILING_PUNCTUATION.sub('', url) for url in results["urls"])
+            results["urls"] = list(dict.fromkeys(url for url in cleaned_urls if url))
+
+        if "numbers" in results:
+            # Séparateurs de milliers retirés
+            results["numbers"] = [number.replace(',', '') for number in results["numbers"]]
+
+        return results
+
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Exécute EXTRACT MULTI extracteur [extracteur ...]
+
+        Args:
+            args: Extracteurs parmi EMAILS, URLS, NUMBERS et REGEX "pattern"
+            variables: Variables disponibles
+
+        Returns:
+            Dict associant chaque extracteur (emails, urls, numbers, regex) à sa liste de résultats
+
+        Exemples:
+            EXTRACT MULTI EMAILS URLS NUMBERS
+            EXTRACT MULTI EMAILS REGEX "ref-[0-9]+"
+
+        Le texte de chaque élément n'est lu qu'une fois et parcouru par une seule
+        alternance de groupes nommés: un fragment de texte n'est attribué qu'à un
+        extracteur, le premier dans l'ordre donné.
+        """
+        extractors = self._parse_extractors(args)
+
+        last_result = variables.get('_last_result')
+        if last_result is None:
+            raise ValueError("EXTRACT MULTI: Aucun élément à traiter")
+
+        # Le motif REGEX est validé seul; s'il ne peut pas entrer dans l'alternance, il est parcouru à part
+        separate: Optional[Pattern] = None
+        user_groups = 0
+        if "regex" in extractors:
+            try:
+                user_pattern = RegexCache.compile(extractors["regex"])
+            except re.error as e:
+                raise ValueError(f"EXTRACT MULTI: Expression régulière invalide '{extractors['regex']}': {e}")
+            user_groups = user_pattern.groups
+            if BACKREFERENCE.search(user_pattern.pattern) or set(user_pattern.groupindex) & set(extractors):
+                separate = user_pattern
+
+        # Alternance de groupes nommés, dans l'ordre de priorité donné
+        combined = None
+        if "regex" in extractors and separate is None:
+            try:
+                combined = RegexCache.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in extractors.items()))
+            except re.error:
+                # Drapeaux globaux ou construction incompatible dans REGEX: parcours séparé
+                separate = user_pattern
+        if combined is None:
+            builtins = [f"(?P<{name}>{pattern})" for name, pattern in extractors.items() if name != "regex"]
+            if builtins:
+                combined = RegexCache.compile("|".join(builtins))
+
+        texts = self._collect_texts(last_result)
+        self._debug_print(f"Extraction {', '.join(name.upper() for name in extractors)} sur {len(texts)} texte(s)")
+
+        results: Dict[str, List[str]] = {name: [] for name in extractors}
+        regex_group = combined.groupindex.get("regex") if combined is not None else None
+
+        for text in texts:
+            if not text:
+                continue
+            if combined is not None:
+                for match in combined.finditer(text):
+                    name = match.lastgroup
+                    if name == "regex":
+                        results[name].append(self._regex_value(match, regex_group + 1, user_groups))
+                    else:
+                        results[name].append(match.group())
+            if separate is not None:
+                for match in separate.finditer(text):
+                    results["regex"].append(self._regex_value(match, 1, user_groups))
+
+        results = self._post_process(results)
+
+        for name, values in results.items():
+            self._debug_print(f"  {name}: {len(values)} résultat(s)")
+
+        return results
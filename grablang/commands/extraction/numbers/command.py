@@ -1,15 +1,20 @@
 """
 Commande EXTRACT NUMBERS pour extraire tous les nombres d'un contenu HTML ou texte
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
-from typing import List, Dict, Any, Union
-import re
+from bs4 import BeautifulSoup, Tag
+from itertools import chain
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 import sys
 from pathlib import Path
 
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.regex_cache import Patterns
+from grablang.utils.raw_body import RawBody
+from grablang.utils.numeric import NumericArray
+from grablang.utils.element_list import is_element_list
+from grablang.utils.text_stream import TextStream
 
 class ExtractionNumbersCommand(BaseCommand):
     """Commande pour extraire tous les nombres présents dans le texte des éléments HTML"""
@@ -31,87 +36,125 @@ class ExtractionNumbersCommand(BaseCommand):
         """Extrait tous les nombres d'un texte"""
         if not text:
             return []
-        
-        # Pattern pour capturer les nombres (entiers et décimaux)
-        # Supporte: 123, 123.45, -123, -123.45, 1,234.56, etc.
-        number_pattern = r'-?\d{1,3}(?:,\d{3})*(?:\.\d+)?|-?\d+(?:\.\d+)?'
-        numbers = re.findall(number_pattern, text)
-        
-        # Nettoie et valide les nombres trouvés
-        cleaned_numbers = []
+        return self._extract_numbers_from_chunks((text,))
+
+    def _extract_numbers_from_chunks(self, chunks: Iterable[str]) -> List[str]:
+        """Extrait les nombres d'un flux de fragments de texte, sans les joindre"""
+        return self._clean_numbers(self._match_chunks(chunks))
+
+    def _match_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Nombres bruts trouvés dans un flux de fragments de texte"""
+        # Pattern précompilé pour capturer les nombres (123, 123.45, -123, 1,234.56, etc.)
+        return (match.group() for match in TextStream.finditer(Patterns.NUMBER, chunks))
+
+    def _match_raw(self, variables: Dict[str, Any]) -> Iterator[str]:
+        """Nombres bruts trouvés dans le corps brut chargé par LOAD, sans arbre HTML"""
+        body = RawBody.get(variables, "EXTRACT NUMBERS RAW")
+        # Motif bytes sur une vue sans copie: seules les zones trouvées (ASCII) sont décodées
+        return (match.group().decode('ascii') for match in RawBody.NUMBER.finditer(body))
+
+    def _parse_numbers(self, numbers: Iterable[str]) -> Iterator[Tuple[str, float]]:
+        """Nettoie et valide les nombres trouvés: (texte nettoyé, valeur)"""
         for num in numbers:
             # Supprime les virgules de séparation des milliers
             cleaned_num = num.replace(',', '')
             try:
-                # Vérifie que c'est bien un nombre valide
-                float(cleaned_num)
-                cleaned_numbers.append(cleaned_num)
+                # Vérifie que c'est bien un nombre valide (la valeur est conservée pour AS)
+                value = float(cleaned_num)
             except ValueError:
                 # Ignore les faux positifs
                 continue
-        
-        return cleaned_numbers
+            yield cleaned_num, value
+
+    def _clean_numbers(self, numbers: Iterable[str]) -> List[str]:
+        """Nettoie et valide les nombres trouvés"""
+        return [cleaned_num for cleaned_num, _ in self._parse_numbers(numbers)]
+
+    def _parse_args(self, args: List[str]) -> Tuple[bool, Optional[str]]:
+        """Parse les options RAW et AS FLOAT|INT"""
+        raw = False
+        kind = None
+        i = 0
+        while i < len(args):
+            option = args[i].upper()
+            if option == "RAW":
+                raw = True
+                i += 1
+            elif option == "AS":
+                if i + 1 >= len(args) or args[i + 1].upper() not in NumericArray.KINDS:
+                    raise ValueError("EXTRACT NUMBERS: Type requis après AS. Usage: EXTRACT NUMBERS [RAW] [AS FLOAT|INT]")
+                kind = args[i + 1].upper()
+                i += 2
+            else:
+                raise ValueError(f"EXTRACT NUMBERS: Option '{args[i]}' inconnue. Options: RAW, AS FLOAT|INT")
+        return raw, kind
     
-    def execute(self, args: List[str], variables: Dict[str, Any]) -> List[str]:
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> Union[List[str], Any]:
         """
-        Exécute EXTRACT NUMBERS
+        Exécute EXTRACT NUMBERS [RAW] [AS FLOAT|INT]
         
         Args:
-            args: Arguments supplémentaires (généralement vide)
+            args: Options facultatives
+                - RAW: cherche dans le corps brut chargé par LOAD
+                - AS FLOAT|INT: retourne un tableau numérique compact au lieu de chaînes
             variables: Variables disponibles
             
         Returns:
-            List[str] contenant tous les nombres trouvés
+            List[str] contenant tous les nombres trouvés, ou avec AS un tableau
+            NumPy (float64/int64) si disponible, sinon array('d')/array('q').
+            Les INT sont tronqués à leur partie entière.
         """
-        # Récupère les éléments depuis _last_result
-        last_result = variables.get('_last_result')
-        if last_result is None:
-            raise ValueError("EXTRACT NUMBERS: Aucun élément à traiter")
-        
-        # Support des chaînes de texte directement
-        if isinstance(last_result, str):
-            self._debug_print(f"Extraction des nombres depuis une chaîne de texte")
-            numbers = self._extract_numbers_from_text(last_result)
-            self._debug_print(f"{len(numbers)} nombre(s) trouvé(s)")
-            
-            # Si debug activé, affiche un aperçu
-            if self.debug_mode and numbers:
-                preview_count = min(10, len(numbers))
-                self._debug_print(f"  Nombres: {', '.join(numbers[:preview_count])}")
-                if len(numbers) > 10:
-                    self._debug_print(f"  ... et {len(numbers) - 10} autre(s)")
+        raw, kind = self._parse_args(args)
+
+        if raw:
+            # EXTRACT NUMBERS RAW: recherche directe dans le corps brut de la réponse
+            self._debug_print("Extraction des nombres depuis le corps brut")
+            matches = self._match_raw(variables)
+        else:
+            # Récupère les éléments depuis _last_result
+            last_result = variables.get('_last_result')
+            if last_result is None:
+                raise ValueError("EXTRACT NUMBERS: Aucun élément à traiter")
             
-            return numbers
+            # Support des chaînes de texte directement
+            if isinstance(last_result, str):
+                self._debug_print(f"Extraction des nombres depuis une chaîne de texte")
+                matches = self._match_chunks((last_result,))
+            else:
+                # Support des éléments HTML
+                elements_to_process = []
+                if is_element_list(last_result):
+                    elements_to_process = list(last_result)
+                elif isinstance(last_result, Tag):
+                    elements_to_process = [last_result]
+                elif isinstance(last_result, BeautifulSoup):
+                    # Si c'est une page complète, on prend le body ou html
+                    body = last_result.body if last_result.body else last_result
+                    elements_to_process = [body]
+                else:
+                    raise ValueError(f"EXTRACT NUMBERS: Type de données non supporté: {type(last_result).__name__}. Supporté: str, Tag, ResultSet, BeautifulSoup")
+                
+                self._debug_print(f"Extraction des nombres de {len(elements_to_process)} élément(s)")
+                
+                # Fragments de texte de chaque élément parcourus en flux (pas de get_text() complet)
+                matches = chain.from_iterable(
+                    self._match_chunks(TextStream.element_chunks(element)) for element in elements_to_process
+                )
         
-        # Support des éléments HTML
-        elements_to_process = []
-        if isinstance(last_result, ResultSet):
-            elements_to_process = list(last_result)
-        elif isinstance(last_result, Tag):
-            elements_to_process = [last_result]
-        elif isinstance(last_result, BeautifulSoup):
-            # Si c'est une page complète, on prend le body ou html
-            body = last_result.body if last_result.body else last_result
-            elements_to_process = [body]
+        if kind:
+            # Valeurs converties une seule fois, directement dans le tableau
+            all_numbers = NumericArray.build((value for _, value in self._parse_numbers(matches)), kind)
         else:
-            raise ValueError(f"EXTRACT NUMBERS: Type de données non supporté: {type(last_result).__name__}. Supporté: str, Tag, ResultSet, BeautifulSoup")
-        
-        self._debug_print(f"Extraction des nombres de {len(elements_to_process)} élément(s)")
-        
-        # Extrait tous les nombres de tous les éléments
-        all_numbers = []
-        for element in elements_to_process:
-            text = element.get_text()
-            numbers = self._extract_numbers_from_text(text)
-            all_numbers.extend(numbers)
+            all_numbers = self._clean_numbers(matches)
         
-        self._debug_print(f"{len(all_numbers)} nombre(s) trouvé(s)")
+        self._debug_print(f"{len(all_numbers)} nombre(s) trouvé(s){f' (tableau {kind})' if kind else ''}")
         
         # Si debug activé, affiche un aperçu des nombres trouvés
-        if self.debug_mode and all_numbers:
+        if self.debug_mode and len(all_numbers):
             preview_count = min(10, len(all_numbers))
-            self._debug_print(f"  Nombres trouvés (premiers {preview_count}): {', '.join(all_numbers[:preview_count])}")
+            preview = ', '.join(str(number) for number in all_numbers[:preview_count])
+            self._debug_print(f"  Nombres trouvés (premiers {preview_count}): {preview}")
             if len(all_numbers) > 10:
                 self._debug_print(f"  ... et {len(all_numbers) - 10} autre(s)")
         
-        return all_numbers
\ No newline at end of file
+        return all_numbers
@@ -1,8 +1,8 @@
 """
 Commande EXTRACT REGEX pour extraire des éléments correspondant à une expression régulière
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
-from typing import List, Dict, Any, Union
+from bs4 import BeautifulSoup, Tag
+from typing import List, Dict, Any, Iterable, Pattern, Union
 import re
 import sys
 from pathlib import Path
@@ -10,6 +10,10 @@ from pathlib import Path
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.regex_cache import RegexCache
+from grablang.utils.element_list import is_element_list
+from grablang.utils.raw_body import RawBody
+from grablang.utils.text_stream import TextStream
 
 class ExtractionRegexCommand(BaseCommand):
     """Commande pour extraire du contenu en utilisant des expressions régulières personnalisées"""
@@ -27,34 +31,65 @@ class ExtractionRegexCommand(BaseCommand):
             colored_prefix = CommandColors.colorize_prefix("EXTRACT REGEX", "EXTRACT")
             print(f"{colored_prefix} {message}")
     
-    def _extract_with_regex(self, text: str, pattern: str, flags: int = 0) -> List[str]:
-        """Extrait le contenu d'un texte en utilisant une expression régulière"""
-        if not text or not pattern:
-            return []
-        
+    def _compile(self, pattern: str, flags: int = 0) -> Pattern:
+        """Compile le motif (une seule fois par (pattern, flags) pour tout le processus)"""
         try:
-            # Compile le pattern avec les flags
-            compiled_pattern = re.compile(pattern, flags)
-            matches = compiled_pattern.findall(text)
-            
-            # Si le pattern contient des groupes de capture, on les traite
-            if matches and isinstance(matches[0], tuple):
-                # Si c'est des tuples (groupes multiples), on les convertit en strings
-                result = []
-                for match in matches:
-                    if len(match) == 1:
-                        result.append(match[0])
-                    else:
-                        # Joint les groupes avec un espace ou retourne le tuple formaté
-                        result.append(' '.join(str(group) for group in match if group))
-                return result
-            else:
-                # Retourne directement les matches si pas de groupes
-                return [str(match) for match in matches]
-                
+            return RegexCache.compile(pattern, flags)
         except re.error as e:
             raise ValueError(f"EXTRACT REGEX: Expression régulière invalide '{pattern}': {e}")
+
+    def _match_value(self, match: re.Match, group_count: int) -> str:
+        """Valeur d'une correspondance, comme findall (groupes multiples joints par un espace)"""
+        if group_count == 0:
+            return match.group()
+        if group_count == 1:
+            return match.group(1) or ""
+        return ' '.join(str(group) for group in match.groups() if group)
+
+    def _extract_with_regex(self, chunks: Iterable[str], compiled_pattern: Pattern) -> List[str]:
+        """Extrait les correspondances d'un flux de fragments de texte, sans les joindre"""
+        if not compiled_pattern.pattern:
+            return []
+        group_count = compiled_pattern.groups
+        return [self._match_value(match, group_count)
+                for match in TextStream.finditer(compiled_pattern, chunks)]
     
+    def _extract_raw(self, args: List[str], variables: Dict[str, Any]) -> List[str]:
+        """
+        EXTRACT REGEX RAW <pattern> [flags]: motif bytes sur le corps brut chargé par LOAD
+
+        Aucun arbre HTML n'est nécessaire; seules les zones trouvées sont décodées.
+        """
+        if not args:
+            raise ValueError("EXTRACT REGEX RAW: Pattern requis. Usage: EXTRACT REGEX RAW <pattern> [flags]")
+
+        pattern = self._clean_quotes(args[0])
+        flags = self._parse_flags(args[1]) if len(args) > 1 else 0
+        body = RawBody.get(variables, "EXTRACT REGEX RAW")
+        encoding = RawBody.encoding(variables)
+
+        try:
+            compiled_pattern = RawBody.compile(pattern, flags)
+        except re.error as e:
+            raise ValueError(f"EXTRACT REGEX RAW: Expression régulière invalide '{pattern}': {e}")
+        if not pattern:
+            return []
+
+        group_count = compiled_pattern.groups
+        matches = []
+        for match in compiled_pattern.finditer(body):
+            if group_count == 0:
+                matches.append(RawBody.decode(match.group(), encoding))
+                continue
+            groups = [RawBody.decode(group, encoding) if group is not None else None for group in match.groups()]
+            if group_count == 1:
+                matches.append(groups[0] or "")
+            else:
+                matches.append(' '.join(group for group in groups if group))
+
+        self._debug_print(f"{len(matches)} correspondance(s) trouvée(s) dans le corps brut")
+        return matches
+
     def _parse_flags(self, flag_string: str) -> int:
         """Parse les flags regex depuis une string"""
         flags = 0
@@ -98,9 +133,14 @@ class ExtractionRegexCommand(BaseCommand):
             EXTRACT REGEX "email:\s*(\S+@\S+)" i -> Extrait les emails après "email:" (insensible à la casse)
             EXTRACT REGEX "\b\w+@\w+\.\w+\b" -> Extrait toutes les adresses email
             EXTRACT REGEX "(\d{1,2})/(\d{1,2})/(\d{4})" -> Extrait les dates au format MM/DD/YYYY
+            EXTRACT REGEX RAW "UA-\d+-\d+" -> Cherche dans le HTML brut chargé par LOAD, sans parsing
         """
         if not args:
             raise ValueError("EXTRACT REGEX: Pattern requis. Usage: EXTRACT REGEX <pattern> [flags]")
+
+        # EXTRACT REGEX RAW "pattern": recherche directe dans le corps brut de la réponse
+        if args[0].upper() == "RAW":
+            return self._extract_raw(args[1:], variables)
         
         pattern = self._clean_quotes(args[0])  # Nettoie les guillemets du pattern
         flags = 0
@@ -114,11 +154,13 @@ class ExtractionRegexCommand(BaseCommand):
         last_result = variables.get('_last_result')
         if last_result is None:
             raise ValueError("EXTRACT REGEX: Aucun élément à traiter")
+
+        compiled_pattern = self._compile(pattern, flags)
         
         # Support des chaînes de texte directement
         if isinstance(last_result, str):
             self._debug_print(f"Extraction avec regex '{pattern}' sur une chaîne de texte")
-            matches = self._extract_with_regex(last_result, pattern, flags)
+            matches = self._extract_with_regex((last_result,), compiled_pattern)
             self._debug_print(f"{len(matches)} correspondance(s) trouvée(s)")
             
             # Si debug activé, affiche un aperçu
@@ -132,7 +174,7 @@ class ExtractionRegexCommand(BaseCommand):
         
         # Support des éléments HTML
         elements_to_process = []
-        if isinstance(last_result, ResultSet):
+        if is_element_list(last_result):
             elements_to_process = list(last_result)
         elif isinstance(last_result, Tag):
             elements_to_process = [last_result]
@@ -141,10 +183,9 @@ class ExtractionRegexCommand(BaseCommand):
             body = last_result.body if last_result.body else last_result
             elements_to_process = [body]
         elif isinstance(last_result, list):
-            # Si c'est déjà une liste (résultat d'extraction précédente), on peut la traiter
-            # mais on doit la convertir en texte pour la regex
-            text_content = ' '.join(str(item) for item in last_result)
-            matches = self._extract_with_regex(text_content, pattern, flags)
+            # Si c'est déjà une liste (résultat d'extraction précédente), ses éléments
+            # sont parcourus en flux, séparés par un espace, sans construire le texte joint
+            matches = self._extract_with_regex(TextStream.item_chunks(last_result), compiled_pattern)
             self._debug_print(f"Extraction sur liste précédente: {len(matches)} correspondance(s) trouvée(s)")
             return matches
         else:
@@ -163,8 +204,8 @@ class ExtractionRegexCommand(BaseCommand):
         # Extrait toutes les correspondances de tous les éléments
         all_matches = []
         for element in elements_to_process:
-            text = element.get_text()
-            matches = self._extract_with_regex(text, pattern, flags)
+            # Fragments de texte de l'élément parcourus en flux (pas de get_text() complet)
+            matches = self._extract_with_regex(TextStream.element_chunks(element), compiled_pattern)
             all_matches.extend(matches)
         
         self._debug_print(f"{len(all_matches)} correspondance(s) trouvée(s)")
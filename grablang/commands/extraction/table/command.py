@@ -0,0 +1,109 @@
+"""
+Commande EXTRACT TABLE pour convertir un tableau HTML en colonnes
+"""
+from bs4 import BeautifulSoup, Tag
+from typing import List, Dict, Any, Tuple
+
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import is_element_list
+from grablang.utils.records import ColumnTable
+from grablang.utils.table_reader import TableReader
+
+class ExtractionTableCommand(BaseCommand):
+    """Commande pour lire un <table> en un seul parcours et le retourner en colonnes"""
+
+    def __init__(self):
+        self.debug_mode = False
+
+    def set_debug_mode(self, debug_mode: bool):
+        """Active ou désactive le mode debug"""
+        self.debug_mode = debug_mode
+
+    def _debug_print(self, message: str):
+        """Affiche un message seulement en mode debug avec couleur"""
+        if self.debug_mode:
+            colored_prefix = CommandColors.colorize_prefix("EXTRACT TABLE", "EXTRACT")
+            print(f"{colored_prefix} {message}")
+
+    def _parse_args(self, args: List[str]) -> Tuple[int, bool]:
+        """Parse les options ONCE n et TYPED"""
+        position = 1
+        typed = False
+        i = 0
+        while i < len(args):
+            option = args[i].upper()
+            if option == "ONCE":
+                if i + 1 >= len(args):
+                    raise ValueError("EXTRACT TABLE: Numéro requis après ONCE. Usage: EXTRACT TABLE [ONCE n] [TYPED]")
+                try:
+                    position = int(args[i + 1])
+                except ValueError:
+                    raise ValueError(f"EXTRACT TABLE: Le numéro doit être un entier, reçu '{args[i + 1]}'")
+                if position < 1:
+                    raise ValueError(f"EXTRACT TABLE: Le numéro doit être supérieur ou égal à 1, reçu {position}")
+                i += 2
+            elif option == "TYPED":
+                typed = True
+                i += 1
+            else:
+                raise ValueError(f"EXTRACT TABLE: Option '{args[i]}' inconnue. Options: ONCE n, TYPED")
+        return position, typed
+
+    def _tables(self, variables: Dict[str, Any]) -> List[Tag]:
+        """Tableaux candidats: éléments <table> du résultat précédent (ou qu'il contient), sinon ceux de la page"""
+        last_result = variables.get('_last_result')
+
+        if isinstance(last_result, Tag) and not isinstance(last_result, BeautifulSoup):
+            elements = [last_result]
+        elif is_element_list(last_result):
+            elements = list(last_result)
+        else:
+            document = last_result if isinstance(last_result, BeautifulSoup) else variables.get('_original_html')
+            if document is None:
+                raise ValueError("EXTRACT TABLE: Aucun élément à traiter")
+            return document.find_all('table')
+
+        tables = []
+        for element in elements:
+            if not isinstance(element, Tag):
+                continue
+            if element.name == 'table':
+                tables.append(element)
+            else:
+                tables.extend(element.find_all('table'))
+        return tables
+
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> ColumnTable:
+        """
+        Exécute EXTRACT TABLE [ONCE n] [TYPED]
+
+        Args:
+            args: Options facultatives
+                - ONCE n: n-ième tableau (1 par défaut)
+                - TYPED: colonnes numériques converties en int/float
+            variables: Variables disponibles
+
+        Returns:
+            ColumnTable: noms de colonnes et une liste de valeurs par colonne.
+            Les cellules fusionnées (rowspan/colspan) sont recopiées dans chaque
+            case couverte; les en-têtes viennent de <thead>, sinon des premières
+            lignes de <th>. Les cellules vides valent None.
+
+        Exemples:
+            EXTRACT TABLE                 -> Premier tableau de la page
+            SELECT ALL "table"
+            EXTRACT TABLE ONCE 2 TYPED    -> Deuxième tableau, colonnes typées
+            JSON prix "prix.json" COLUMNS
+        """
+        position, typed = self._parse_args(args)
+
+        tables = self._tables(variables)
+        if len(tables) < position:
+            raise ValueError(f"EXTRACT TABLE: Tableau n°{position} introuvable ({len(tables)} tableau(x) trouvé(s))")
+
+        table = TableReader.read(tables[position - 1], typed)
+        self._debug_print(f"Tableau n°{position}: {len(table)} ligne(s), colonnes: {', '.join(table.names)}")
+
+        return table
@@ -1,7 +1,7 @@
 """
 Commande EXTRACT TEXT pour extraire le contenu textuel des éléments HTML
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
+from bs4 import BeautifulSoup, Tag
 from typing import List, Dict, Any, Union
 import sys
 from pathlib import Path
@@ -9,6 +9,8 @@ from pathlib import Path
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import is_element_list
+from grablang.utils.text_cache import TextCache
 
 class ExtractionTextCommand(BaseCommand):
     """Commande pour extraire le contenu textuel des éléments HTML"""
@@ -28,7 +30,7 @@ class ExtractionTextCommand(BaseCommand):
     
     def _extract_text_from_element(self, element: Tag) -> str:
         """Extrait le texte d'un élément HTML"""
-        return element.get_text(strip=True)
+        return TextCache.text(element, strip=True)
     
     def execute(self, args: List[str], variables: Dict[str, Any]) -> Union[str, List[str]]:
         """
@@ -47,7 +49,7 @@ class ExtractionTextCommand(BaseCommand):
             raise ValueError("EXTRACT TEXT: Aucun élément à traiter")
         
         elements_to_process = []
-        if isinstance(last_result, ResultSet):
+        if is_element_list(last_result):
             elements_to_process = list(last_result)
         elif isinstance(last_result, Tag):
             elements_to_process = [last_result]
@@ -1,15 +1,16 @@
 """
 Commande EXTRACT TEXT CLEAN pour extraire le contenu textuel nettoyé des éléments HTML
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
-from typing import List, Dict, Any, Union
-import re
+from bs4 import BeautifulSoup, Tag
+from typing import List, Dict, Any, Tuple, Union
 import sys
 from pathlib import Path
 
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import is_element_list
+from grablang.utils.text_normalizer import TextNormalizer
 
 class ExtractionTextcleanCommand(BaseCommand):
     """Commande pour extraire le contenu textuel nettoyé des éléments HTML"""
@@ -27,41 +28,48 @@ class ExtractionTextcleanCommand(BaseCommand):
             colored_prefix = CommandColors.colorize_prefix("EXTRACT TEXT CLEAN", "EXTRACT")
             print(f"{colored_prefix} {message}")
     
-    def _clean_text(self, text: str) -> str:
+    def _clean_text(self, text: str, nfkc: bool = False, strip_invisible: bool = False) -> str:
         """Nettoie le texte en supprimant les espaces multiples, tabulations, etc."""
         if not text:
             return ""
-        
-        # Supprime les caractères de contrôle et normalise les espaces
-        text = re.sub(r'\s+', ' ', text)  # Remplace tous les espaces multiples par un seul
-        text = re.sub(r'[\t\n\r\f\v]', ' ', text)  # Remplace les caractères de saut par des espaces
-        text = text.strip()  # Supprime les espaces en début et fin
-        
-        return text
+        return TextNormalizer.normalize_chunks((text,), nfkc, strip_invisible)
     
-    def _extract_clean_text_from_element(self, element: Tag) -> str:
-        """Extrait et nettoie le texte d'un élément HTML"""
-        raw_text = element.get_text()
-        return self._clean_text(raw_text)
+    def _parse_options(self, args: List[str]) -> Tuple[bool, bool]:
+        """Parse les options NFKC et INVISIBLE"""
+        nfkc = False
+        strip_invisible = False
+        for arg in args:
+            option = arg.upper()
+            if option == "NFKC":
+                nfkc = True
+            elif option == "INVISIBLE":
+                strip_invisible = True
+            else:
+                raise ValueError(f"EXTRACT TEXT CLEAN: Option '{arg}' inconnue. Options: NFKC, INVISIBLE")
+        return nfkc, strip_invisible
     
     def execute(self, args: List[str], variables: Dict[str, Any]) -> Union[str, List[str]]:
         """
-        Exécute EXTRACT TEXT CLEAN
+        Exécute EXTRACT TEXT CLEAN [NFKC] [INVISIBLE]
         
         Args:
-            args: Arguments supplémentaires (généralement vide)
+            args: Options facultatives
+                - NFKC: normalisation Unicode NFKC (ligatures, espaces insécables, exposants...)
+                - INVISIBLE: supprime les caractères de contrôle et de largeur nulle
             variables: Variables disponibles
             
         Returns:
             String si un seul élément, List[str] si plusieurs éléments
         """
+        nfkc, strip_invisible = self._parse_options(args)
+        
         # Récupère les éléments depuis _last_result
         last_result = variables.get('_last_result')
         if last_result is None:
             raise ValueError("EXTRACT TEXT CLEAN: Aucun élément à traiter")
         
         elements_to_process = []
-        if isinstance(last_result, ResultSet):
+        if is_element_list(last_result):
             elements_to_process = list(last_result)
         elif isinstance(last_result, Tag):
             elements_to_process = [last_result]
@@ -74,12 +82,10 @@ class ExtractionTextcleanCommand(BaseCommand):
         
         self._debug_print(f"Extraction et nettoyage du texte de {len(elements_to_process)} élément(s)")
         
-        # Extrait et nettoie le texte de chaque élément
-        extracted_texts = []
-        for element in elements_to_process:
-            clean_text = self._extract_clean_text_from_element(element)
-            if clean_text:  # Ne garde que les textes non vides après nettoyage
-                extracted_texts.append(clean_text)
+        # Nettoie tout l'ensemble en un lot, en un seul passage sur les fragments de texte
+        clean_texts = TextNormalizer.normalize_all(elements_to_process, nfkc, strip_invisible)
+        # Ne garde que les textes non vides après nettoyage
+        extracted_texts = [clean_text for clean_text in clean_texts if clean_text]
         
         self._debug_print(f"{len(extracted_texts)} texte(s) nettoyé(s) extrait(s)")
         
@@ -1,15 +1,20 @@
 """
 Commande EXTRACT URLS pour extraire toutes les URLs d'un contenu HTML ou texte
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
-from typing import List, Dict, Any, Union
-import re
+from bs4 import BeautifulSoup, Tag
+from typing import List, Dict, Any, Iterable, Union
 import sys
 from pathlib import Path
 
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.regex_cache import Patterns
+from grablang.utils.raw_body import RawBody
+from grablang.utils.element_list import is_element_list
+from grablang.utils.link_collector import LinkCollector
+from grablang.utils.selection import SelectionEngine
+from grablang.utils.text_stream import TextStream
 
 class ExtractionUrlsCommand(BaseCommand):
     """Commande pour extraire toutes les URLs présentes dans le texte et les attributs des éléments HTML"""
@@ -27,100 +32,72 @@ class ExtractionUrlsCommand(BaseCommand):
             colored_prefix = CommandColors.colorize_prefix("EXTRACT URLS", "EXTRACT")
             print(f"{colored_prefix} {message}")
     
-    def _extract_urls_from_text(self, text: str) -> List[str]:
-        """Extrait toutes les URLs d'un texte"""
-        if not text:
-            return []
-        
-        # Pattern pour capturer les URLs dans le texte
-        # Supporte http://, https://, ftp://, et www.
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+|ftp://[^\s<>"{}|\\^`\[\]]+|www\.[^\s<>"{}|\\^`\[\]]+\.[a-zA-Z]{2,}'
-        urls = re.findall(url_pattern, text)
-        
-        # Nettoie les URLs (supprime la ponctuation de fin)
+    def _extract_urls_from_chunks(self, chunks: Iterable[str]) -> List[str]:
+        """Extrait les URLs d'un flux de fragments de texte, sans les joindre"""
+        # Pattern précompilé pour capturer les URLs dans le texte (http://, https://, ftp://, www.)
+        urls = (match.group() for match in TextStream.finditer(Patterns.URL, chunks))
+        return self._clean_urls(urls)
+
+    def _extract_urls_raw(self, variables: Dict[str, Any]) -> List[str]:
+        """Extrait les URLs du corps brut chargé par LOAD (texte et attributs), sans arbre HTML"""
+        body = RawBody.get(variables, "EXTRACT URLS RAW")
+        encoding = RawBody.encoding(variables)
+        # Motif bytes sur une vue sans copie: seules les zones trouvées sont décodées
+        urls = (RawBody.decode(match.group(), encoding) for match in RawBody.URL.finditer(body))
+        return list(dict.fromkeys(self._clean_urls(urls)))
+
+    def _clean_urls(self, urls: Iterable[str]) -> List[str]:
+        """Nettoie les URLs (supprime la ponctuation de fin)"""
         cleaned_urls = []
         for url in urls:
             # Supprime la ponctuation de fin courante
-            url = re.sub(r'[.,;:!?)\]}]+$', '', url)
+            url = Patterns.URL_TRAILING_PUNCTUATION.sub('', url)
             if url:
                 cleaned_urls.append(url)
         
         return cleaned_urls
     
-    def _extract_urls_from_attributes(self, element: Tag) -> List[str]:
-        """Extrait les URLs des attributs HTML (href, src, action, etc.)"""
-        urls = []
-        
-        # Attributs couramment utilisés pour les URLs
-        url_attributes = ['href', 'src', 'action', 'data-url', 'data-link', 'data-href', 'cite', 'formaction']
-        
-        # Cherche dans l'élément lui-même
-        for attr in url_attributes:
-            if element.has_attr(attr):
-                url = element[attr]
-                if isinstance(url, str) and url.strip():
-                    # Filtre les URLs valides (ignore javascript:, mailto:, #, etc.)
-                    if self._is_valid_url(url):
-                        urls.append(url.strip())
-        
-        # Cherche dans tous les sous-éléments
-        for sub_element in element.find_all(True):
-            for attr in url_attributes:
-                if sub_element.has_attr(attr):
-                    url = sub_element[attr]
-                    if isinstance(url, str) and url.strip():
-                        if self._is_valid_url(url):
-                            urls.append(url.strip())
-        
-        return urls
-    
-    def _is_valid_url(self, url: str) -> bool:
-        """Vérifie si une URL est valide (pas javascript:, mailto:, etc.)"""
-        url = url.lower().strip()
-        
-        # Ignore les URLs non-web
-        invalid_schemes = ['javascript:', 'mailto:', 'tel:', 'sms:', 'data:']
-        for scheme in invalid_schemes:
-            if url.startswith(scheme):
-                return False
-        
-        # Ignore les ancres simples
-        if url.startswith('#'):
-            return False
-        
-        # Accepte les URLs qui commencent par http/https/ftp/www ou sont relatives
-        valid_patterns = [
-            r'^https?://',
-            r'^ftp://',
-            r'^www\.',
-            r'^/',  # URLs relatives absolues
-            r'^[a-zA-Z0-9]',  # URLs relatives
-        ]
-        
-        for pattern in valid_patterns:
-            if re.match(pattern, url):
-                return True
-        
-        return False
+    def _resolve_base(self, elements: List[Tag], variables: Dict[str, Any]) -> str:
+        """URL de base pour ABSOLUTE: <base href> du document, sinon l'URL chargée par LOAD"""
+        document = SelectionEngine.document_of(elements)
+        page_url = variables.get('_base_url') if document is variables.get('_original_html') else None
+        base = LinkCollector.base_url(document, page_url)
+        if not base:
+            raise ValueError("EXTRACT URLS: ABSOLUTE nécessite une URL de base (page chargée par LOAD URL ou balise <base href>)")
+        return base
     
     def execute(self, args: List[str], variables: Dict[str, Any]) -> List[str]:
         """
         Exécute EXTRACT URLS
         
         Args:
-            args: Arguments supplémentaires (généralement vide)
+            args: [] ou ["RAW"] pour chercher dans le corps brut chargé par LOAD,
+                  ["ABSOLUTE"] pour résoudre les liens relatifs contre l'URL de base
             variables: Variables disponibles
             
         Returns:
             List[str] contenant toutes les URLs trouvées
         """
+        # EXTRACT URLS RAW: recherche directe dans le corps brut de la réponse
+        if args and args[0].upper() == "RAW":
+            urls = self._extract_urls_raw(variables)
+            self._debug_print(f"{len(urls)} URL(s) unique(s) trouvée(s) dans le corps brut")
+            return urls
+
+        absolute = False
+        for arg in args:
+            if arg.upper() == "ABSOLUTE":
+                absolute = True
+            else:
+                raise ValueError(f"EXTRACT URLS: Option '{arg}' inconnue. Options: RAW, ABSOLUTE")
+
         # Récupère les éléments depuis _last_result
         last_result = variables.get('_last_result')
         if last_result is None:
             raise ValueError("EXTRACT URLS: Aucun élément à traiter")
         
         elements_to_process = []
-        if isinstance(last_result, ResultSet):
+        if is_element_list(last_result):
             elements_to_process = list(last_result)
         elif isinstance(last_result, Tag):
             elements_to_process = [last_result]
@@ -133,25 +110,23 @@ class ExtractionUrlsCommand(BaseCommand):
         
         self._debug_print(f"Extraction des URLs de {len(elements_to_process)} élément(s)")
         
-        # Extrait toutes les URLs de tous les éléments
+        # Chaque sous-arbre distinct n'est parcouru qu'une fois (éléments imbriqués écartés)
+        collected = LinkCollector.collect(elements_to_process)
+        self._debug_print(f"{len(collected)} sous-arbre(s) distinct(s) parcouru(s)")
+        
         all_urls = []
-        for element in elements_to_process:
-            # Extrait depuis le texte
-            text = element.get_text()
-            text_urls = self._extract_urls_from_text(text)
-            all_urls.extend(text_urls)
-            
-            # Extrait depuis les attributs
-            attr_urls = self._extract_urls_from_attributes(element)
+        for root, attr_urls in collected:
+            # Extrait depuis le texte, puis depuis les attributs
+            all_urls.extend(self._extract_urls_from_chunks(TextStream.element_chunks(root)))
             all_urls.extend(attr_urls)
         
-        # Supprime les doublons finaux
-        unique_urls = []
-        seen = set()
-        for url in all_urls:
-            if url not in seen:
-                seen.add(url)
-                unique_urls.append(url)
+        if absolute:
+            base = self._resolve_base(elements_to_process, variables)
+            self._debug_print(f"Résolution des URLs relatives contre {base}")
+            all_urls = [LinkCollector.absolute(url, base) for url in all_urls]
+        
+        # Supprime les doublons finaux en gardant l'ordre
+        unique_urls = list(dict.fromkeys(all_urls))
         
         self._debug_print(f"{len(unique_urls)} URL(s) unique(s) trouvée(s)")
         
@@ -1,16 +1,14 @@
 """
 Commande FILTER LAST pour filtrer et retourner le dernier élément correspondant
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
+from bs4 import BeautifulSoup, Tag
 from typing import List, Dict, Any, Optional
-import sys
-from pathlib import Path
-import re
 
-# Ajoute le chemin vers le module core
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "core"))
-from base_command import BaseCommand
-from colors import CommandColors
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import is_element_list
+from grablang.utils.filter_engine import FilterEngine
 
 class FilteringLastCommand(BaseCommand):
     """Commande pour filtrer et retourner le dernier élément correspondant à une condition WHERE"""
@@ -28,47 +26,6 @@ class FilteringLastCommand(BaseCommand):
             colored_prefix = CommandColors.colorize_prefix("FILTER LAST", "FILTER")
             print(f"{colored_prefix} {message}")
     
-    def _matches_condition(self, element: Tag, condition_args: List[str]) -> bool:
-        """Vérifie si un élément correspond à une condition"""
-        if len(condition_args) < 3:
-            return False
-        
-        field = condition_args[0].lower()
-        operator = condition_args[1].upper()
-        value = condition_args[2]
-        
-        # Récupère la valeur à tester selon le champ
-        if field == "class":
-            test_value = " ".join(element.get("class", []))
-        elif field == "text":
-            test_value = element.get_text(strip=True)
-        elif field == "attr":
-            if len(condition_args) < 4:
-                return False
-            attr_name = condition_args[2]
-            operator = condition_args[3].upper()
-            value = condition_args[4] if len(condition_args) > 4 else None
-            test_value = element.get(attr_name)
-        else:
-            # Assume it's an attribute name
-            test_value = element.get(field)
-        
-        # Applique l'opérateur
-        if operator == "CONTAINS":
-            return value.lower() in str(test_value).lower() if test_value else False
-        elif operator == "MATCHES":
-            return bool(re.search(value, str(test_value))) if test_value else False
-        elif operator == "NOT" and len(condition_args) > 3 and condition_args[3].upper() == "NULL":
-            return test_value is not None
-        elif operator == "NULL":
-            return test_value is None
-        elif operator == "=":
-            return str(test_value) == value if test_value else False
-        elif operator == "!=":
-            return str(test_value) != value if test_value else True
-        
-        return False
-    
     def execute(self, args: List[str], variables: Dict[str, Any]) -> Optional[Tag]:
         """
         Exécute FILTER LAST WHERE condition
@@ -80,32 +37,29 @@ class FilteringLastCommand(BaseCommand):
         Returns:
             Tag contenant le dernier élément qui correspond à la condition, ou None
         """
-        if len(args) < 3:
+        if len(args) < 2:
             raise ValueError("FILTER LAST: Condition incomplète. Exemples: class CONTAINS \"active\", text MATCHES \"^[0-9]+$\"")
         
+        # Compile la condition une seule fois pour tous les éléments
+        predicate = FilterEngine.compile(args)
+        
         # Récupère les éléments à filtrer
         last_result = variables.get('_last_result')
         if last_result is None:
             raise ValueError("FILTER LAST: Aucun élément à filtrer")
         
-        elements_to_filter = []
-        if isinstance(last_result, ResultSet):
-            elements_to_filter = list(last_result)
+        # Parcourt directement le résultat précédent, sans copie
+        if is_element_list(last_result):
+            elements_to_filter = last_result
         elif isinstance(last_result, Tag):
-            elements_to_filter = [last_result]
+            elements_to_filter = (last_result,)
         else:
             raise ValueError("FILTER LAST: Les données à filtrer doivent être des éléments HTML")
         
         self._debug_print(f"Recherche du dernier élément correspondant parmi {len(elements_to_filter)} élément(s) avec condition: {' '.join(args)}")
         
-        # Cherche le dernier élément correspondant (parcours inverse)
-        last_match = None
-        last_index = -1
-        
-        for i, element in enumerate(elements_to_filter):
-            if self._matches_condition(element, args):
-                last_match = element
-                last_index = i
+        # Cherche le dernier élément correspondant (parcours inverse, arrêt au premier trouvé)
+        last_match, last_index = FilterEngine.find_last(elements_to_filter, predicate)
         
         if last_match is not None:
             self._debug_print(f"Dernier élément trouvé à l'index {last_index}")
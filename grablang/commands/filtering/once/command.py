@@ -1,16 +1,14 @@
 """
 Commande FILTER ONCE pour filtrer et retourner un élément spécifique par index
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
+from bs4 import BeautifulSoup, Tag
 from typing import List, Dict, Any, Optional
-import sys
-from pathlib import Path
-import re
 
-# Ajoute le chemin vers le module core
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "core"))
-from base_command import BaseCommand
-from colors import CommandColors
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import is_element_list
+from grablang.utils.filter_engine import FilterEngine
 
 class FilteringOnceCommand(BaseCommand):
     """Commande pour filtrer et retourner un élément spécifique par index parmi ceux qui correspondent à une condition WHERE"""
@@ -28,47 +26,6 @@ class FilteringOnceCommand(BaseCommand):
             colored_prefix = CommandColors.colorize_prefix("FILTER ONCE", "FILTER")
             print(f"{colored_prefix} {message}")
     
-    def _matches_condition(self, element: Tag, condition_args: List[str]) -> bool:
-        """Vérifie si un élément correspond à une condition"""
-        if len(condition_args) < 3:
-            return False
-        
-        field = condition_args[0].lower()
-        operator = condition_args[1].upper()
-        value = condition_args[2]
-        
-        # Récupère la valeur à tester selon le champ
-        if field == "class":
-            test_value = " ".join(element.get("class", []))
-        elif field == "text":
-            test_value = element.get_text(strip=True)
-        elif field == "attr":
-            if len(condition_args) < 4:
-                return False
-            attr_name = condition_args[2]
-            operator = condition_args[3].upper()
-            value = condition_args[4] if len(condition_args) > 4 else None
-            test_value = element.get(attr_name)
-        else:
-            # Assume it's an attribute name
-            test_value = element.get(field)
-        
-        # Applique l'opérateur
-        if operator == "CONTAINS":
-            return value.lower() in str(test_value).lower() if test_value else False
-        elif operator == "MATCHES":
-            return bool(re.search(value, str(test_value))) if test_value else False
-        elif operator == "NOT" and len(condition_args) > 3 and condition_args[3].upper() == "NULL":
-            return test_value is not None
-        elif operator == "NULL":
-            return test_value is None
-        elif operator == "=":
-            return str(test_value) == value if test_value else False
-        elif operator == "!=":
-            return str(test_value) != value if test_value else True
-        
-        return False
-    
     def execute(self, args: List[str], variables: Dict[str, Any]) -> Optional[Tag]:
         """
         Exécute FILTER ONCE index WHERE condition
@@ -99,47 +56,40 @@ class FilteringOnceCommand(BaseCommand):
         # Les arguments de condition commencent après WHERE
         condition_args = args[2:]
         
-        if len(condition_args) < 3:
+        if len(condition_args) < 2:
             raise ValueError("FILTER ONCE: Condition incomplète après WHERE")
         
+        # Compile la condition une seule fois pour tous les éléments
+        predicate = FilterEngine.compile(condition_args)
+        
         # Récupère les éléments à filtrer
         last_result = variables.get('_last_result')
         if last_result is None:
             raise ValueError("FILTER ONCE: Aucun élément à filtrer")
         
-        elements_to_filter = []
-        if isinstance(last_result, ResultSet):
-            elements_to_filter = list(last_result)
+        # Parcourt directement le résultat précédent, sans copie
+        if is_element_list(last_result):
+            elements_to_filter = last_result
         elif isinstance(last_result, Tag):
-            elements_to_filter = [last_result]
+            elements_to_filter = (last_result,)
         else:
             raise ValueError("FILTER ONCE: Les données à filtrer doivent être des éléments HTML")
         
         self._debug_print(f"Recherche de l'élément à l'index {target_index} parmi ceux correspondant à: {' '.join(condition_args)}")
         
-        # Collecte tous les éléments qui correspondent à la condition
-        matching_elements = []
-        for element in elements_to_filter:
-            if self._matches_condition(element, condition_args):
-                matching_elements.append(element)
+        # Parcours arrêté dès la n-ième correspondance
+        selected_element, found_count = FilterEngine.find_nth(elements_to_filter, predicate, target_index)
         
-        self._debug_print(f"{len(matching_elements)} élément(s) correspondent à la condition")
+        self._debug_print(f"{found_count} élément(s) correspondant parcouru(s)")
         
-        if len(matching_elements) == 0:
+        if found_count == 0:
             raise ValueError(f"FILTER ONCE: Aucun élément ne correspond à la condition: {' '.join(args)}")
         
-        if len(matching_elements) == 1:
-            target_index = 0
-        else:
-            target_index = target_index - 1  # Convert to 0-based
-        
-        self._debug_print(f"Élément à l'index {target_index} sélectionné")
-        
-        # Vérifie que l'index existe (conversion 1-based vers 0-based)
-        if target_index >= len(matching_elements):
-            raise ValueError(f"FILTER ONCE: Index {target_index + 1} trop élevé. Il y a seulement {len(matching_elements)} élément(s) correspondant à la condition")
+        # Une correspondance unique est retournée quel que soit l'index demandé
+        if found_count < target_index and found_count != 1:
+            raise ValueError(f"FILTER ONCE: Index {target_index} trop élevé. Il y a seulement {found_count} élément(s) correspondant à la condition")
         
-        selected_element = matching_elements[target_index]
+        self._debug_print(f"Élément sélectionné après {found_count} correspondance(s)")
         
         if self.debug_mode:
             preview = str(selected_element)[:200] + "..." if len(str(selected_element)) > 200 else str(selected_element)
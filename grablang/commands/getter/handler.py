@@ -1,109 +1,231 @@
 """
 Handler principal pour la commande GETTER
 """
-import sys
-from pathlib import Path
-from typing import List, Dict, Any
-import importlib.util
+from bs4 import Tag
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
 
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.date_scanner import DateScanner
+from grablang.utils.getter_engine import GetterEngine, Position
+from grablang.utils.records import Record, RecordList
+from grablang.utils.selection import SelectionEngine
+from grablang.utils.text_cache import TextCache
 
 class GetterHandler(BaseCommand):
-    """Handler principal pour toutes les variantes de la commande GET"""
-    
+    """
+    Handler principal pour toutes les variantes de la commande GET
+
+    GET ATTR|ATTRS|TEXT|DATE [ALL|FIRST|LAST|ONCE n|SLICE a:b] ...
+    Le modificateur de position est appliqué par GetterEngine avant toute
+    extraction: seules les positions demandées sont calculées.
+    """
+
+    SUBCOMMANDS = ("ATTR", "ATTRS", "TEXT", "DATE")
+
     def __init__(self):
-        self.subcommands = {}
         self.debug_mode = False
-        self._load_subcommands()
-    
+
     def set_debug_mode(self, debug_mode: bool):
         """Active ou désactive le mode debug"""
         self.debug_mode = debug_mode
-        # Propage aux sous-commandes si elles supportent le debug
-        for subcommand in self.subcommands.values():
-            if hasattr(subcommand, 'set_debug_mode'):
-                subcommand.set_debug_mode(debug_mode)
-    
-    def _debug_print(self, message: str):
+
+    def _debug_print(self, message: str, prefix: str = "GET"):
         """Affiche un message seulement en mode debug avec couleur"""
         if self.debug_mode:
-            colored_prefix = CommandColors.colorize_prefix("GET", "EXTRACT")
+            colored_prefix = CommandColors.colorize_prefix(prefix, "EXTRACT")
             print(f"{colored_prefix} {message}")
-    
-    def _load_subcommands(self):
-        """Charge dynamiquement toutes les sous-commandes GET disponibles"""
-        getter_dir = Path(__file__).parent
-        
-        # Parcourt tous les sous-dossiers de getter/
-        for subcommand_dir in getter_dir.iterdir():
-            if subcommand_dir.is_dir() and subcommand_dir.name != "__pycache__":
-                command_file = subcommand_dir / "command.py"
-                if command_file.exists():
-                    self._load_subcommand_module(command_file, subcommand_dir.name)
-    
-    def _load_subcommand_module(self, command_file: Path, subcommand: str):
-        """Charge un module de sous-commande spécifique"""
-        try:
-            spec = importlib.util.spec_from_file_location(f"getter_{subcommand}", command_file)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Récupère la classe de commande (convention: GetterSubcommandCommand)
-            # Gère les noms avec underscores (ex: attr_first -> AttrFirst)
-            class_suffix = "".join(word.title() for word in subcommand.split("_"))
-            class_name = f"Getter{class_suffix}Command"
-            
-            if hasattr(module, class_name):
-                command_class = getattr(module, class_name)
-                command_instance = command_class()
-                
-                # Convertit le nom en majuscules avec underscores pour la clé
-                command_key = subcommand.upper()
-                self.subcommands[command_key] = command_instance
-                
-                # Propage immédiatement le mode debug si déjà défini
-                if hasattr(command_instance, 'set_debug_mode'):
-                    command_instance.set_debug_mode(self.debug_mode)
-                
-                self._debug_print(f"Sous-commande chargée: {command_key}")
-            else:
-                self._debug_print(f"Attention: Classe {class_name} non trouvée dans {command_file}")
-                
-        except Exception as e:
-            self._debug_print(f"Erreur lors du chargement de la sous-commande {subcommand}: {e}")
-    
+
+    def _clean_quotes(self, text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
+            return text[1:-1]
+        return text
+
+    def _document(self, variables: Dict[str, Any], command: str) -> Any:
+        """Document dans lequel chercher une balise: HTML original, sinon le résultat précédent"""
+        if '_original_html' in variables:
+            return variables['_original_html']
+        if '_last_result' in variables and hasattr(variables['_last_result'], 'find'):
+            return variables['_last_result']
+        raise ValueError(f"{command}: Aucun contenu HTML disponible")
+
+    def _last_elements(self, variables: Dict[str, Any], command: str) -> Sequence[Any]:
+        """Éléments du résultat précédent (un Tag seul devient une liste d'un élément)"""
+        last_result = variables.get('_last_result')
+        if last_result is None:
+            raise ValueError(f"{command}: Aucun élément à traiter")
+        if isinstance(last_result, Tag):
+            return [last_result]
+        if isinstance(last_result, list):
+            return last_result
+        raise ValueError(f"{command}: Type de données non supporté: {type(last_result).__name__}")
+
+    def _tag_candidates(self, variables: Dict[str, Any], tag: str, command: str) -> Tuple[Iterable[Tag], Any]:
+        """Éléments tag du document en ordre document, et leur parcours à rebours (pour LAST)"""
+        document = self._document(variables, command)
+        return SelectionEngine.matches(document, tag), lambda: SelectionEngine.iter_matches_reversed(document, tag)
+
+    @staticmethod
+    def _attr_value(element: Any, name: str) -> Optional[str]:
+        """Valeur d'un attribut (None si absent; attributs multiples comme class joints)"""
+        if not isinstance(element, Tag):
+            return None
+        value = element.get(name)
+        if isinstance(value, list):
+            value = " ".join(value)
+        return value
+
+    @staticmethod
+    def _text(element: Any) -> str:
+        """Texte nettoyé d'un élément (vide s'il n'a pas de texte)"""
+        if not hasattr(element, 'get_text'):
+            return ""
+        return TextCache.text(element, strip=True)
+
+    def _get_attr(self, position: Position, args: List[str], variables: Dict[str, Any]) -> Any:
+        """GET ATTR [position] ["tag"] "attribut" """
+        if len(args) not in (1, 2):
+            raise ValueError("GET ATTR: Usage: GET ATTR [ALL|FIRST|LAST|ONCE n|SLICE a:b] [\"tag\"] \"attribut\"")
+        name = self._clean_quotes(args[-1])
+
+        if len(args) == 2:
+            tag = self._clean_quotes(args[0])
+            candidates, backward = self._tag_candidates(variables, tag, "GET ATTR")
+            what = f"élément '{tag}'"
+        else:
+            last_result = variables['_last_result']
+            candidates, backward, what = self._last_elements(variables, "GET ATTR"), None, "élément"
+            # Un élément seul sans position donne directement sa valeur
+            if isinstance(last_result, Tag) and position.kind == "ALL":
+                return self._attr_value(last_result, name)
+
+        selected = GetterEngine.pick(position, candidates, "GET ATTR", what, backward=backward)
+        if position.single:
+            value = self._attr_value(selected, name)
+            self._debug_print(f"Attribut '{name}' ({position.kind}): {value}", "GET ATTR")
+            return value
+
+        values = [value for value in (self._attr_value(element, name) for element in selected) if value is not None]
+        self._debug_print(f"{len(values)} attribut(s) '{name}' trouvé(s) sur {len(selected)} élément(s)", "GET ATTR")
+        return values
+
+    def _get_attrs(self, position: Position, args: List[str], variables: Dict[str, Any]) -> Any:
+        """GET ATTRS [position] "attr1" "attr2" ... (valeurs alignées par élément)"""
+        if not args:
+            raise ValueError("GET ATTRS: Au moins un attribut requis. Usage: GET ATTRS \"href\" \"title\" ...")
+        names = tuple(self._clean_quotes(arg) for arg in args)
+        if len(set(names)) != len(names):
+            raise ValueError(f"GET ATTRS: Attribut en double dans {', '.join(names)}")
+
+        def row(element: Any) -> Tuple[Optional[str], ...]:
+            return tuple(self._attr_value(element, name) for name in names)
+
+        last_result = variables['_last_result']
+        if isinstance(last_result, Tag) and position.kind == "ALL":
+            return Record(names, row(last_result))
+
+        selected = GetterEngine.pick(position, self._last_elements(variables, "GET ATTRS"), "GET ATTRS")
+        if position.single:
+            return Record(names, row(selected))
+
+        records = RecordList(names, [row(element) for element in selected])
+        self._debug_print(f"{len(records)} ligne(s) de {len(names)} attribut(s)", "GET ATTRS")
+        return records
+
+    def _get_text(self, position: Position, args: List[str], variables: Dict[str, Any]) -> Any:
+        """GET TEXT [position] ["tag"]"""
+        if len(args) > 1:
+            raise ValueError("GET TEXT: Usage: GET TEXT [ALL|FIRST|LAST|ONCE n|SLICE a:b] [\"tag\"]")
+
+        if args:
+            tag = self._clean_quotes(args[0])
+            candidates, backward = self._tag_candidates(variables, tag, "GET TEXT")
+            what = f"élément '{tag}'"
+        else:
+            candidates, backward, what = self._last_elements(variables, "GET TEXT"), None, "élément"
+
+        selected = GetterEngine.pick(position, candidates, "GET TEXT", what, backward=backward)
+        if position.single:
+            return self._text(selected)
+
+        # Les textes vides sont ignorés
+        texts = [text for text in map(self._text, selected) if text]
+        self._debug_print(f"{len(texts)} texte(s) extrait(s)", "GET TEXT")
+        return texts
+
+    def _get_date(self, position: Position, args: List[str], variables: Dict[str, Any]) -> Any:
+        """GET DATE [position] ["tag"]: les positions portent sur les éléments contenant une date"""
+        if len(args) > 1:
+            raise ValueError("GET DATE: Trop d'arguments. Usage: GET DATE [ALL|FIRST|LAST|ONCE n|SLICE a:b] [\"tag\"]")
+
+        if args:
+            tag = self._clean_quotes(args[0])
+            candidates, backward = self._tag_candidates(variables, tag, "GET DATE")
+            what = f"élément '{tag}' contenant une date"
+        else:
+            # Parents des nœuds texte, en un seul parcours (sans doublon, en ordre document)
+            candidates = DateScanner.text_parents(self._document(variables, "GET DATE"))
+            backward, what = None, "élément contenant une date"
+
+        def has_date(element: Any) -> bool:
+            return isinstance(element, Tag) and DateScanner.element_has_date(element)
+
+        selected = GetterEngine.pick(position, candidates, "GET DATE", what, predicate=has_date, backward=backward)
+        if position.single:
+            self._debug_print(f"Élément daté ({position.kind}): <{selected.name}>", "GET DATE")
+        else:
+            self._debug_print(f"{len(selected)} élément(s) avec des dates trouvé(s)", "GET DATE")
+        return selected
+
     def execute(self, args: List[str], variables: Dict[str, Any]) -> Any:
         """
         Exécute la commande GET avec dispatch vers la bonne sous-commande
-        
+
         Args:
-            args: [subcommand, ...] - La sous-commande et ses arguments
+            args: [subcommand, position?, ...] - La sous-commande, le modificateur de position et ses arguments
             variables: Variables disponibles
-            
+
         Returns:
-            Le résultat de la sous-commande
+            Une valeur pour FIRST, LAST et ONCE n; une liste pour ALL (défaut) et SLICE a:b
+
+        Exemples:
+            GET ATTR "href"                 -> Attributs des éléments sélectionnés
+            GET ATTR FIRST "a" "href"       -> Premier lien de la page (parcours arrêté au premier)
+            GET TEXT SLICE 2:4              -> Textes des éléments sélectionnés 2 à 4
+            GET DATE LAST "p"               -> Dernier paragraphe contenant une date
         """
         if len(args) < 1:
             raise ValueError("GET: Il faut spécifier une sous-commande (ex: GET ATTR \"href\")")
-        
-        # Pour les commandes composées comme ATTR_FIRST, l'argument vient déjà formaté
+
         subcommand = args[0].upper()
-        subcommand_args = args[1:]
-        
-        self._debug_print(f"Recherche de la sous-commande: {subcommand}")
-        self._debug_print(f"Sous-commandes disponibles: {list(self.subcommands.keys())}")
-        
-        if subcommand not in self.subcommands:
-            available = ", ".join(sorted(self.subcommands.keys()))
-            raise ValueError(f"GET: Sous-commande '{subcommand}' inconnue. Disponibles: {available}")
-        
+        rest = list(args[1:])
+
+        # Anciennes commandes composées (ATTR_FIRST, DATE_ONCE...): la position suit le nom
+        if "_" in subcommand:
+            subcommand, modifier = subcommand.split("_", 1)
+            rest.insert(0, modifier)
+
+        if subcommand not in self.SUBCOMMANDS:
+            raise ValueError(f"GET: Sous-commande '{subcommand}' inconnue. Disponibles: {', '.join(self.SUBCOMMANDS)}")
+
+        command = f"GET {subcommand}"
+        position, rest = GetterEngine.parse_position(rest, command)
+
         # Vérifie qu'il y a un résultat précédent à traiter pour les commandes qui en ont besoin
-        if subcommand in ['ATTR'] and '_last_result' not in variables:
+        # (GET ATTR "tag" "attribut" cherche dans le document)
+        needs_selection = subcommand == 'ATTRS' or (subcommand == 'ATTR' and len(rest) < 2)
+        if needs_selection and '_last_result' not in variables:
             raise ValueError("GET: Aucun élément sélectionné. Utilisez d'abord une commande SELECT.")
-        
-        self._debug_print(f"Dispatch vers {subcommand} avec {len(subcommand_args)} argument(s): {subcommand_args}")
-        
-        # Délègue à la sous-commande appropriée
-        return self.subcommands[subcommand].execute(subcommand_args, variables)
\ No newline at end of file
+
+        self._debug_print(f"Dispatch vers {command} {position.kind} avec {len(rest)} argument(s): {rest}")
+
+        if subcommand == "ATTR":
+            return self._get_attr(position, rest, variables)
+        elif subcommand == "ATTRS":
+            return self._get_attrs(position, rest, variables)
+        elif subcommand == "TEXT":
+            return self._get_text(position, rest, variables)
+        else:
+            return self._get_date(position, rest, variables)
@@ -3,13 +3,14 @@ Commande LOAD URL pour charger le contenu d'une URL
 """
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import sys
 from pathlib import Path
 
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.document_cache import DocumentCache
 
 class LoadUrlCommand(BaseCommand):
     """Commande pour charger le contenu d'une URL web"""
@@ -33,17 +34,28 @@ class LoadUrlCommand(BaseCommand):
             return text[1:-1]
         return text
 
-    def execute(self, args: List[str], variables: Dict[str, Any]) -> BeautifulSoup:
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> Optional[BeautifulSoup]:
         """
         Exécute LOAD URL "url" ou LOAD URL variable_name "url" ou LOAD URL variable_name url_variable
         
         Args:
-            args: [url] ou [variable_name, url] - L'URL à charger avec optionnellement un nom de variable
+            args: [url] ou [variable_name, url] - L'URL à charger avec optionnellement un nom de variable,
+                  suivie éventuellement de RAW
             variables: Variables disponibles
             
         Returns:
-            BeautifulSoup object contenant le HTML parsé
+            BeautifulSoup object contenant le HTML parsé (None avec RAW)
+
+        Avec LOAD URL "url" RAW, le HTML n'est pas parsé du tout: le corps brut de
+        la réponse est conservé dans _raw_body et seules les extractions RAW sont
+        possibles sur cette page. Sinon seul l'arbre est gardé (pas de seconde copie
+        de la page en mémoire): les extractions RAW lisent le document resérialisé.
         """
+        raw_only = False
+        if args and args[-1].upper() == "RAW":
+            raw_only = True
+            args = args[:-1]
+        
         if len(args) < 1 or len(args) > 2:
             raise ValueError("LOAD URL: Utilisez LOAD URL \"url\" ou LOAD URL variable_name \"url\" ou LOAD URL variable_name url_variable")
         
@@ -56,6 +68,9 @@ class LoadUrlCommand(BaseCommand):
             # Format: LOAD URL variable_name "url" ou LOAD URL variable_name url_variable
             variable_name = args[0]
             url_source = args[1]
+
+        if raw_only and variable_name:
+            raise ValueError("LOAD URL: RAW s'utilise sans nom de variable: LOAD URL \"url\" RAW")
         
         # Résout l'URL (soit depuis une chaîne, soit depuis une variable)
         url = self._resolve_url(url_source, variables)
@@ -73,6 +88,30 @@ class LoadUrlCommand(BaseCommand):
             # Effectue la requête HTTP
             response = requests.get(url, headers=headers, timeout=30)
             response.raise_for_status()
+
+            if not variable_name:
+                if raw_only:
+                    # Corps brut conservé tel quel (sans copie) pour EXTRACT ... RAW
+                    variables['_raw_body'] = response.content
+                    variables['_raw_encoding'] = self._declared_encoding(response)
+                else:
+                    # Celui d'une page précédente chargée en RAW ne correspond plus
+                    variables.pop('_raw_body', None)
+                    variables.pop('_raw_encoding', None)
+                # URL finale (après redirections) pour EXTRACT URLS ABSOLUTE
+                variables['_base_url'] = response.url
+                # L'ancien document est remplacé: son index de balises et ses textes en cache sont libérés
+                if variables.get('_original_html') is not None:
+                    DocumentCache.invalidate(variables['_original_html'])
+
+            if raw_only:
+                # Pas d'arbre HTML: l'ancien document ne doit plus être utilisé
+                variables.pop('_original_html', None)
+                variables.pop('_current_soup', None)
+                # Le résultat précédent (souvent l'ancienne page) ne doit pas servir de repli
+                variables.pop('_last_result', None)
+                self._debug_print(f" URL chargée sans parsing ({len(response.content)} octets)")
+                return None
             
             # Parse le HTML avec BeautifulSoup
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -95,6 +134,12 @@ class LoadUrlCommand(BaseCommand):
         except Exception as e:
             raise RuntimeError(f"Erreur lors du parsing HTML: {e}")
     
+    def _declared_encoding(self, response) -> Optional[str]:
+        """Encodage déclaré dans l'en-tête Content-Type (None s'il est absent)"""
+        if 'charset' in response.headers.get('content-type', '').lower():
+            return response.encoding
+        return None
+
     def _resolve_url(self, url_source: str, variables: Dict[str, Any]) -> str:
         """Résout l'URL depuis une chaîne littérale ou une variable"""
         
@@ -5,11 +5,13 @@ import sys
 from pathlib import Path
 from typing import List, Dict, Any
 import importlib.util
-from bs4 import BeautifulSoup, ResultSet, Tag
+from bs4 import BeautifulSoup, Tag
 
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import is_element_list
+from grablang.utils.text_cache import TextCache
 
 class PrintHandler(BaseCommand):
     """Handler principal pour la commande PRINT"""
@@ -33,14 +35,14 @@ class PrintHandler(BaseCommand):
             title = value.title.string if value.title else "Sans titre"
             return f"Page HTML '{variable_name}': {title}"
         
-        elif isinstance(value, ResultSet):
+        elif is_element_list(value):
             count = len(value)
             if count == 0:
                 return f"Résultat vide '{variable_name}': Aucun élément"
             elif count == 1:
                 # Si un seul élément, affiche directement son contenu
                 element = value[0]
-                text_content = element.get_text(strip=True)
+                text_content = TextCache.text(element, strip=True)
                 if text_content:
                     return text_content
                 else:
@@ -55,7 +57,7 @@ class PrintHandler(BaseCommand):
         
         elif isinstance(value, Tag):
             # Pour un élément unique, affiche directement le contenu
-            text_content = value.get_text(strip=True)
+            text_content = TextCache.text(value, strip=True)
             if text_content:
                 return text_content
             else:
@@ -70,7 +72,7 @@ class PrintHandler(BaseCommand):
                 # Si un seul élément dans la liste, affiche directement son contenu
                 item = value[0]
                 if isinstance(item, Tag):
-                    text_content = item.get_text(strip=True)
+                    text_content = TextCache.text(item, strip=True)
                     if text_content:
                         return text_content
                     else:
@@ -110,7 +112,7 @@ class PrintHandler(BaseCommand):
                 if count > 0:
                     result.append(f"     - {tag}: {count}")
         
-        elif isinstance(value, ResultSet):
+        elif is_element_list(value):
             count = len(value)
             result.append(f"   Type: Résultat de sélection")
             result.append(f"   Nombre d'éléments: {count}")
@@ -131,7 +133,8 @@ class PrintHandler(BaseCommand):
                 for i, elem in enumerate(value[:3]):
                     classes = elem.get('class', [])
                     class_str = f".{'.'.join(classes)}" if classes else ""
-                    text = elem.get_text(strip=True)[:30] + "..." if len(elem.get_text(strip=True)) > 30 else elem.get_text(strip=True)
+                    text = TextCache.text(elem, strip=True)
+                    text = text[:30] + "..." if len(text) > 30 else text
                     result.append(f"     {i+1}. <{elem.name}{class_str}> '{text}'")
         
         elif isinstance(value, Tag):
@@ -147,7 +150,7 @@ class PrintHandler(BaseCommand):
                     result.append(f"     - {attr}: {val_str}")
             
             # Contenu textuel
-            text = value.get_text(strip=True)
+            text = TextCache.text(value, strip=True)
             if text:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
                 result.append(f"   Texte: '{text_preview}'")
@@ -1,7 +1,7 @@
 """
 Commande SELECT ALL pour sélectionner tous les éléments correspondant à un sélecteur CSS
 """
-from bs4 import BeautifulSoup, ResultSet, Tag
+from bs4 import BeautifulSoup, Tag
 from typing import List, Dict, Any
 import sys
 from pathlib import Path
@@ -9,6 +9,8 @@ from pathlib import Path
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import ElementList
+from grablang.utils.selection import SelectionEngine
 
 class SelectAllCommand(BaseCommand):
     """Commande pour sélectionner tous les éléments correspondant à un tag"""
@@ -32,7 +34,7 @@ class SelectAllCommand(BaseCommand):
             return text[1:-1]
         return text
 
-    def execute(self, args: List[str], variables: Dict[str, Any]) -> ResultSet:
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> ElementList:
         """
         Exécute SELECT ALL "tag"
         
@@ -41,20 +43,25 @@ class SelectAllCommand(BaseCommand):
             variables: Variables disponibles
             
         Returns:
-            ResultSet contenant tous les éléments trouvés
+            ElementList contenant tous les éléments trouvés
         """
         self.validate_args(args, 1, "SELECT ALL")
         
         tag = self._clean_quotes(args[0])  # Nettoie les guillemets
         soup = variables['_current_soup']
+        scope = variables.get('_current_scope')
         
-        if not isinstance(soup, BeautifulSoup):
+        if scope is None and not isinstance(soup, BeautifulSoup):
             raise ValueError("SELECT ALL: Le contenu chargé n'est pas un document HTML valide")
         
+        # Recherche limitée aux sous-arbres du résultat précédent (WITHIN)
+        if scope is not None:
+            soup = scope
+        
         self._debug_print(f"Recherche de tous les éléments '{tag}'")
         
-        # Utilise find_all pour récupérer tous les éléments
-        elements = soup.find_all(tag)
+        # Parcours complet (alimente l'index de balises du document)
+        elements = SelectionEngine.select_all(soup, tag)
         
         self._debug_print(f" {len(elements)} élément(s) '{tag}' trouvé(s)")
         
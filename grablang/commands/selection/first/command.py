@@ -7,6 +7,7 @@ from typing import List, Dict, Any
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.selection import SelectionEngine
 
 class SelectFirstCommand(BaseCommand):
     """Commande pour sélectionner le premier élément correspondant à un tag"""
@@ -45,14 +46,19 @@ class SelectFirstCommand(BaseCommand):
         
         tag = self._clean_quotes(args[0])  # Nettoie les guillemets
         soup = variables['_current_soup']
+        scope = variables.get('_current_scope')
         
-        if not isinstance(soup, BeautifulSoup):
+        if scope is None and not isinstance(soup, BeautifulSoup):
             raise ValueError("SELECT FIRST: Le contenu chargé n'est pas un document HTML valide")
         
+        # Recherche limitée aux sous-arbres du résultat précédent (WITHIN)
+        if scope is not None:
+            soup = scope
+        
         self._debug_print(f"Recherche du premier élément '{tag}'")
         
-        # Utilise find pour récupérer le premier élément
-        element = soup.find(tag)
+        # Arrête le parcours au premier élément trouvé
+        element = SelectionEngine.select_first(soup, tag)
         
         if element is None:
             raise ValueError(f"SELECT FIRST: Aucun élément '{tag}' trouvé")
@@ -9,6 +9,7 @@ import importlib.util
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.selection import SelectionEngine
 
 class SelectionHandler(BaseCommand):
     """Handler principal pour toutes les variantes de la commande SELECT"""
@@ -73,7 +74,8 @@ class SelectionHandler(BaseCommand):
         Exécute la commande SELECT avec dispatch vers la bonne sous-commande
         
         Args:
-            args: [subcommand, ...] - La sous-commande et ses arguments
+            args: [subcommand, ..., WITHIN optionnel] - La sous-commande et ses arguments
+                  WITHIN limite la recherche aux sous-arbres du résultat précédent
             variables: Variables disponibles
             
         Returns:
@@ -85,6 +87,14 @@ class SelectionHandler(BaseCommand):
         subcommand = args[0].upper()
         subcommand_args = args[1:]
         
+        # Portée: tout le document, ou seulement les sous-arbres de _last_result
+        within = bool(subcommand_args) and subcommand_args[-1].upper() == "WITHIN"
+        if within:
+            subcommand_args = subcommand_args[:-1]
+            variables['_current_scope'] = self._resolve_scope(variables)
+        else:
+            variables.pop('_current_scope', None)
+        
         if subcommand not in self.subcommands:
             available = ", ".join(self.subcommands.keys())
             raise ValueError(f"SELECT: Sous-commande '{subcommand}' inconnue. Disponibles: {available}")
@@ -98,6 +108,9 @@ class SelectionHandler(BaseCommand):
         # Sinon regarde si _last_result est un BeautifulSoup
         elif '_last_result' in variables and hasattr(variables['_last_result'], 'find'):
             soup = variables['_last_result']
+        # Avec WITHIN, les sous-arbres du résultat précédent suffisent
+        elif within:
+            soup = None
         else:
             raise ValueError("SELECT: Aucun contenu HTML chargé. Utilisez d'abord LOAD URL ou une autre commande de chargement.")
         
@@ -107,4 +120,23 @@ class SelectionHandler(BaseCommand):
         self._debug_print(f"Dispatch vers {subcommand} avec {len(subcommand_args)} argument(s): {subcommand_args}")
         
         # Délègue à la sous-commande appropriée
-        return self.subcommands[subcommand].execute(subcommand_args, variables)
\ No newline at end of file
+        return self.subcommands[subcommand].execute(subcommand_args, variables)
+    
+    def _resolve_scope(self, variables: Dict[str, Any]) -> List[Any]:
+        """Construit la portée WITHIN à partir des éléments de _last_result"""
+        last_result = variables.get('_last_result')
+        
+        if hasattr(last_result, 'find_all'):
+            # Élément ou document unique
+            elements = [last_result]
+        elif isinstance(last_result, list):
+            elements = last_result
+        else:
+            elements = None
+        
+        roots = SelectionEngine.outermost_roots(elements) if elements is not None else []
+        # Liste sans aucun élément HTML (ex: textes de GET TEXT): pas de sous-arbre où chercher
+        if elements is None or (elements and not roots):
+            raise ValueError("SELECT WITHIN: Le résultat précédent doit contenir des éléments HTML (utilisez d'abord SELECT)")
+        self._debug_print(f"Portée WITHIN: {len(roots)} sous-arbre(s) sur {len(elements)} élément(s)")
+        return roots
\ No newline at end of file
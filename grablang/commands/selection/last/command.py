@@ -9,6 +9,7 @@ from pathlib import Path
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.selection import SelectionEngine
 
 class SelectLastCommand(BaseCommand):
     """Commande pour sélectionner le dernier élément correspondant à un tag"""
@@ -47,20 +48,23 @@ class SelectLastCommand(BaseCommand):
         
         tag = self._clean_quotes(args[0])  # Nettoie les guillemets
         soup = variables['_current_soup']
+        scope = variables.get('_current_scope')
         
-        if not isinstance(soup, BeautifulSoup):
+        if scope is None and not isinstance(soup, BeautifulSoup):
             raise ValueError("SELECT LAST: Le contenu chargé n'est pas un document HTML valide")
         
+        # Recherche limitée aux sous-arbres du résultat précédent (WITHIN)
+        if scope is not None:
+            soup = scope
+        
         self._debug_print(f"Recherche du dernier élément '{tag}'")
         
-        # Utilise find_all pour récupérer tous les éléments puis prend le dernier
-        elements = soup.find_all(tag)
+        # Parcourt l'arbre à rebours (ou utilise l'index de balises s'il existe)
+        last_element = SelectionEngine.select_last(soup, tag)
         
-        if not elements:
+        if last_element is None:
             raise ValueError(f"SELECT LAST: Aucun élément '{tag}' trouvé")
         
-        last_element = elements[-1]
-        
-        self._debug_print(f" Dernier élément '{tag}' trouvé (parmi {len(elements)} éléments)")
+        self._debug_print(f" Dernier élément '{tag}' trouvé")
         
         return last_element
\ No newline at end of file
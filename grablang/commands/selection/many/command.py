@@ -0,0 +1,86 @@
+"""
+Commande SELECT MANY pour sélectionner plusieurs types d'éléments en un seul parcours
+"""
+from bs4 import BeautifulSoup
+from typing import List, Dict, Any
+
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.element_list import ElementList
+from grablang.utils.selection import SelectionEngine
+
+class SelectManyCommand(BaseCommand):
+    """Commande pour évaluer plusieurs sélecteurs en un seul parcours et sauvegarder chaque liste"""
+
+    def __init__(self):
+        self.debug_mode = False
+
+    def set_debug_mode(self, debug_mode: bool):
+        """Active ou désactive le mode debug"""
+        self.debug_mode = debug_mode
+
+    def _debug_print(self, message: str):
+        """Affiche un message seulement en mode debug avec couleur"""
+        if self.debug_mode:
+            colored_prefix = CommandColors.colorize_prefix("SELECT MANY", "SELECT")
+            print(f"{colored_prefix} {message}")
+
+    def _clean_quotes(self, text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
+            return text[1:-1]
+        return text
+
+    def _parse_fields(self, args: List[str]) -> Dict[str, str]:
+        """Parse les arguments nom="tag" en correspondance champ -> balise"""
+        if not args or len(args) % 3 != 0:
+            raise ValueError("SELECT MANY: Syntaxe incorrecte. Utilisez: SELECT MANY nom=\"tag\" [nom=\"tag\" ...]")
+
+        fields = {}
+        for i in range(0, len(args), 3):
+            name, operator, tag = args[i], args[i + 1], args[i + 2]
+            if operator != "=":
+                raise ValueError(f"SELECT MANY: '=' attendu après '{name}', reçu '{operator}'")
+            if name.startswith('_'):
+                raise ValueError(f"SELECT MANY: Le nom de variable '{name}' est réservé")
+            if name in fields:
+                raise ValueError(f"SELECT MANY: Le champ '{name}' est défini plusieurs fois")
+            fields[name] = self._clean_quotes(tag)
+
+        return fields
+
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> Dict[str, ElementList]:
+        """
+        Exécute SELECT MANY nom="tag" [nom="tag" ...]
+
+        Args:
+            args: [nom, =, tag, ...] - Les champs à remplir et leurs balises
+            variables: Variables disponibles
+
+        Returns:
+            Dict associant chaque champ à l'ElementList de ses éléments
+            (chaque liste est aussi sauvegardée dans la variable du même nom)
+        """
+        fields = self._parse_fields(args)
+
+        soup = variables['_current_soup']
+        scope = variables.get('_current_scope')
+
+        if scope is None and not isinstance(soup, BeautifulSoup):
+            raise ValueError("SELECT MANY: Le contenu chargé n'est pas un document HTML valide")
+
+        # Recherche limitée aux sous-arbres du résultat précédent (WITHIN)
+        if scope is not None:
+            soup = scope
+
+        self._debug_print(f"Sélection en un parcours de {len(fields)} champ(s): {fields}")
+
+        results = SelectionEngine.select_many(soup, fields)
+
+        # Sauvegarde chaque liste dans sa propre variable
+        for name, elements in results.items():
+            variables[name] = elements
+            self._debug_print(f" {name}: {len(elements)} élément(s) '{fields[name]}'")
+
+        return results
@@ -3,13 +3,11 @@ Commande SELECT ONCE pour récupérer un élément spécifique par son index
 """
 from bs4 import BeautifulSoup, Tag
 from typing import List, Dict, Any
-import sys
-from pathlib import Path
 
-# Ajoute le chemin vers le module core
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "core"))
-from base_command import BaseCommand
-from colors import CommandColors
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.selection import SelectionEngine
 
 class SelectOnceCommand(BaseCommand):
     """Commande pour sélectionner un élément spécifique par son index"""
@@ -57,24 +55,27 @@ class SelectOnceCommand(BaseCommand):
             raise ValueError(f"SELECT ONCE: L'index doit être supérieur à 0, reçu {index}")
         
         soup = variables['_current_soup']
+        scope = variables.get('_current_scope')
         
-        if not isinstance(soup, BeautifulSoup):
+        if scope is None and not isinstance(soup, BeautifulSoup):
             raise ValueError("SELECT ONCE: Le contenu chargé n'est pas un document HTML valide")
         
+        # Recherche limitée aux sous-arbres du résultat précédent (WITHIN)
+        if scope is not None:
+            soup = scope
+        
         self._debug_print(f"Recherche de l'élément '{tag}' à l'index {index}")
         
-        # Utilise find_all pour récupérer tous les éléments
-        elements = soup.find_all(tag)
+        # Arrête le parcours après la n-ième correspondance
+        selected_element, found_count = SelectionEngine.select_nth(soup, tag, index)
         
-        if not elements:
+        if found_count == 0:
             raise ValueError(f"SELECT ONCE: Aucun élément '{tag}' trouvé")
         
-        # Vérifie que l'index existe (conversion 1-based vers 0-based)
-        if index > len(elements):
-            raise ValueError(f"SELECT ONCE: Index {index} trop élevé. Il y a seulement {len(elements)} élément(s) '{tag}'")
-        
-        selected_element = elements[index - 1]  # Conversion 1-based vers 0-based
+        # Moins de n correspondances: le document a été parcouru en entier
+        if selected_element is None:
+            raise ValueError(f"SELECT ONCE: Index {index} trop élevé. Il y a seulement {found_count} élément(s) '{tag}'")
         
-        self._debug_print(f" Élément '{tag}' à l'index {index} trouvé (parmi {len(elements)} éléments)")
+        self._debug_print(f" Élément '{tag}' à l'index {index} trouvé")
         
         return selected_element
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Handler principal pour la commande SKIP
+"""
+from typing import List, Dict, Any, Optional, Tuple
+
+# Import absolu vers le module utils du package grablang
+from grablang.utils.base_command import BaseCommand
+from grablang.utils.colors import CommandColors
+from grablang.utils.control_flow import SkipIteration
+from grablang.utils.simhash import SimHash, SimHashIndex
+
+class SkipHandler(BaseCommand):
+    """Handler pour SKIP IF DUPLICATE: abandonne l'itération si la page a déjà été vue"""
+
+    def __init__(self):
+        self.debug_mode = False
+
+    def set_debug_mode(self, debug_mode: bool):
+        """Active ou désactive le mode debug"""
+        self.debug_mode = debug_mode
+
+    def _debug_print(self, message: str):
+        """Affiche un message seulement en mode debug avec couleur"""
+        if self.debug_mode:
+            colored_prefix = CommandColors.colorize_prefix("SKIP", "CONTROL")
+            print(f"{colored_prefix} {message}")
+
+    def _clean_quotes(self, text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if (text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'")):
+            return text[1:-1]
+        return text
+
+    def _parse_options(self, args: List[str]) -> Tuple[int, Optional[str]]:
+        """Parse les options DISTANCE n et INDEX "fichier" """
+        distance = SimHashIndex.DEFAULT_DISTANCE
+        path = None
+        i = 0
+        while i < len(args):
+            option = args[i].upper()
+            if option not in ("DISTANCE", "INDEX") or i + 1 >= len(args):
+                raise ValueError(f"SKIP: Option '{args[i]}' invalide. Usage: SKIP IF DUPLICATE [DISTANCE n] [INDEX \"fichier\"]")
+            value = args[i + 1]
+            if option == "DISTANCE":
+                try:
+                    distance = int(value)
+                except ValueError:
+                    raise ValueError(f"SKIP: La distance doit être un entier, reçu '{value}'")
+                if not 0 <= distance <= SimHashIndex.MAX_DISTANCE:
+                    raise ValueError(f"SKIP: La distance doit être comprise entre 0 et {SimHashIndex.MAX_DISTANCE}, reçu {distance}")
+            else:
+                path = self._clean_quotes(value)
+            i += 2
+        return distance, path
+
+    def execute(self, args: List[str], variables: Dict[str, Any]) -> None:
+        """
+        Exécute SKIP IF DUPLICATE [DISTANCE n] [INDEX "fichier"]
+
+        Args:
+            args: IF DUPLICATE suivi des options
+                - DISTANCE n: écart maximal en bits entre deux empreintes (3 par défaut)
+                - INDEX "fichier": index conservé d'une exécution à l'autre
+            variables: Variables disponibles
+
+        Raises:
+            SkipIteration: Si la page courante est quasi identique à une page déjà traitée;
+                sinon la page est ajoutée à l'index et l'exécution continue
+
+        Exemples:
+            FOR url IN urls {
+                LOAD URL url
+                SKIP IF DUPLICATE
+                ...
+            }
+        """
+        if len(args) < 2 or args[0].upper() != "IF" or args[1].upper() != "DUPLICATE":
+            raise ValueError("SKIP: Usage: SKIP IF DUPLICATE [DISTANCE n] [INDEX \"fichier\"]")
+
+        distance, path = self._parse_options(args[2:])
+        index = SimHashIndex.for_run(variables, distance, path)
+
+        source, fingerprint = SimHash.of_page(variables, "SKIP")
+        label = variables.get('_base_url') or ""
+        iteration = variables.get('_iteration')
+
+        # Page déjà ajoutée par un SKIP précédent de la même itération: elle continue
+        if index.added_in(source, iteration):
+            self._debug_print(f"Page {label or '(sans URL)'} déjà dans l'index")
+            return None
+
+        match = index.nearest(fingerprint)
+
+        if match is not None:
+            seen, gap = match
+            self._debug_print(f"Page {label or '(sans URL)'} ignorée: doublon de {seen or '(sans URL)'} ({gap} bit(s) d'écart)")
+            raise SkipIteration()
+
+        index.add(fingerprint, label, source, iteration)
+        self._debug_print(f"Nouvelle page {label or '(sans URL)'} ({len(index)} page(s) dans l'index)")
@@ -1,14 +1,18 @@
 """
 Commande JSON pour convertir le contenu en format JSON
 """
-from bs4 import BeautifulSoup, Tag, ResultSet
-from typing import List, Dict, Any, Union
+from bs4 import BeautifulSoup, Tag
+from typing import List, Dict, Any, Iterator, Union
 import json
 from pathlib import Path
 
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.json_sink import JsonLinesSink
+from grablang.utils.text_cache import TextCache
+from grablang.utils.numeric import NumericArray
+from grablang.utils.records import ColumnTable, Record, RecordList
 
 class UtilitiesJsonCommand(BaseCommand):
     """Commande pour convertir des données en format JSON"""
@@ -28,7 +32,7 @@ class UtilitiesJsonCommand(BaseCommand):
     
     def execute(self, args: List[str], variables: Dict[str, Any]) -> str:
         """
-        Exécute JSON [variable_name] [PRETTY|ARRAY|OBJECT] [output_filename]
+        Exécute JSON [variable_name] [PRETTY|ARRAY|OBJECT|RECORDS|COLUMNS|APPEND] [output_filename]
         
         Args:
             args: Arguments
@@ -36,6 +40,11 @@ class UtilitiesJsonCommand(BaseCommand):
                   - [PRETTY] : Formatage indenté
                   - [ARRAY] : Force la conversion en array JSON
                   - [OBJECT] : Force la conversion en objet JSON avec clés numériques
+                  - [RECORDS] : Tables (EXTRACT TABLE, GET ATTRS) écrites ligne par ligne (défaut)
+                  - [COLUMNS] : Tables écrites colonne par colonne {colonne: [valeurs]}
+                  - [APPEND] : Ajoute une ligne JSON par élément (JSON Lines, .jsonl) au lieu de
+                    réécrire le fichier; les écritures sont regroupées et le fichier reste
+                    ouvert jusqu'à la fin du script
                   - [output_filename] : Nom du fichier JSON à créer (optionnel)
             variables: Variables disponibles
             
@@ -47,6 +56,8 @@ class UtilitiesJsonCommand(BaseCommand):
         pretty = False
         force_array = False
         force_object = False
+        columns_layout = False
+        append = False
         output_filename = None
         
         # Analyse des arguments dans l'ordre
@@ -58,6 +69,12 @@ class UtilitiesJsonCommand(BaseCommand):
                 force_array = True
             elif arg.upper() == "OBJECT":
                 force_object = True
+            elif arg.upper() == "RECORDS":
+                columns_layout = False
+            elif arg.upper() == "COLUMNS":
+                columns_layout = True
+            elif arg.upper() == "APPEND":
+                append = True
             else:
                 remaining_args.append(arg)
         
@@ -103,8 +120,13 @@ class UtilitiesJsonCommand(BaseCommand):
         output_filename = output_filename.replace(' ', '_')
         self._debug_print(f"Nom de fichier après nettoyage des espaces: '{output_filename}'")
         
-        # Assure-toi que le nom de fichier a l'extension .json
-        if not output_filename.endswith('.json'):
+        # Assure-toi que le nom de fichier a l'extension .json (.jsonl en ajout)
+        if append:
+            if pretty or force_object or columns_layout:
+                raise ValueError("JSON: APPEND écrit une ligne par élément, sans PRETTY, OBJECT ni COLUMNS")
+            if not output_filename.endswith(('.jsonl', '.ndjson', '.json')):
+                output_filename += '.jsonl'
+        elif not output_filename.endswith('.json'):
             output_filename += '.json'
         
         # Récupère les données à convertir
@@ -120,22 +142,32 @@ class UtilitiesJsonCommand(BaseCommand):
         
         self._debug_print(f"Conversion en JSON de '{var_name}' (type: {type(data).__name__})")
         
-        # Convertit les données en structure JSON
-        json_data = self._convert_to_json_structure(data, force_array, force_object)
+        output_path = Path(output_filename)
+        sink = variables.get('_json_sink')
         
-        # Génère le JSON
-        if pretty:
-            json_str = json.dumps(json_data, ensure_ascii=False, indent=2)
-        else:
-            json_str = json.dumps(json_data, ensure_ascii=False)
+        if append:
+            # Chaque élément est converti et sérialisé seul, sans construire la liste complète
+            try:
+                count = JsonLinesSink.for_run(variables).append(output_path, self._iter_json_lines(data))
+            except OSError as e:
+                raise ValueError(f"JSON: Impossible d'écrire le fichier '{output_filename}': {e}")
+            self._debug_print(f"{count} ligne(s) ajoutée(s) à {output_path.absolute()}")
+            return str(output_path.absolute())
         
-        # Écrit le fichier JSON
-        output_path = Path(output_filename)
+        # Un fichier ouvert en ajout plus tôt dans le script est vidé avant d'être réécrit
+        if sink is not None:
+            sink.release(output_path)
+        
+        # Convertit les données en structure JSON
+        json_data = self._convert_to_json_structure(data, force_array, force_object, columns_layout)
+        
+        # Écrit le fichier JSON par morceaux (sans chaîne intermédiaire complète)
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+                json.dump(json_data, f, ensure_ascii=False, indent=2 if pretty else None)
+                size = f.tell()
             
-            self._debug_print(f"Fichier JSON créé: {output_path.absolute()} ({len(json_str)} caractères)")
+            self._debug_print(f"Fichier JSON créé: {output_path.absolute()} ({size} octets)")
             
             # Retourne le chemin du fichier créé
             return str(output_path.absolute())
@@ -143,18 +175,38 @@ class UtilitiesJsonCommand(BaseCommand):
         except Exception as e:
             raise ValueError(f"JSON: Impossible d'écrire le fichier '{output_filename}': {e}")
     
-    def _convert_to_json_structure(self, data: Any, force_array: bool = False, force_object: bool = False) -> Union[Dict, List, str, int, float, bool, None]:
+    def _iter_json_lines(self, data: Any) -> Iterator[Any]:
+        """Éléments écrits par APPEND, un par ligne (listes et tables: un élément par ligne)"""
+        if isinstance(data, ColumnTable):
+            return iter(data)
+        if isinstance(data, RecordList):
+            return (record.as_dict() for record in data)
+        if NumericArray.is_array(data):
+            return iter(data.tolist())
+        if isinstance(data, list):
+            return (self._convert_element_to_json(item) for item in data)
+        return iter([self._convert_to_json_structure(data)])
+    
+    def _convert_to_json_structure(self, data: Any, force_array: bool = False, force_object: bool = False,
+                                   columns_layout: bool = False) -> Union[Dict, List, str, int, float, bool, None]:
         """Convertit les données en structure compatible JSON"""
         
         if data is None:
             return None
         
+        # Tables (EXTRACT TABLE, GET ATTRS): valeurs déjà natives, écrites sans passer par les cellules
+        elif isinstance(data, (ColumnTable, RecordList)):
+            return data.to_columns() if columns_layout else data.records()
+        
+        elif isinstance(data, Record):
+            return data.as_dict()
+        
         # Types déjà compatibles JSON
         elif isinstance(data, (str, int, float, bool)):
             return data
         
         # Listes et résultats BeautifulSoup
-        elif isinstance(data, (list, ResultSet)):
+        elif isinstance(data, list):
             if force_object:
                 # Convertit en objet avec clés numériques
                 return {str(i): self._convert_element_to_json(item) for i, item in enumerate(data)}
@@ -162,6 +214,11 @@ class UtilitiesJsonCommand(BaseCommand):
                 # Convertit en array
                 return [self._convert_element_to_json(item) for item in data]
         
+        # Tableaux numériques (EXTRACT NUMBERS AS FLOAT|INT): nombres Python natifs
+        elif NumericArray.is_array(data):
+            numbers = data.tolist()
+            return {str(i): number for i, number in enumerate(numbers)} if force_object else numbers
+        
         # Dictionnaires
         elif isinstance(data, dict):
             return {str(k): self._convert_to_json_structure(v) for k, v in data.items()}
@@ -192,7 +249,7 @@ class UtilitiesJsonCommand(BaseCommand):
             # Extrait les informations importantes de l'élément HTML
             result = {
                 "tag": element.name,
-                "text": element.get_text(strip=True)
+                "text": TextCache.text(element, strip=True)
             }
             
             # Ajoute les attributs s'ils existent
@@ -212,14 +269,19 @@ class UtilitiesJsonCommand(BaseCommand):
         elif isinstance(element, BeautifulSoup):
             # Pour un document complet, extrait le titre et le contenu
             title_tag = element.find("title")
-            title = title_tag.get_text(strip=True) if title_tag else "Sans titre"
+            title = TextCache.text(title_tag, strip=True) if title_tag else "Sans titre"
+            text = TextCache.text(element, strip=True)
             
             return {
                 "document_title": title,
                 "content_length": len(str(element)),
-                "text_content": element.get_text(strip=True)[:500] + "..." if len(element.get_text(strip=True)) > 500 else element.get_text(strip=True)
+                "text_content": text[:500] + "..." if len(text) > 500 else text
             }
         
+        # Structures déjà natives (EXTRACT JSONLD, MICRODATA, KEYWORDS...): conservées telles quelles
+        elif isinstance(element, (dict, list)):
+            return self._convert_to_json_structure(element)
+        
         # Pour les autres types, convertit en string
         else:
             return str(element)
\ No newline at end of file
@@ -23,24 +23,42 @@ class UtilitiesSaveCommand(BaseCommand):
             colored_prefix = CommandColors.colorize_prefix("SAVE", "SAVE")
             print(f"{colored_prefix} {message}")
     
+    def _save_split(self, names: List[str], result: Any, variables: Dict[str, Any]) -> None:
+        """Répartit les valeurs d'un dict résultat dans plusieurs variables, par position"""
+        if not isinstance(result, dict):
+            raise ValueError(f"SAVE: Plusieurs noms ne sont possibles que pour un résultat dict (reçu {type(result).__name__})")
+        if len(names) != len(result):
+            raise ValueError(f"SAVE: {len(names)} nom(s) pour {len(result)} valeur(s) ({', '.join(result)})")
+        
+        for name, (key, value) in zip(names, result.items()):
+            variables[name] = value
+            self._debug_print(f"Variable '{name}' sauvegardée depuis '{key}' (type: {type(value).__name__})")
+    
     def execute(self, args: List[str], variables: Dict[str, Any]) -> None:
         """
-        Exécute SAVE variable_name
+        Exécute SAVE variable_name ou SAVE nom1 nom2 ... (répartition d'un dict)
         
         Args:
-            args: [variable_name] - Le nom de la variable où sauvegarder
+            args: [variable_name, ...] - Le nom de la variable où sauvegarder; avec plusieurs
+                  noms, chaque valeur du dict résultat (EXTRACT MULTI, SELECT MANY) est
+                  sauvegardée dans le nom de même position
             variables: Variables disponibles
             
         Returns:
             None
         """
-        self.validate_args(args, 1, "SAVE")
-        
-        variable_name = args[0]
+        if not args:
+            raise ValueError("Commande SAVE: attendu au moins 1 argument, reçu 0")
         
         if '_last_result' not in variables:
             raise ValueError("SAVE: Aucun résultat à sauvegarder. Exécutez d'abord une commande qui produit un résultat.")
         
+        if len(args) > 1:
+            self._save_split(args, variables['_last_result'], variables)
+            return None
+        
+        variable_name = args[0]
+        
         # Sauvegarde le dernier résultat dans la variable nommée
         variables[variable_name] = variables['_last_result']
         
@@ -9,6 +9,7 @@ from pathlib import Path
 # Import absolu vers le module utils du package grablang
 from grablang.utils.base_command import BaseCommand
 from grablang.utils.colors import CommandColors
+from grablang.utils.document_cache import DocumentCache
 
 class UtilitiesUseCommand(BaseCommand):
     """Commande pour réutiliser le contenu d'une variable et la définir comme _last_result"""
@@ -57,6 +58,15 @@ class UtilitiesUseCommand(BaseCommand):
         
         # Si c'est un document HTML complet (BeautifulSoup), met à jour _original_html
         if isinstance(variable_content, BeautifulSoup):
+            previous = variables.get('_original_html')
+            if previous is not variable_content:
+                # L'ancien document n'est plus le document principal: son cache est libéré
+                if previous is not None:
+                    DocumentCache.invalidate(previous)
+                # Corps brut (EXTRACT ... RAW) et URL de la page: ceux de l'ancien document
+                variables.pop('_raw_body', None)
+                variables.pop('_raw_encoding', None)
+                variables.pop('_base_url', None)
             variables['_original_html'] = variable_content
             self._debug_print(f"Variable '{variable_name}' définie comme document HTML principal")
         # Sinon, vérifie si on a besoin de garder le document original
@@ -2,12 +2,15 @@
 Exécuteur pour les scripts GrabLang
 Responsable de l'exécution de l'AST généré par le parser
 """
+from numbers import Real
 from typing import Dict, Any, List
 from pathlib import Path
 import importlib.util
 
 from .parser import ASTNode
 from ..utils.colors import CommandColors
+from ..utils.control_flow import SkipIteration
+from ..utils.json_sink import JsonLinesSink
 
 
 class GrabLangExecutor:
@@ -17,6 +20,8 @@ class GrabLangExecutor:
         self.debug_mode = debug_mode
         self.variables = {}
         self.commands = {}
+        # Compteur d'itérations de boucle: chaque itération reçoit un numéro unique (_iteration)
+        self._iterations = 0
         self._load_commands()
     
     def _debug_print(self, message: str):
@@ -34,11 +39,18 @@ class GrabLangExecutor:
         """
         self._debug_print("Début de l'exécution de l'AST")
         
-        if ast.type == "PROGRAM":
-            for statement in ast.children:
-                self._execute_statement(statement)
-        else:
-            self._execute_statement(ast)
+        try:
+            if ast.type == "PROGRAM":
+                for statement in ast.children:
+                    self._execute_statement(statement)
+            else:
+                self._execute_statement(ast)
+        except SkipIteration:
+            # SKIP hors boucle: le reste du script est ignoré
+            self._debug_print("SKIP hors boucle: fin du script")
+        finally:
+            # Fichiers ouverts par JSON ... APPEND: vidés et fermés en fin de script, même après une erreur
+            JsonLinesSink.close_run(self.variables)
         
         self._debug_print("Exécution de l'AST terminée")
     
@@ -66,6 +78,8 @@ class GrabLangExecutor:
             else:
                 raise ValueError(f"Type de nœud non supporté: {node.type}")
                 
+        except SkipIteration:
+            raise
         except Exception as e:
             print(f"Erreur ligne {node.line_number}: {e}")
             if self.debug_mode:
@@ -103,7 +117,7 @@ class GrabLangExecutor:
         
         if command_key and command_key in self.commands:
             # Gestion spéciale pour certaines commandes avec alias
-            if command_key in ["SAVE", "USE", "COUNT", "JSON"]:
+            if command_key in ["SAVE", "USE", "COUNT", "JSON", "SUM", "AVG", "MIN", "MAX", "PERCENTILE"]:
                 args = [command_key] + args
             
             # Exécute la commande
@@ -177,13 +191,24 @@ class GrabLangExecutor:
         self._debug_print(f"Boucle FOR sur {len(items)} élément(s)")
         
         # Exécute le bloc pour chaque élément
+        outer_iteration = self.variables.get('_iteration')
         for i, item in enumerate(items):
             self.variables[var_name] = item
             self.variables[f"{var_name}_index"] = i
             
             self._debug_print(f"FOR iteration {i}: {var_name} = {item}")
             
+            self._execute_iteration(block_node, f"FOR iteration {i}")
+        self.variables['_iteration'] = outer_iteration
+    
+    def _execute_iteration(self, block_node: ASTNode, description: str) -> None:
+        """Exécute le bloc d'une itération de boucle; SKIP passe à l'itération suivante"""
+        self._iterations += 1
+        self.variables['_iteration'] = self._iterations
+        try:
             self._execute_statement(block_node)
+        except SkipIteration:
+            self._debug_print(f"{description} ignorée (SKIP)")
     
     def _execute_while_statement(self, node: ASTNode) -> None:
         """Exécute une boucle WHILE"""
@@ -195,13 +220,15 @@ class GrabLangExecutor:
         
         iteration = 0
         max_iterations = 1000  # Protection contre les boucles infinies
+        outer_iteration = self.variables.get('_iteration')
         
         while self._evaluate_condition(condition_node) and iteration < max_iterations:
             self._debug_print(f"WHILE iteration {iteration}: condition vraie")
             
-            self._execute_statement(block_node)
+            self._execute_iteration(block_node, f"WHILE iteration {iteration}")
             
             iteration += 1
+        self.variables['_iteration'] = outer_iteration
         
         if iteration >= max_iterations:
             print(f"Attention: Boucle WHILE interrompue après {max_iterations} itérations")
@@ -269,12 +296,15 @@ class GrabLangExecutor:
                             return right in str(left_value)
                         elif op == " GREATER ":
                             try:
-                                return float(left_value) > float(right)
+                                # Valeur déjà numérique (SUM, AVG, COUNT...): pas de reconversion
+                                left_number = left_value if isinstance(left_value, Real) else float(left_value)
+                                return left_number > float(right)
                             except:
                                 return len(str(left_value)) > len(right)
                         elif op == " LESS ":
                             try:
-                                return float(left_value) < float(right)
+                                left_number = left_value if isinstance(left_value, Real) else float(left_value)
+                                return left_number < float(right)
                             except:
                                 return len(str(left_value)) < len(right)
         
@@ -296,12 +326,6 @@ class GrabLangExecutor:
         if command_name == "FILTER" and len(args) >= 2 and "WHERE" in [arg.upper() for arg in args]:
             return "FILTER"
         
-        # Essaie les commandes composées à 3 mots (GET ATTR FIRST)
-        if len(args) >= 2:
-            potential_key = f"{command_name}_{args[0].upper()}_{args[1].upper()}"
-            if command_name == "GET" and potential_key.replace("GET_", "") in self._get_getter_subcommands():
-                return command_name
-        
         # Essaie les commandes composées à 2 mots (LOAD URL)
         if len(args) >= 1:
             potential_key = f"{command_name}_{args[0].upper()}"
@@ -314,12 +338,6 @@ class GrabLangExecutor:
         
         return None
     
-    def _get_getter_subcommands(self):
-        """Récupère la liste des sous-commandes GET disponibles"""
-        if "GET" in self.commands and hasattr(self.commands["GET"], "subcommands"):
-            return self.commands["GET"].subcommands.keys()
-        return []
-    
     def _load_commands(self):
         """Charge dynamiquement toutes les commandes disponibles"""
         commands_dir = Path(__file__).parent.parent / "commands"
@@ -367,6 +385,9 @@ class GrabLangExecutor:
                     self.commands["FILTER"] = handler_instance
                 elif command_key == "EXTRACTION":
                     self.commands["EXTRACT"] = handler_instance
+                elif command_key == "AGGREGATE":
+                    for operation in handler_instance.OPERATIONS:
+                        self.commands[operation] = handler_instance
                 
         except Exception as e:
             self._debug_print(f"Erreur lors du chargement du handler {category}: {e}")
@@ -53,7 +53,7 @@ class GrabLangParser:
         
         # Mots-clés reconnus
         self.control_keywords = {"IF", "FOR", "WHILE", "ELSE", "ELIF"}
-        self.command_keywords = {"LOAD", "SELECT", "FILTER", "GET", "PRINT", "SAVE", "USE", "COUNT", "JSON", "EXTRACT"}
+        self.command_keywords = {"LOAD", "SELECT", "FILTER", "GET", "PRINT", "SAVE", "USE", "COUNT", "JSON", "EXTRACT", "SKIP"}
         self.operators = {"EXISTS", "NOT EXISTS", "EMPTY", "NOT EMPTY", "EQUALS", "CONTAINS", "GREATER", "LESS", "IN", "WHERE"}
     
     def _debug_print(self, message: str):
@@ -158,12 +158,30 @@ class GrabLangParser:
                     raise SyntaxError(f"Ligne {line_number}: Guillemet non fermé")
                 continue
             
-            # Gestion des mots/identifiants
-            if line[i].isalnum() or line[i] == '_':
+            # Gestion des parenthèses (regroupement dans les conditions WHERE)
+            if line[i] in '()':
+                tokens.append(Token(TokenType.OPERATOR, line[i], line_number, i))
+                i += 1
+                continue
+            
+            # Gestion des opérateurs symboliques (=, !=, <, >, <=, >=)
+            if line.startswith(('!=', '<=', '>='), i):
+                tokens.append(Token(TokenType.OPERATOR, line[i:i + 2], line_number, i))
+                i += 2
+                continue
+            if line[i] in '=<>':
+                tokens.append(Token(TokenType.OPERATOR, line[i], line_number, i))
+                i += 1
+                continue
+            
+            # Gestion des mots/identifiants (ou borne de SLICE sans début, ex: SLICE :3)
+            slice_bound = line[i] == ':' and tokens and tokens[-1].value.upper() == "SLICE"
+            if line[i].isalnum() or line[i] == '_' or slice_bound:
                 start_col = i
                 value = ""
                 
-                while i < len(line) and (line[i].isalnum() or line[i] in ['_', '-']):
+                # ':' pour les bornes de SLICE (ex: SLICE 2:5)
+                while i < len(line) and (line[i].isalnum() or line[i] in ['_', '-', ':']):
                     value += line[i]
                     i += 1
                 
@@ -190,6 +208,10 @@ class GrabLangParser:
         """
         upper_value = value.upper()
         
+        # Mot-clé de contrôle juste après une commande: argument (SKIP IF DUPLICATE)
+        if upper_value in self.control_keywords and existing_tokens and existing_tokens[-1].type == TokenType.COMMAND:
+            return TokenType.SUBCOMMAND
+        
         # Mots-clés de contrôle
         if upper_value in self.control_keywords:
             return TokenType.CONTROL
@@ -0,0 +1,160 @@
+"""
+Filtrage en colonnes pour les très grands ensembles d'éléments
+Chaque champ testé est extrait une seule fois puis comparé en bloc avec NumPy (optionnel)
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+from bs4 import Tag
+
+from .filter_engine import Condition, FilterEngine, Predicate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel: FILTER ALL reste alors en mode ligne par ligne
+    np = None
+
+
+class ColumnarFilter:
+    """Évalue un arbre de conditions WHERE sous forme de masques booléens"""
+
+    # Nombre d'éléments à partir duquel FILTER ALL passe en mode colonnes
+    MIN_ELEMENTS = 5000
+    # Largeur maximale des chaînes placées dans un tableau NumPy à largeur fixe
+    # (au-delà, la condition est évaluée ligne par ligne pour limiter la mémoire)
+    MAX_STRING_WIDTH = 256
+
+    def __init__(self, elements: Sequence[Tag]):
+        self.elements = elements
+        # Colonnes extraites, partagées entre les conditions portant sur le même champ
+        self._values: Dict[str, List[Optional[str]]] = {}
+        self._strings: Dict[str, Optional[Any]] = {}
+        self._lowered: Dict[str, Optional[Any]] = {}
+        self._numbers: Dict[str, Any] = {}
+
+    @classmethod
+    def available(cls) -> bool:
+        """Vrai si NumPy est installé"""
+        return np is not None
+
+    @classmethod
+    def should_use(cls, elements: Sequence[Any]) -> bool:
+        """Vrai si le mode colonnes est disponible et rentable pour ces éléments"""
+        return np is not None and len(elements) >= cls.MIN_ELEMENTS
+
+    def filter(self, condition: Condition) -> List[Tag]:
+        """Retourne les éléments vérifiant la condition, en conservant leur ordre"""
+        mask = self._evaluate(condition)
+        elements = self.elements
+        return [elements[index] for index in np.flatnonzero(mask).tolist()]
+
+    def _evaluate(self, condition: Condition) -> Any:
+        """Calcule le masque booléen d'un nœud de l'arbre de conditions"""
+        kind = condition[0]
+
+        if kind == "CONDITION":
+            return self._condition_mask(condition[1])
+
+        if kind == "NOT":
+            return ~self._evaluate(condition[1])
+
+        # AND/OR: arrêt dès que le résultat est connu pour toutes les lignes
+        mask = self._evaluate(condition[1][0])
+        for operand in condition[1][1:]:
+            if kind == "AND":
+                if not mask.any():
+                    break
+                mask &= self._evaluate(operand)
+            else:
+                if mask.all():
+                    break
+                mask |= self._evaluate(operand)
+        return mask
+
+    def _row_mask(self, predicate: Predicate) -> Any:
+        """Repli: applique le prédicat ligne par ligne"""
+        return np.fromiter((predicate(element) for element in self.elements), dtype=bool, count=len(self.elements))
+
+    def _column(self, key: str, getter) -> List[Optional[str]]:
+        """Extrait (une seule fois) les valeurs d'un champ"""
+        values = self._values.get(key)
+        if values is None:
+            values = [getter(element) for element in self.elements]
+            self._values[key] = values
+        return values
+
+    @classmethod
+    def _fixed_width(cls, values: List[str]) -> Optional[Any]:
+        """Tableau de chaînes à largeur fixe, ou None si une chaîne dépasse MAX_STRING_WIDTH"""
+        width = max((len(value) for value in values), default=1) or 1
+        if width > cls.MAX_STRING_WIDTH:
+            return None
+        return np.array(values, dtype=f"<U{width}")
+
+    def _string_column(self, key: str, getter) -> Optional[Any]:
+        """Tableau de chaînes à largeur fixe ('' pour les valeurs absentes), ou None si trop large"""
+        if key not in self._strings:
+            self._strings[key] = self._fixed_width([value or "" for value in self._column(key, getter)])
+        return self._strings[key]
+
+    def _lower_column(self, key: str, getter) -> Optional[Any]:
+        """
+        Chaînes en minuscules pour CONTAINS, ou None si trop large
+
+        Mises en minuscules par Python avant de fixer la largeur: la forme minuscule
+        peut être plus longue ('İ' -> 'i̇') et np.char.lower la tronquerait.
+        """
+        if key not in self._lowered:
+            self._lowered[key] = self._fixed_width([(value or "").lower() for value in self._column(key, getter)])
+        return self._lowered[key]
+
+    def _number_column(self, key: str, getter) -> Any:
+        """Tableau de flottants (NaN pour les valeurs absentes ou non numériques)"""
+        numbers = self._numbers.get(key)
+        if numbers is None:
+            to_number = FilterEngine.to_number
+            numbers = np.array(
+                [number if number is not None else np.nan
+                 for number in map(to_number, self._column(key, getter))],
+                dtype=float,
+            )
+            self._numbers[key] = numbers
+        return numbers
+
+    def _condition_mask(self, tokens: List[str]) -> Any:
+        """Masque d'une condition simple, vectorisé quand l'opérateur le permet"""
+        # Compile aussi la version ligne par ligne: valide la condition et sert de repli
+        predicate, _ = FilterEngine._compile_condition(tokens)
+
+        if tokens[0].lower() == "parent":
+            return self._row_mask(predicate)
+
+        key, getter, operator, value = FilterEngine.resolve_field(tokens)
+
+        if operator in ("NULL", "NOT NULL"):
+            present = np.fromiter((value is not None for value in self._column(key, getter)),
+                                  dtype=bool, count=len(self.elements))
+            return ~present if operator == "NULL" else present
+
+        if operator in FilterEngine.NUMERIC_OPERATORS:
+            compare = FilterEngine.NUMERIC_OPERATORS[operator]
+            # Les comparaisons avec NaN sont fausses, comme pour une valeur non numérique
+            return compare(self._number_column(key, getter), FilterEngine.parse_threshold(operator, value))
+
+        if operator not in ("CONTAINS", "NOT CONTAINS", "=", "!="):
+            return self._row_mask(predicate)
+
+        strings = self._string_column(key, getter)
+        if strings is None:
+            return self._row_mask(predicate)
+
+        non_empty = np.char.str_len(strings) > 0
+
+        if operator in ("CONTAINS", "NOT CONTAINS"):
+            lowered = self._lower_column(key, getter)
+            if lowered is None:
+                return self._row_mask(predicate)
+            mask = non_empty & (np.char.find(lowered, value.lower()) >= 0)
+            return ~mask if operator == "NOT CONTAINS" else mask
+
+        mask = non_empty & (strings == value)
+        return ~mask if operator == "!=" else mask
@@ -0,0 +1,12 @@
+"""
+Signaux de contrôle levés par les commandes et interprétés par l'exécuteur
+"""
+
+
+class SkipIteration(Exception):
+    """
+    Abandonne le reste de l'itération en cours (SKIP)
+
+    Une boucle FOR ou WHILE passe à l'itération suivante; hors boucle, le reste
+    du script est ignoré.
+    """
@@ -0,0 +1,144 @@
+"""
+Détection de dates dans le texte des éléments (GET DATE, DATE FIRST, DATE LAST, DATE ONCE)
+Un filtre lexical écarte les fenêtres de mots que dateutil ne pourrait pas lire,
+et les résultats de dateutil sont mémorisés par chaîne candidate
+"""
+from functools import lru_cache
+from itertools import groupby
+from typing import Any, Dict, Iterator, List, Optional
+
+import dateutil.parser
+from bs4 import NavigableString, Tag
+
+from .regex_cache import RegexCache, Patterns
+from .text_cache import TextCache
+
+
+class DateScanner:
+    """Équivalent rapide du test « le texte contient-il une date ? » des commandes GET DATE"""
+
+    # Nombre maximal de mots par fenêtre testée avec dateutil
+    MAX_WINDOW = 4
+    # Longueur maximale d'une fenêtre (au-delà, trop de faux positifs)
+    MAX_CANDIDATE_LENGTH = 50
+    # Nombre de textes mémorisés
+    MEMO_SIZE = 4096
+
+    # Les huit motifs de Patterns.DATES en une seule alternance
+    ANY_DATE = RegexCache.compile("|".join(f"(?:{pattern.pattern})" for pattern in Patterns.DATES),
+                                  Patterns.DATES[0].flags)
+
+    _info = dateutil.parser.parserinfo()
+    # Mots reconnus par dateutil; sans fuzzy, tout autre mot fait échouer le parsing
+    KNOWN_WORDS = frozenset().union(
+        _info._jump, _info._weekdays, _info._months, _info._hms,
+        _info._ampm, _info._utczone, _info._pertain,
+        ("nan", "inf", "infinity"),  # acceptés par float(): traités comme des nombres
+    )
+    # Sans chiffre, seul un nom de mois ou de jour peut donner une date
+    ANCHOR_WORDS = frozenset().union(_info._weekdays, _info._months)
+    del _info
+
+    _memo: Dict[str, bool] = {}
+
+    @staticmethod
+    @lru_cache(maxsize=MEMO_SIZE)
+    def _parses(candidate: str) -> bool:
+        """Vrai si dateutil lit la chaîne comme une date (résultat mémorisé par chaîne)"""
+        try:
+            dateutil.parser.parse(candidate, fuzzy=False)
+            return True
+        except Exception:
+            return False
+
+    @classmethod
+    def _classify(cls, word: str) -> Optional[bool]:
+        """
+        Classe un mot pour le filtre lexical
+
+        Returns:
+            None si dateutil ne peut pas lire une fenêtre contenant ce mot,
+            True si le mot peut à lui seul porter une date (chiffre, mois, jour),
+            False sinon (mot de liaison reconnu, ponctuation)
+        """
+        anchor = False
+        for is_alpha, run in groupby(word, str.isalpha):
+            if is_alpha:
+                run = "".join(run)
+                if run not in cls.KNOWN_WORDS:
+                    return None
+                if run in cls.ANCHOR_WORDS:
+                    anchor = True
+            elif not anchor and any(char.isdigit() for char in run):
+                anchor = True
+        return anchor
+
+    @classmethod
+    def _scan(cls, text: str) -> bool:
+        lowered = text.lower().strip()
+
+        if cls.ANY_DATE.search(lowered):
+            return True
+
+        # Fenêtres de 1 à MAX_WINDOW mots, arrêtées au premier mot illisible par dateutil
+        words = lowered.split()
+        kinds = [cls._classify(word) for word in words]
+        for start in range(len(words)):
+            if kinds[start] is None:
+                continue
+            has_anchor = False
+            for end in range(start, min(start + cls.MAX_WINDOW, len(words))):
+                kind = kinds[end]
+                if kind is None:
+                    break
+                has_anchor = has_anchor or kind
+                if not has_anchor:
+                    continue
+                candidate = " ".join(words[start:end + 1])
+                if len(candidate) < cls.MAX_CANDIDATE_LENGTH and cls._parses(candidate):
+                    return True
+
+        return False
+
+    @classmethod
+    def contains_date(cls, text: str) -> bool:
+        """Vérifie si un texte contient une date (motifs courants, puis dateutil sur 1 à 4 mots)"""
+        if not text:
+            return False
+
+        found = cls._memo.get(text)
+        if found is None:
+            if len(cls._memo) >= cls.MEMO_SIZE:
+                cls._memo.clear()
+            found = cls._memo[text] = cls._scan(text)
+        return found
+
+    @classmethod
+    def element_has_date(cls, element: Tag) -> bool:
+        """Vrai si le texte de l'élément (get_text(strip=True)) contient une date"""
+        return cls.contains_date(TextCache.text(element, strip=True))
+
+    @staticmethod
+    def text_parents(document: Any) -> List[Tag]:
+        """
+        Parents des nœuds texte du document, sans doublon, en ordre document
+
+        Un seul parcours de l'arbre; le texte de chaque parent vient ensuite du
+        cache de texte, calculé une fois de bas en haut.
+        """
+        parents = []
+        seen = set()
+        for node in document.descendants:
+            if isinstance(node, NavigableString):
+                parent = node.parent
+                if parent is not None and id(parent) not in seen:
+                    seen.add(id(parent))
+                    parents.append(parent)
+        return parents
+
+    @classmethod
+    def iter_dated(cls, elements: Iterator[Tag]) -> Iterator[Tag]:
+        """Itère paresseusement sur les éléments contenant une date"""
+        for element in elements:
+            if isinstance(element, Tag) and cls.element_has_date(element):
+                yield element
@@ -0,0 +1,44 @@
+"""
+Cache par document pour les structures dérivées d'un arbre HTML
+"""
+from typing import Any, Dict, Optional
+
+
+class DocumentCache:
+    """
+    Structures dérivées d'un document HTML (index de balises, ...)
+
+    Le cache est rangé sur le document lui-même: il est libéré avec lui, sans
+    registre global qui garderait l'arbre (via les balises indexées) en vie.
+    """
+
+    # Attribut privé du document qui porte son cache
+    ATTRIBUTE = '_grablang_cache'
+
+    def __init__(self):
+        # Index des balises: nom -> liste complète des éléments en ordre document
+        self.tag_index: Dict[str, list] = {}
+        # Texte des éléments par id(nœud): get_text() et get_text(strip=True)
+        self.raw_texts: Dict[int, str] = {}
+        self.stripped_texts: Dict[int, str] = {}
+
+    @classmethod
+    def for_document(cls, document: Any) -> 'DocumentCache':
+        """Récupère (ou crée) le cache associé à un document"""
+        cache = cls.peek(document)
+        if cache is None:
+            cache = cls()
+            setattr(document, cls.ATTRIBUTE, cache)
+        return cache
+
+    @classmethod
+    def peek(cls, document: Any) -> Optional['DocumentCache']:
+        """Retourne le cache d'un document s'il existe déjà, sans le créer"""
+        # Lecture directe: l'accès par attribut d'un Tag BeautifulSoup cherche une balise
+        return getattr(document, '__dict__', {}).get(cls.ATTRIBUTE)
+
+    @classmethod
+    def invalidate(cls, document: Any) -> None:
+        """Supprime le cache d'un document (à appeler s'il est remplacé ou si l'arbre est modifié)"""
+        if cls.peek(document) is not None:
+            delattr(document, cls.ATTRIBUTE)
@@ -0,0 +1,40 @@
+"""
+Conteneur léger pour les éléments retournés par SELECT et FILTER
+Remplace les ResultSet construits à partir d'un BeautifulSoup jetable
+"""
+from typing import Any, Iterable, Optional
+
+from bs4 import ResultSet
+
+
+class ElementList(list):
+    """
+    Liste d'éléments HTML en ordre document
+
+    Attributes:
+        source: Document d'origine des éléments (None s'il est inconnu)
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, elements: Iterable[Any] = (), source: Optional[Any] = None):
+        super().__init__(elements)
+        self.source = source
+
+    def __getitem__(self, index):
+        """Un découpage retourne une ElementList du même document"""
+        if isinstance(index, slice):
+            return ElementList(list.__getitem__(self, index), self.source)
+        return list.__getitem__(self, index)
+
+    def copy(self) -> 'ElementList':
+        """Copie superficielle conservant le document d'origine"""
+        return ElementList(self, self.source)
+
+    def __reduce__(self):
+        return (ElementList, (list(self), self.source))
+
+
+def is_element_list(value: Any) -> bool:
+    """Vrai pour une liste d'éléments issue d'une sélection (ElementList ou ResultSet de bs4)"""
+    return isinstance(value, (ElementList, ResultSet))
@@ -0,0 +1,437 @@
+"""
+Moteur de filtrage partagé par les sous-commandes FILTER
+Compile une clause WHERE en prédicat une seule fois par exécution de commande
+"""
+import re
+from operator import ge, gt, le, lt
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from bs4 import Tag
+
+from .keyword_automaton import KeywordAutomaton
+from .regex_cache import RegexCache
+from .text_cache import TextCache
+from .text_normalizer import TextNormalizer
+
+
+# Prédicat compilé: élément -> correspond ou non
+Predicate = Callable[[Tag], bool]
+# Accesseur compilé: élément -> valeur testée (None si absente)
+Getter = Callable[[Tag], Optional[str]]
+# Arbre d'une clause WHERE: ("CONDITION", tokens), ("NOT", nœud), ("AND"|"OR", [nœuds])
+Condition = Tuple[str, Any]
+
+
+class FilterEngine:
+    """Compilation des conditions WHERE en fermetures réutilisables"""
+
+    OPERATORS = ("CONTAINS", "CONTAINS ANY", "MATCHES", "NULL", "NOT NULL", "=", "!=", "NOT CONTAINS", "NOT CONTAINS ANY", "NOT MATCHES", ">", "<", ">=", "<=")
+    # Comparaisons numériques: la valeur testée est convertie en nombre
+    NUMERIC_OPERATORS = {">": gt, "<": lt, ">=": ge, "<=": le}
+    # Opérateurs acceptant la forme NOT OP valeur
+    NEGATABLE = ("CONTAINS", "MATCHES")
+    # Connecteurs logiques entre conditions
+    CONNECTIVES = ("AND", "OR")
+
+    # Coûts relatifs utilisés pour ordonner les conditions d'un même groupe
+    COST_REGEX = 3
+    COST_TEXT = 10
+    COST_PARENT = 20
+
+    @staticmethod
+    def _clean_quotes(text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if len(text) >= 2 and ((text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'"))):
+            return text[1:-1]
+        return text
+
+    @staticmethod
+    def _attribute_getter(name: str, default: Optional[str] = None) -> Getter:
+        """Accesseur pour un attribut (les attributs multiples comme class sont joints)"""
+        def get(element: Tag) -> Optional[str]:
+            value = element.get(name, default)
+            if isinstance(value, list):
+                return " ".join(value)
+            return value
+        return get
+
+    @classmethod
+    def _field_getter(cls, field: str, default: Optional[str] = None) -> Getter:
+        """Accesseur pour un champ de condition (class, text, id ou nom d'attribut)"""
+        if field == "class":
+            return lambda element: " ".join(element.get("class", []))
+        if field == "text":
+            return lambda element: TextCache.text(element, strip=True)
+        return cls._attribute_getter(field, default)
+
+    @staticmethod
+    def to_number(text: Optional[str]) -> Optional[float]:
+        """Convertit une valeur testée en nombre (None si elle n'est pas numérique)"""
+        if not text:
+            return None
+        try:
+            return float(text.strip())
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_threshold(operator: str, value: str) -> float:
+        """Convertit la valeur de référence d'une comparaison numérique"""
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"FILTER: Valeur numérique attendue après {operator}, reçu '{value}'")
+
+    @classmethod
+    def _compile_operator(cls, getter: Getter, operator: str, value: Optional[str]) -> Predicate:
+        """Compile un opérateur appliqué à la valeur renvoyée par getter"""
+        if operator == "NULL":
+            return lambda element: getter(element) is None
+
+        if operator == "NOT NULL":
+            return lambda element: getter(element) is not None
+
+        if value is None:
+            raise ValueError(f"FILTER: Valeur manquante après l'opérateur {operator}")
+
+        if operator == "CONTAINS":
+            # Aiguille mise en minuscules une seule fois
+            needle = value.lower()
+
+            def contains(element: Tag) -> bool:
+                test_value = getter(element)
+                return needle in test_value.lower() if test_value else False
+            return contains
+
+        if operator == "CONTAINS ANY":
+            # Automate des mots-clés du fichier, construit une fois (mis en cache sur disque)
+            automaton = KeywordAutomaton.load(value, "FILTER")
+
+            def contains_any(element: Tag) -> bool:
+                test_value = getter(element)
+                return automaton.contains_any(TextNormalizer.collapse((test_value,))) if test_value else False
+            return contains_any
+
+        if operator == "MATCHES":
+            try:
+                search = RegexCache.compile(value).search
+            except re.error as e:
+                raise ValueError(f"FILTER: Expression régulière invalide '{value}': {e}")
+
+            def matches(element: Tag) -> bool:
+                test_value = getter(element)
+                return bool(search(test_value)) if test_value else False
+            return matches
+
+        if operator in cls.NUMERIC_OPERATORS:
+            compare = cls.NUMERIC_OPERATORS[operator]
+            threshold = cls.parse_threshold(operator, value)
+
+            def numeric(element: Tag) -> bool:
+                number = cls.to_number(getter(element))
+                return number is not None and compare(number, threshold)
+            return numeric
+
+        if operator == "=":
+            def equals(element: Tag) -> bool:
+                test_value = getter(element)
+                return test_value == value if test_value else False
+            return equals
+
+        if operator == "!=":
+            def not_equals(element: Tag) -> bool:
+                test_value = getter(element)
+                return test_value != value if test_value else True
+            return not_equals
+
+        raise ValueError(f"FILTER: Opérateur '{operator}' non supporté. Disponibles: {', '.join(cls.OPERATORS)}")
+
+    @classmethod
+    def _split_operator(cls, tokens: List[str]) -> Tuple[str, Optional[str]]:
+        """Sépare 'OP valeur', 'NOT NULL', 'CONTAINS ANY fichier' ou 'NOT OP valeur' en (opérateur, valeur)"""
+        if not tokens:
+            raise ValueError("FILTER: Opérateur manquant dans la condition")
+
+        operator = tokens[0].upper()
+        if operator == "NOT" and len(tokens) > 1:
+            negated = tokens[1].upper()
+            if negated == "NULL":
+                return "NOT NULL", None
+            if negated in cls.NEGATABLE:
+                operator, value = cls._split_operator(tokens[1:])
+                return f"NOT {operator}", value
+        if operator == "NULL":
+            return "NULL", None
+        if operator == "CONTAINS" and len(tokens) > 2 and tokens[1].upper() == "ANY":
+            # CONTAINS ANY "fichier.txt": l'un des mots-clés du fichier
+            return "CONTAINS ANY", cls._clean_quotes(tokens[2])
+
+        value = cls._clean_quotes(tokens[1]) if len(tokens) > 1 else None
+        return operator, value
+
+    @classmethod
+    def _compile_comparison(cls, getter: Getter, operator: str, value: Optional[str]) -> Predicate:
+        """Compile un opérateur éventuellement précédé de NOT (NOT CONTAINS, NOT MATCHES)"""
+        if operator.startswith("NOT ") and operator != "NOT NULL":
+            positive = cls._compile_operator(getter, operator[4:], value)
+            return lambda element: not positive(element)
+        return cls._compile_operator(getter, operator, value)
+
+    @classmethod
+    def _operator_cost(cls, operator: str) -> int:
+        """Coût estimé d'un opérateur (hors accès à la valeur)"""
+        if operator in ("NULL", "NOT NULL"):
+            return 0
+        if operator.endswith("MATCHES") or operator.endswith("CONTAINS ANY"):
+            return cls.COST_REGEX
+        return 1
+
+    @classmethod
+    def _compile_parent(cls, tokens: List[str]) -> Tuple[Predicate, int]:
+        """Compile 'parent TAG champ OP valeur': vrai si un ancêtre TAG vérifie la condition"""
+        if len(tokens) < 3:
+            raise ValueError("FILTER: Condition parent incomplète. Exemple: parent div class CONTAINS \"card\"")
+
+        parent_tag = tokens[0].lower()
+        field = tokens[1].lower()
+        operator, value = cls._split_operator(tokens[2:])
+        ancestor_matches = cls._compile_comparison(cls._field_getter(field, ""), operator, value)
+
+        # Mémo par exécution de FILTER: id(nœud) -> le nœud ou l'un de ses ancêtres correspond.
+        # Les éléments voisins partagent leurs ancêtres: chaque ancêtre n'est évalué qu'une fois.
+        memo: Dict[int, bool] = {}
+
+        def has_parent(element: Tag) -> bool:
+            path = []
+            current = element.parent
+            result = False
+            while current is not None and current.name:
+                known = memo.get(id(current))
+                if known is not None:
+                    result = known
+                    break
+                path.append(current)
+                current = current.parent
+
+            # Remplit le mémo du haut vers le bas du chemin parcouru
+            for node in reversed(path):
+                if not result and node.name.lower() == parent_tag and ancestor_matches(node):
+                    result = True
+                memo[id(node)] = result
+            return result
+
+        cost = cls.COST_PARENT + cls._field_cost(field) + cls._operator_cost(operator)
+        return has_parent, cost
+
+    @classmethod
+    def _field_cost(cls, field: str) -> int:
+        """Coût estimé de l'accès à un champ: get_text parcourt tout le sous-arbre"""
+        return cls.COST_TEXT if field == "text" else 1
+
+    @classmethod
+    def resolve_field(cls, condition_args: List[str]) -> Tuple[str, Getter, str, Optional[str]]:
+        """
+        Décompose une condition simple (hors parent) en ses parties
+
+        Returns:
+            (clé du champ, accesseur, opérateur, valeur); la clé identifie la valeur
+            testée, deux conditions sur le même champ partagent la même clé
+        """
+        if len(condition_args) < 2:
+            raise ValueError("FILTER: Condition incomplète. Exemples: class CONTAINS \"active\", text MATCHES \"^[0-9]+$\"")
+
+        field = condition_args[0].lower()
+
+        if field == "attr":
+            name = cls._clean_quotes(condition_args[1])
+            operator, value = cls._split_operator(condition_args[2:])
+            return f"attr {name}", cls._attribute_getter(name), operator, value
+
+        operator, value = cls._split_operator(condition_args[1:])
+        return field, cls._field_getter(field), operator, value
+
+    @classmethod
+    def _compile_condition(cls, condition_args: List[str]) -> Tuple[Predicate, int]:
+        """Compile une condition simple en (prédicat, coût estimé)"""
+        if len(condition_args) >= 2 and condition_args[0].lower() == "parent":
+            return cls._compile_parent(condition_args[1:])
+
+        field, getter, operator, value = cls.resolve_field(condition_args)
+        cost = cls._field_cost(field) + cls._operator_cost(operator)
+        return cls._compile_comparison(getter, operator, value), cost
+
+    @staticmethod
+    def _conjunction(predicates: List[Predicate]) -> Predicate:
+        """ET logique court-circuité: s'arrête au premier prédicat faux"""
+        def all_match(element: Tag) -> bool:
+            for predicate in predicates:
+                if not predicate(element):
+                    return False
+            return True
+        return all_match
+
+    @staticmethod
+    def _disjunction(predicates: List[Predicate]) -> Predicate:
+        """OU logique court-circuité: s'arrête au premier prédicat vrai"""
+        def any_match(element: Tag) -> bool:
+            for predicate in predicates:
+                if predicate(element):
+                    return True
+            return False
+        return any_match
+
+    @classmethod
+    def _combine(cls, operator: str, operands: List[Tuple[Predicate, int]]) -> Tuple[Predicate, int]:
+        """Combine des opérandes AND/OR, les moins coûteux évalués en premier"""
+        if len(operands) == 1:
+            return operands[0]
+
+        # Tri stable: à coût égal l'ordre du script est conservé
+        ordered = sorted(operands, key=lambda operand: operand[1])
+        predicates = [predicate for predicate, _ in ordered]
+        cost = sum(cost for _, cost in ordered)
+
+        if operator == "AND":
+            return cls._conjunction(predicates), cost
+        return cls._disjunction(predicates), cost
+
+    @classmethod
+    def _parse_or(cls, tokens: List[str], position: int) -> Tuple[Condition, int]:
+        """expression := terme (OR terme)*"""
+        operand, position = cls._parse_and(tokens, position)
+        operands = [operand]
+        while position < len(tokens) and tokens[position].upper() == "OR":
+            operand, position = cls._parse_and(tokens, position + 1)
+            operands.append(operand)
+        return (operand if len(operands) == 1 else ("OR", operands)), position
+
+    @classmethod
+    def _parse_and(cls, tokens: List[str], position: int) -> Tuple[Condition, int]:
+        """terme := facteur (AND facteur)*"""
+        operand, position = cls._parse_not(tokens, position)
+        operands = [operand]
+        while position < len(tokens) and tokens[position].upper() == "AND":
+            operand, position = cls._parse_not(tokens, position + 1)
+            operands.append(operand)
+        return (operand if len(operands) == 1 else ("AND", operands)), position
+
+    @classmethod
+    def _parse_not(cls, tokens: List[str], position: int) -> Tuple[Condition, int]:
+        """facteur := NOT facteur | ( expression ) | condition"""
+        if position >= len(tokens):
+            raise ValueError("FILTER: Condition manquante en fin d'expression")
+
+        token = tokens[position]
+
+        if token.upper() == "NOT":
+            operand, position = cls._parse_not(tokens, position + 1)
+            return ("NOT", operand), position
+
+        if token == "(":
+            operand, position = cls._parse_or(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ")":
+                raise ValueError("FILTER: Parenthèse fermante ')' manquante")
+            return operand, position + 1
+
+        # Condition simple: jusqu'au prochain AND/OR ou parenthèse fermante
+        end = position
+        while end < len(tokens) and tokens[end] != ")" and tokens[end].upper() not in cls.CONNECTIVES:
+            end += 1
+        return ("CONDITION", tokens[position:end]), end
+
+    @classmethod
+    def parse(cls, condition_args: List[str]) -> Condition:
+        """
+        Analyse une clause WHERE en arbre de conditions
+
+        Returns:
+            Nœud ("CONDITION", tokens), ("NOT", nœud), ("AND", [nœuds]) ou ("OR", [nœuds])
+        """
+        if len(condition_args) < 2:
+            raise ValueError("FILTER: Condition incomplète. Exemples: class CONTAINS \"active\", text MATCHES \"^[0-9]+$\"")
+
+        condition, position = cls._parse_or(list(condition_args), 0)
+        if position < len(condition_args):
+            raise ValueError(f"FILTER: Token inattendu '{condition_args[position]}' dans la condition")
+        return condition
+
+    @classmethod
+    def _compile_node(cls, condition: Condition) -> Tuple[Predicate, int]:
+        """Compile un nœud de l'arbre en (prédicat, coût estimé)"""
+        kind = condition[0]
+        if kind == "CONDITION":
+            return cls._compile_condition(condition[1])
+        if kind == "NOT":
+            predicate, cost = cls._compile_node(condition[1])
+            return (lambda element: not predicate(element)), cost
+        return cls._combine(kind, [cls._compile_node(operand) for operand in condition[1]])
+
+    @classmethod
+    def compile_tree(cls, condition: Condition) -> Predicate:
+        """Compile un arbre produit par parse() en prédicat"""
+        predicate, _ = cls._compile_node(condition)
+        return predicate
+
+    @classmethod
+    def compile(cls, condition_args: List[str]) -> Predicate:
+        """
+        Compile une condition WHERE en prédicat
+
+        Les conditions simples peuvent être combinées avec AND, OR, NOT et des
+        parenthèses. L'évaluation est court-circuitée et, dans chaque groupe,
+        les conditions les moins coûteuses (présence d'attribut) sont testées
+        avant les plus coûteuses (text, regex, parent).
+
+        Args:
+            condition_args: Tokens de la condition, ex: ["class", "CONTAINS", "\\"active\\""],
+                            ["attr", "href", "NOT", "NULL"], ["parent", "div", "class", "CONTAINS", "x"],
+                            ["href", "NOT", "NULL", "AND", "(", "text", "CONTAINS", "a", "OR", ...]
+
+        Returns:
+            Fonction élément -> bool, à appeler pour chaque élément filtré
+        """
+        return cls.compile_tree(cls.parse(condition_args))
+
+    @staticmethod
+    def find_first(elements: Sequence[Tag], predicate: Predicate) -> Tuple[Optional[Tag], int]:
+        """
+        Cherche le premier élément vérifiant le prédicat, sans copier la séquence
+
+        Returns:
+            (élément ou None, index 0-based de l'élément ou -1)
+        """
+        for index, element in enumerate(elements):
+            if predicate(element):
+                return element, index
+        return None, -1
+
+    @staticmethod
+    def find_last(elements: Sequence[Tag], predicate: Predicate) -> Tuple[Optional[Tag], int]:
+        """
+        Cherche le dernier élément vérifiant le prédicat en parcourant la séquence à rebours
+
+        Returns:
+            (élément ou None, index 0-based de l'élément ou -1)
+        """
+        index = len(elements)
+        for element in reversed(elements):
+            index -= 1
+            if predicate(element):
+                return element, index
+        return None, -1
+
+    @staticmethod
+    def find_nth(elements: Sequence[Tag], predicate: Predicate, n: int) -> Tuple[Optional[Tag], int]:
+        """
+        Cherche la n-ième correspondance (1-based) et s'arrête dès qu'elle est atteinte
+
+        Returns:
+            (n-ième élément, n) si elle existe, sinon (dernière correspondance ou None, nombre de correspondances)
+        """
+        found = 0
+        element = None
+        for element in filter(predicate, elements):
+            found += 1
+            if found == n:
+                return element, found
+        return (element if found else None), found
@@ -0,0 +1,163 @@
+"""
+Moteur positionnel partagé par les commandes GET (ATTR, ATTRS, TEXT, DATE)
+Un modificateur ALL, FIRST, LAST, ONCE n ou SLICE a:b choisit les positions voulues;
+seules ces positions sont calculées, les candidats étant parcourus à la demande
+"""
+from itertools import islice
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class Position(NamedTuple):
+    """Positions demandées (1-based, bornes de SLICE incluses)"""
+
+    kind: str = "ALL"
+    start: int = 1
+    stop: Optional[int] = None
+
+    @property
+    def single(self) -> bool:
+        """Vrai si la position désigne un seul élément (FIRST, LAST, ONCE)"""
+        return self.kind in ("FIRST", "LAST", "ONCE")
+
+
+class GetterEngine:
+    """Lecture du modificateur de position et sélection paresseuse des candidats"""
+
+    MODIFIERS = ("ALL", "FIRST", "LAST", "ONCE", "SLICE")
+
+    @staticmethod
+    def _clean_quotes(text: str) -> str:
+        """Supprime les guillemets d'ouverture et de fermeture si présents"""
+        if len(text) >= 2 and ((text.startswith('"') and text.endswith('"')) or (text.startswith("'") and text.endswith("'"))):
+            return text[1:-1]
+        return text
+
+    @staticmethod
+    def _is_index(text: str) -> bool:
+        return text.strip().lstrip('-').isdigit()
+
+    @staticmethod
+    def _index(text: str, command: str) -> int:
+        """Convertit un index 1-based"""
+        try:
+            index = int(text)
+        except ValueError:
+            raise ValueError(f"{command}: L'index doit être un nombre entier, reçu '{text}'")
+        if index < 1:
+            raise ValueError(f"{command}: L'index doit être supérieur à 0, reçu {index}")
+        return index
+
+    @classmethod
+    def _slice(cls, spec: str, command: str) -> Position:
+        """Lit a:b, a: ou :b (1-based, bornes incluses)"""
+        start_text, separator, stop_text = cls._clean_quotes(spec).partition(':')
+        if not separator:
+            raise ValueError(f"{command}: SLICE attend a:b (ex: SLICE 2:5), reçu '{spec}'")
+        start = cls._index(start_text, command) if start_text.strip() else 1
+        stop = cls._index(stop_text, command) if stop_text.strip() else None
+        if stop is not None and stop < start:
+            raise ValueError(f"{command}: SLICE {start}:{stop} vide (la fin précède le début)")
+        return Position("SLICE", start, stop)
+
+    @classmethod
+    def parse_position(cls, args: List[str], command: str) -> Tuple[Position, List[str]]:
+        """
+        Lit le modificateur de position en tête des arguments
+
+        ONCE accepte aussi l'ancienne forme ONCE "tag" n.
+
+        Returns:
+            (position, arguments restants); ALL sans modificateur
+        """
+        if not args or args[0].upper() not in cls.MODIFIERS:
+            return Position(), list(args)
+
+        kind = args[0].upper()
+        rest = list(args[1:])
+
+        if kind == "ONCE":
+            if rest and cls._is_index(rest[0]):
+                return Position("ONCE", cls._index(rest[0], command)), rest[1:]
+            if len(rest) >= 2 and cls._is_index(rest[1]):
+                return Position("ONCE", cls._index(rest[1], command)), [rest[0]] + rest[2:]
+            raise ValueError(f"{command}: Index requis après ONCE (ex: ONCE 2)")
+
+        if kind == "SLICE":
+            if not rest:
+                raise ValueError(f"{command}: Bornes requises après SLICE (ex: SLICE 2:5)")
+            return cls._slice(rest[0], command), rest[1:]
+
+        return Position(kind), rest
+
+    @staticmethod
+    def _not_found(command: str, what: str, position: Position, found: int) -> ValueError:
+        if found == 0:
+            return ValueError(f"{command}: Aucun {what} trouvé")
+        return ValueError(f"{command}: Index {position.start} trop élevé ({found} {what} trouvé(s))")
+
+    @classmethod
+    def pick(cls, position: Position, candidates: Iterable[Any], command: str, what: str = "élément",
+             predicate: Optional[Callable[[Any], bool]] = None,
+             backward: Optional[Callable[[], Iterable[Any]]] = None) -> Any:
+        """
+        Sélectionne les positions demandées parmi les candidats qui vérifient le prédicat
+
+        Args:
+            position: Positions demandées
+            candidates: Séquence (accès direct sans prédicat) ou itérable paresseux en ordre document
+            command: Nom de la commande pour les messages d'erreur
+            what: Description des éléments cherchés pour les messages d'erreur
+            predicate: Garde seulement les candidats qui le vérifient, évalué à la demande
+            backward: Fabrique des candidats en ordre inverse (LAST sans parcours complet)
+
+        Returns:
+            Liste pour ALL et SLICE, élément seul pour FIRST, LAST et ONCE
+
+        Raises:
+            ValueError: Si la position unique demandée n'existe pas
+        """
+        kind = position.kind
+
+        # Séquence sans filtre: accès direct aux positions (O(1) pour FIRST, LAST, ONCE)
+        if predicate is None and isinstance(candidates, Sequence):
+            if kind == "ALL":
+                return list(candidates)
+            if kind == "SLICE":
+                return list(candidates[position.start - 1:position.stop])
+            index = {"FIRST": 0, "LAST": len(candidates) - 1, "ONCE": position.start - 1}[kind]
+            if not 0 <= index < len(candidates):
+                raise cls._not_found(command, what, position, len(candidates))
+            return candidates[index]
+
+        def matching(items: Iterable[Any]) -> Iterable[Any]:
+            return filter(predicate, items) if predicate is not None else iter(items)
+
+        if kind == "ALL":
+            return list(matching(candidates))
+        if kind == "SLICE":
+            return list(islice(matching(candidates), position.start - 1, position.stop))
+
+        if kind == "LAST":
+            if backward is None and isinstance(candidates, Sequence):
+                backward = lambda: reversed(candidates)
+            if backward is not None:
+                element = next(matching(backward()), None)
+                if element is None:
+                    raise cls._not_found(command, what, position, 0)
+                return element
+            found = 0
+            element = None
+            for element in matching(candidates):
+                found += 1
+            if not found:
+                raise cls._not_found(command, what, position, 0)
+            return element
+
+        # FIRST et ONCE n: parcours arrêté à la n-ième correspondance
+        wanted = 1 if kind == "FIRST" else position.start
+        found = 0
+        for element in matching(candidates):
+            found += 1
+            if found == wanted:
+                return element
+        raise cls._not_found(command, what, position, found)
@@ -0,0 +1,105 @@
+"""
+Écriture JSON Lines en ajout (JSON ... APPEND)
+Les fichiers restent ouverts pendant l'exécution du script, chaque élément est
+sérialisé seul et les lignes sont écrites par blocs; tout est vidé en fin de script
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel: repli sur le module json de la bibliothèque standard
+    orjson = None
+
+
+class JsonLinesSink:
+    """Fichiers JSON Lines ouverts par l'exécution en cours, avec tampon d'écriture"""
+
+    # Taille du tampon (en octets) au-delà de laquelle un fichier est écrit sur disque
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, buffer_size: Optional[int] = None):
+        self.buffer_size = buffer_size or self.BUFFER_SIZE
+        # Chemin absolu -> fichier ouvert, lignes en attente et leur taille
+        self._handles: Dict[str, Any] = {}
+        self._pending: Dict[str, List[bytes]] = {}
+        self._sizes: Dict[str, int] = {}
+
+    @staticmethod
+    def dumps(item: Any) -> bytes:
+        """Sérialise un élément sur une ligne (orjson si disponible)"""
+        if orjson is not None:
+            try:
+                return orjson.dumps(item)
+            except TypeError:
+                # Types qu'orjson refuse (clés non textuelles, entiers hors 64 bits...): module json
+                pass
+        return json.dumps(item, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+    def append(self, path: Path, items: Iterable[Any]) -> int:
+        """
+        Ajoute une ligne par élément à la fin du fichier
+
+        Returns:
+            Nombre de lignes ajoutées
+        """
+        key = str(path.absolute())
+        if key not in self._handles:
+            self._handles[key] = open(path, 'ab')
+            self._pending[key] = []
+            self._sizes[key] = 0
+
+        pending = self._pending[key]
+        count = 0
+        for item in items:
+            line = self.dumps(item) + b'\n'
+            pending.append(line)
+            self._sizes[key] += len(line)
+            count += 1
+            if self._sizes[key] >= self.buffer_size:
+                self._write(key)
+        return count
+
+    def _write(self, key: str) -> None:
+        """Écrit les lignes en attente d'un fichier"""
+        pending = self._pending[key]
+        if pending:
+            self._handles[key].writelines(pending)
+            pending.clear()
+            self._sizes[key] = 0
+
+    def release(self, path: Path) -> None:
+        """Vide et ferme un fichier (avant qu'il soit réécrit autrement)"""
+        key = str(path.absolute())
+        if key in self._handles:
+            self._write(key)
+            self._handles.pop(key).close()
+            del self._pending[key]
+            del self._sizes[key]
+
+    def flush(self) -> None:
+        """Écrit les lignes en attente de tous les fichiers"""
+        for key in self._handles:
+            self._write(key)
+            self._handles[key].flush()
+
+    def close(self) -> None:
+        """Vide et ferme tous les fichiers"""
+        for key in list(self._handles):
+            self.release(Path(key))
+
+    @classmethod
+    def for_run(cls, variables: Dict[str, Any]) -> 'JsonLinesSink':
+        """Sink de l'exécution en cours (créé au premier JSON ... APPEND)"""
+        sink = variables.get('_json_sink')
+        if sink is None:
+            sink = variables['_json_sink'] = cls()
+        return sink
+
+    @staticmethod
+    def close_run(variables: Dict[str, Any]) -> None:
+        """Vide et ferme les fichiers de l'exécution (fin de script)"""
+        sink = variables.pop('_json_sink', None)
+        if sink is not None:
+            sink.close()
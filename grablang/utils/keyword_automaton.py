@@ -0,0 +1,243 @@
+"""
+Recherche d'un dictionnaire de mots-clés (EXTRACT KEYWORDS, FILTER ... CONTAINS ANY)
+Automate d'Aho-Corasick construit une fois par fichier et mis en cache sur disque,
+indexé par l'empreinte SHA-256 du contenu du fichier
+"""
+import hashlib
+import json
+import os
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .text_normalizer import TextNormalizer
+
+
+class KeywordAutomaton:
+    """
+    Automate d'Aho-Corasick sur des mots-clés insensibles à la casse
+
+    Le texte est parcouru une seule fois, quel que soit le nombre de mots-clés.
+    Seuls les mots entiers sont retenus: « LG » ne correspond pas dans « algorithme ».
+    """
+
+    # Version du format sérialisé (à incrémenter si la structure change)
+    FORMAT_VERSION = 2
+    # Dossier du cache disque des automates
+    CACHE_DIR = Path.home() / ".cache" / "grablang" / "keywords"
+
+    # Automates déjà chargés: (chemin, date de modification, taille) -> automate
+    _loaded: Dict[Tuple[str, int, int], 'KeywordAutomaton'] = {}
+
+    def __init__(self, keywords: List[str]):
+        # Mots-clés tels qu'écrits dans le fichier (le premier l'emporte pour les doublons)
+        self.keywords: List[str] = []
+        self.lengths: List[int] = []
+        # Transitions, lien d'échec et sorties (indices de mots-clés) de chaque état
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[Tuple[int, ...]] = [()]
+
+        seen = set()
+        for keyword in keywords:
+            key = self.fold(keyword)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            self._insert(key, len(self.keywords))
+            self.keywords.append(keyword)
+            self.lengths.append(len(key))
+
+        self._link()
+
+    @staticmethod
+    def fold(text: str) -> str:
+        """Minuscules caractère par caractère, sans changer la longueur (les positions restent valides)"""
+        folded = text.lower()
+        if len(folded) == len(text):
+            return folded
+        return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+    def _insert(self, key: str, index: int) -> None:
+        """Ajoute un mot-clé au trie"""
+        state = 0
+        for char in key:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(())
+            state = next_state
+        self.output[state] += (index,)
+
+    def _link(self) -> None:
+        """Calcule les liens d'échec en largeur et fusionne les sorties le long de ces liens"""
+        goto, fail, output = self.goto, self.fail, self.output
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                if output[fail[next_state]]:
+                    output[next_state] += output[fail[next_state]]
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == "_"
+
+    def _at_word_bounds(self, text: str, start: int, end: int) -> bool:
+        """Vrai si la correspondance n'est pas collée à une lettre ou un chiffre voisin"""
+        is_word = self._is_word_char
+        if start > 0 and is_word(text[start]) and is_word(text[start - 1]):
+            return False
+        if end < len(text) and is_word(text[end - 1]) and is_word(text[end]):
+            return False
+        return True
+
+    def find(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Parcourt le texte une fois et produit chaque correspondance en mot entier
+
+        Yields:
+            (position de début, indice du mot-clé), en ordre de fin de correspondance
+        """
+        goto, fail, output, lengths = self.goto, self.fail, self.output, self.lengths
+        root = goto[0]
+        folded = self.fold(text)
+        state = 0
+        for position, char in enumerate(folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0) if state else root.get(char, 0)
+            if output[state]:
+                end = position + 1
+                for index in output[state]:
+                    start = end - lengths[index]
+                    if self._at_word_bounds(folded, start, end):
+                        yield start, index
+
+    def contains_any(self, text: str) -> bool:
+        """Vrai si le texte contient au moins un des mots-clés (arrêt à la première correspondance)"""
+        return bool(text) and next(self.find(text), None) is not None
+
+    @staticmethod
+    def read_keywords(content: str) -> List[str]:
+        """Un mot-clé par ligne; lignes vides et commentaires (#) ignorés, espaces internes réduits"""
+        keywords = []
+        for line in content.splitlines():
+            keyword = TextNormalizer.collapse((line,))
+            if keyword and not keyword.startswith("#"):
+                keywords.append(keyword)
+        return keywords
+
+    def to_data(self) -> Dict[str, Any]:
+        """Tables de l'automate sous forme de données JSON (aucun code n'est sérialisé)"""
+        return {
+            "version": self.FORMAT_VERSION,
+            "keywords": self.keywords,
+            "lengths": self.lengths,
+            "goto": self.goto,
+            "fail": self.fail,
+            "output": [list(indexes) for indexes in self.output],
+        }
+
+    @classmethod
+    def from_data(cls, data: Any) -> Optional['KeywordAutomaton']:
+        """Reconstruit un automate à partir de to_data(), ou None si les tables sont incohérentes"""
+        try:
+            if data["version"] != cls.FORMAT_VERSION:
+                return None
+            automaton = cls.__new__(cls)
+            automaton.keywords = [str(keyword) for keyword in data["keywords"]]
+            automaton.lengths = [int(length) for length in data["lengths"]]
+            automaton.goto = [{str(char): int(state) for char, state in transitions.items()}
+                              for transitions in data["goto"]]
+            automaton.fail = [int(state) for state in data["fail"]]
+            automaton.output = [tuple(int(index) for index in indexes) for indexes in data["output"]]
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+
+        # Les indices doivent rester dans les tables (un fichier modifié à la main est ignoré)
+        states = len(automaton.goto)
+        count = len(automaton.keywords)
+        if (not states or len(automaton.fail) != states or len(automaton.output) != states
+                or len(automaton.lengths) != count
+                or any(not 0 <= state < states for transitions in automaton.goto for state in transitions.values())
+                or any(not 0 <= state < states for state in automaton.fail)
+                or any(not 0 <= index < count for indexes in automaton.output for index in indexes)):
+            return None
+        return automaton
+
+    @classmethod
+    def _cache_path(cls, digest: str) -> Path:
+        return cls.CACHE_DIR / f"{digest}-v{cls.FORMAT_VERSION}.json"
+
+    @classmethod
+    def _load_cached(cls, digest: str) -> Optional['KeywordAutomaton']:
+        """Automate du cache disque, ou None s'il est absent ou illisible"""
+        try:
+            with open(cls._cache_path(digest), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return cls.from_data(data)
+
+    @classmethod
+    def _store_cached(cls, digest: str, automaton: 'KeywordAutomaton') -> None:
+        """Écrit l'automate dans le cache disque (écriture atomique; erreurs ignorées)"""
+        try:
+            cls.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cls.CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(automaton.to_data(), f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, cls._cache_path(digest))
+        except OSError:
+            pass
+
+    @classmethod
+    def load(cls, filename: str, command: str) -> 'KeywordAutomaton':
+        """
+        Automate des mots-clés d'un fichier (un par ligne, UTF-8)
+
+        L'automate est construit une seule fois par contenu de fichier: il est
+        mémorisé pour la session et mis en cache sur disque sous l'empreinte
+        SHA-256 du fichier.
+
+        Raises:
+            ValueError: Si le fichier est introuvable ou ne contient aucun mot-clé
+        """
+        path = Path(filename)
+        try:
+            stat = path.stat()
+        except OSError:
+            raise ValueError(f"{command}: Fichier de mots-clés '{filename}' introuvable")
+
+        session_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        automaton = cls._loaded.get(session_key)
+        if automaton is not None:
+            return automaton
+
+        try:
+            data = path.read_bytes()
+        except OSError as e:
+            raise ValueError(f"{command}: Impossible de lire '{filename}': {e}")
+
+        digest = hashlib.sha256(data).hexdigest()
+        automaton = cls._load_cached(digest)
+        if automaton is None:
+            keywords = cls.read_keywords(data.decode("utf-8-sig", errors="replace"))
+            if not keywords:
+                raise ValueError(f"{command}: Aucun mot-clé dans '{filename}'")
+            automaton = cls(keywords)
+            cls._store_cached(digest, automaton)
+
+        cls._loaded[session_key] = automaton
+        return automaton
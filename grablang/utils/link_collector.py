@@ -0,0 +1,84 @@
+"""
+Collecte des liens d'un ensemble d'éléments (EXTRACT URLS)
+Chaque sous-arbre distinct n'est parcouru qu'une fois et les schémas sont classés par préfixe
+"""
+from itertools import chain
+from string import ascii_letters, digits
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+from .selection import SelectionEngine
+
+
+class LinkCollector:
+    """Liens des attributs HTML, dédoublonnés en ordre document"""
+
+    # Attributs couramment utilisés pour les URLs
+    URL_ATTRIBUTES = ('href', 'src', 'action', 'data-url', 'data-link', 'data-href', 'cite', 'formaction')
+
+    # Table des préfixes (en minuscules): liens non web et ancres simples écartés,
+    # URLs absolues, www. et chemins acceptés
+    REJECTED_PREFIXES = ('javascript:', 'mailto:', 'tel:', 'sms:', 'data:', '#')
+    ACCEPTED_PREFIXES = ('http://', 'https://', 'ftp://', 'www.', '/')
+    # Premier caractère accepté pour les autres liens (relatifs ou autre schéma)
+    RELATIVE_START = frozenset(ascii_letters + digits)
+
+    @classmethod
+    def is_valid(cls, url: str) -> bool:
+        """Vrai pour un lien web ou relatif (pas javascript:, mailto:, #, etc.)"""
+        url = url.lower().strip()
+        if url.startswith(cls.REJECTED_PREFIXES):
+            return False
+        if url.startswith(cls.ACCEPTED_PREFIXES):
+            return True
+        return url[:1] in cls.RELATIVE_START
+
+    @classmethod
+    def attribute_urls(cls, root: Tag) -> List[str]:
+        """Liens valides des attributs de root et de ses descendants, en ordre document"""
+        urls = []
+        attributes = cls.URL_ATTRIBUTES
+
+        for node in chain((root,), root.descendants):
+            if not isinstance(node, Tag):
+                continue
+            attrs = node.attrs
+            if not attrs:
+                continue
+            for attr in attributes:
+                url = attrs.get(attr)
+                if isinstance(url, str) and url.strip() and cls.is_valid(url):
+                    urls.append(url.strip())
+
+        return urls
+
+    @classmethod
+    def collect(cls, elements: Iterable[Tag]) -> List[Tuple[Tag, List[str]]]:
+        """
+        Parcourt une seule fois chaque sous-arbre distinct de l'ensemble
+
+        Les éléments imbriqués dans un autre élément de l'ensemble ne sont pas
+        reparcourus: leurs liens sont déjà ceux de leur ancêtre.
+
+        Returns:
+            Les racines disjointes (en ordre document) avec les liens de leurs attributs
+        """
+        return [(root, cls.attribute_urls(root)) for root in SelectionEngine.outermost_roots(elements)]
+
+    @staticmethod
+    def base_url(document: Optional[BeautifulSoup], page_url: Optional[str] = None) -> Optional[str]:
+        """URL de base d'un document: <base href> (relative à la page) ou URL de la page"""
+        if document is not None:
+            base_tag = document.find('base', href=True)
+            if base_tag is not None:
+                return urljoin(page_url or '', base_tag['href'].strip()) or None
+        return page_url
+
+    @staticmethod
+    def absolute(url: str, base: str) -> str:
+        """Résout un lien relatif contre l'URL de base (www. devient https://www.)"""
+        if url.lower().startswith('www.'):
+            return 'https://' + url
+        return urljoin(base, url)
@@ -0,0 +1,150 @@
+"""
+Tableaux numériques compacts et agrégats (EXTRACT NUMBERS AS, SUM, AVG, MIN, MAX, PERCENTILE)
+Utilise NumPy s'il est installé, sinon le module array de la bibliothèque standard
+"""
+import math
+from array import array
+from numbers import Real
+from typing import Any, Iterable, List, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel: les tableaux sont alors des array('d') / array('q')
+    np = None
+
+
+Number = Union[int, float]
+
+
+class NumericArray:
+    """Construction et reconnaissance des tableaux de nombres"""
+
+    # Type demandé -> (code du module array, dtype NumPy)
+    KINDS = {
+        "FLOAT": ("d", "float64"),
+        "INT": ("q", "int64"),
+    }
+
+    @classmethod
+    def build(cls, values: Iterable[float], kind: str, command: str = "EXTRACT NUMBERS") -> Any:
+        """
+        Construit un tableau compact à partir de nombres
+
+        Args:
+            values: Nombres (les INT sont tronqués à leur partie entière)
+            kind: FLOAT ou INT
+            command: Nom de la commande pour les messages d'erreur
+
+        Returns:
+            Tableau NumPy si disponible, sinon array('d') ou array('q')
+
+        Raises:
+            ValueError: Si un nombre ne tient pas dans un entier 64 bits (INT)
+        """
+        typecode, dtype = cls.KINDS[kind]
+        if kind == "INT":
+            values = (int(value) for value in values)
+        try:
+            if np is not None:
+                return np.fromiter(values, dtype=dtype)
+            return array(typecode, values)
+        except OverflowError:
+            raise ValueError(f"{command}: Nombre hors de la plage int64, utilisez AS FLOAT")
+
+    @staticmethod
+    def is_array(value: Any) -> bool:
+        """Vrai pour un tableau construit par build()"""
+        return isinstance(value, array) or (np is not None and isinstance(value, np.ndarray))
+
+    @staticmethod
+    def to_python(value: Any) -> Any:
+        """Convertit un scalaire NumPy en nombre Python (pour JSON, PRINT et les comparaisons)"""
+        if np is not None and isinstance(value, np.generic):
+            return value.item()
+        return value
+
+
+class Aggregates:
+    """Agrégats calculés en bloc sur un tableau numérique (ou une liste de nombres)"""
+
+    @staticmethod
+    def as_numbers(values: Any, command: str) -> Sequence[Number]:
+        """
+        Prépare les valeurs à agréger: un tableau est utilisé tel quel, une liste
+        (par exemple le résultat de EXTRACT NUMBERS) est convertie en flottants
+
+        Raises:
+            ValueError: Si une valeur n'est pas numérique
+        """
+        if NumericArray.is_array(values):
+            return values
+        if isinstance(values, (str, bytes, dict)) or not hasattr(values, '__iter__'):
+            raise ValueError(f"{command}: Une liste de nombres est attendue, reçu {type(values).__name__}")
+
+        numbers = array("d")
+        for value in values:
+            if isinstance(value, Real):
+                numbers.append(value)
+                continue
+            try:
+                numbers.append(float(str(value).replace(',', '')))
+            except ValueError:
+                raise ValueError(f"{command}: Valeur non numérique '{value}'")
+
+        # Vue NumPy sans copie sur le tampon du tableau, si NumPy est disponible
+        return np.frombuffer(numbers, dtype="float64") if np is not None else numbers
+
+    @staticmethod
+    def _require_values(values: Sequence[Number], command: str) -> None:
+        """Les agrégats autres que SUM n'ont pas de valeur pour un ensemble vide"""
+        if len(values) == 0:
+            raise ValueError(f"{command}: Aucune valeur à agréger")
+
+    @classmethod
+    def sum(cls, values: Sequence[Number]) -> Number:
+        """Somme (0 pour un ensemble vide)"""
+        if np is not None and isinstance(values, np.ndarray):
+            return NumericArray.to_python(values.sum())
+        if isinstance(values, array) and values.typecode == "q":
+            return sum(values)
+        return math.fsum(values)
+
+    @classmethod
+    def avg(cls, values: Sequence[Number]) -> float:
+        """Moyenne arithmétique"""
+        cls._require_values(values, "AVG")
+        if np is not None and isinstance(values, np.ndarray):
+            return float(values.mean())
+        return math.fsum(values) / len(values)
+
+    @classmethod
+    def min(cls, values: Sequence[Number]) -> Number:
+        """Plus petite valeur"""
+        cls._require_values(values, "MIN")
+        if np is not None and isinstance(values, np.ndarray):
+            return NumericArray.to_python(values.min())
+        return min(values)
+
+    @classmethod
+    def max(cls, values: Sequence[Number]) -> Number:
+        """Plus grande valeur"""
+        cls._require_values(values, "MAX")
+        if np is not None and isinstance(values, np.ndarray):
+            return NumericArray.to_python(values.max())
+        return max(values)
+
+    @classmethod
+    def percentile(cls, values: Sequence[Number], q: float) -> float:
+        """Percentile q (0-100) avec interpolation linéaire, comme numpy.percentile"""
+        cls._require_values(values, "PERCENTILE")
+        if not 0 <= q <= 100:
+            raise ValueError(f"PERCENTILE: Le percentile doit être compris entre 0 et 100, reçu {q}")
+        if np is not None and isinstance(values, np.ndarray):
+            return float(np.percentile(values, q))
+
+        ordered: List[Number] = sorted(values)
+        position = (len(ordered) - 1) * q / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        fraction = position - lower
+        return float(ordered[lower] + (ordered[upper] - ordered[lower]) * fraction)
@@ -0,0 +1,65 @@
+"""
+Recherche directe dans le corps brut de la réponse chargée par LOAD (mode RAW)
+Les motifs sont compilés en bytes et parcourent le corps sans copie ni arbre HTML;
+seules les correspondances sont décodées
+"""
+import re
+from typing import Any, Dict, Pattern
+
+from .regex_cache import Patterns, RegexCache
+
+
+class RawBody:
+    """Accès au corps brut (_raw_body) et recherche de motifs bytes dessus"""
+
+    # Équivalents bytes des motifs intégrés (\d, \w, \s et \b y sont ASCII)
+    EMAIL = re.compile(Patterns.EMAIL.pattern.encode('ascii'))
+    URL = re.compile(Patterns.URL.pattern.encode('ascii'))
+    NUMBER = re.compile(Patterns.NUMBER.pattern.encode('ascii'))
+
+    # Encodage utilisé quand la réponse n'en déclare pas
+    DEFAULT_ENCODING = 'utf-8'
+
+    @staticmethod
+    def get(variables: Dict[str, Any], command: str) -> memoryview:
+        """
+        Retourne une vue sans copie du corps brut chargé par LOAD URL ... RAW
+
+        Sans corps brut (LOAD URL sans RAW, document choisi avec USE), le document
+        courant est resérialisé en UTF-8.
+
+        Raises:
+            ValueError: Si aucune page n'est chargée
+        """
+        body = variables.get('_raw_body')
+        if body is not None:
+            return memoryview(body)
+        document = variables.get('_original_html')
+        if document is None:
+            raise ValueError(f"{command}: Aucune page chargée. Utilisez d'abord LOAD URL \"...\" (ou LOAD URL \"...\" RAW)")
+        return memoryview(str(document).encode('utf-8'))
+
+    @classmethod
+    def encoding(cls, variables: Dict[str, Any]) -> str:
+        """Encodage du corps brut (déclaré par la réponse, sinon UTF-8, comme le document resérialisé)"""
+        if variables.get('_raw_body') is None:
+            return 'utf-8'
+        return variables.get('_raw_encoding') or cls.DEFAULT_ENCODING
+
+    @staticmethod
+    def compile(pattern: str, flags: int = 0) -> Pattern:
+        """
+        Compile un motif texte en motif bytes (via le cache partagé)
+
+        Les caractères non ASCII du motif sont encodés en UTF-8: ils fonctionnent
+        comme littéraux, pas à l'intérieur d'une classe de caractères (. y correspond à un octet).
+
+        Raises:
+            re.error: Si l'expression régulière est invalide
+        """
+        return RegexCache.compile(pattern.encode('utf-8'), flags)
+
+    @staticmethod
+    def decode(value: bytes, encoding: str) -> str:
+        """Décode une correspondance (octets invalides remplacés)"""
+        return value.decode(encoding, errors='replace')
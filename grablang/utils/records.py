@@ -0,0 +1,132 @@
+"""
+Résultats tabulaires compacts (EXTRACT TABLE, GET ATTRS)
+Les valeurs sont stockées par colonne ou en tuples partageant les mêmes noms de
+champs, sans objet par cellule; JSON les écrit en enregistrements (une ligne =
+un objet) ou en colonnes
+"""
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+class ColumnTable:
+    """Table stockée en colonnes: un nom et une liste de valeurs par colonne"""
+
+    __slots__ = ("names", "columns")
+
+    def __init__(self, names: List[str], columns: List[List[Any]]):
+        self.names = names
+        self.columns = columns
+
+    def __len__(self) -> int:
+        """Nombre de lignes"""
+        return len(self.columns[0]) if self.columns else 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Parcourt les lignes sous forme de dicts (FOR ligne IN table)"""
+        names = self.names
+        for row in zip(*self.columns):
+            yield dict(zip(names, row))
+
+    def __repr__(self) -> str:
+        return f"ColumnTable({len(self)} ligne(s) x {len(self.names)} colonne(s): {', '.join(self.names)})"
+
+    def column(self, name: str) -> List[Any]:
+        """Valeurs d'une colonne"""
+        try:
+            return self.columns[self.names.index(name)]
+        except ValueError:
+            raise ValueError(f"Colonne '{name}' inconnue. Colonnes: {', '.join(self.names)}")
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Une ligne = un dict {colonne: valeur}"""
+        return list(self)
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Un dict {colonne: [valeurs]}"""
+        return dict(zip(self.names, self.columns))
+
+
+class Record:
+    """Une ligne: noms de champs partagés et tuple de valeurs (None pour une valeur absente)"""
+
+    __slots__ = ("names", "values")
+
+    def __init__(self, names: Tuple[str, ...], values: Tuple[Any, ...]):
+        self.names = names
+        self.values = values
+
+    def __getitem__(self, key: Union[str, int]) -> Any:
+        """Valeur par nom de champ ou par position"""
+        if isinstance(key, int):
+            return self.values[key]
+        try:
+            return self.values[self.names.index(key)]
+        except ValueError:
+            raise KeyError(key)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Valeur d'un champ (default s'il n'existe pas ou vaut None)"""
+        if name not in self.names:
+            return default
+        value = self[name]
+        return default if value is None else value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Record):
+            return self.names == other.names and self.values == other.values
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self.as_dict())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """La ligne sous forme de dict {champ: valeur}"""
+        return dict(zip(self.names, self.values))
+
+
+class RecordList:
+    """Lignes alignées sur les mêmes champs: un tuple de valeurs par ligne"""
+
+    __slots__ = ("names", "rows")
+
+    def __init__(self, names: Sequence[str], rows: Optional[List[Tuple[Any, ...]]] = None):
+        self.names = tuple(names)
+        self.rows = rows if rows is not None else []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Record]:
+        """Parcourt les lignes (FOR ligne IN liens)"""
+        names = self.names
+        for values in self.rows:
+            yield Record(names, values)
+
+    def __getitem__(self, index: int) -> Record:
+        return Record(self.names, self.rows[index])
+
+    def __repr__(self) -> str:
+        return f"RecordList({len(self)} ligne(s): {', '.join(self.names)})"
+
+    def column(self, name: str) -> List[Any]:
+        """Valeurs d'un champ, alignées sur les lignes"""
+        try:
+            index = self.names.index(name)
+        except ValueError:
+            raise ValueError(f"Champ '{name}' inconnu. Champs: {', '.join(self.names)}")
+        return [values[index] for values in self.rows]
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Une ligne = un dict {champ: valeur}"""
+        names = self.names
+        return [dict(zip(names, values)) for values in self.rows]
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Un dict {champ: [valeurs]}"""
+        columns = list(zip(*self.rows)) if self.rows else [() for _ in self.names]
+        return {name: list(values) for name, values in zip(self.names, columns)}
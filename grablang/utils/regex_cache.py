@@ -0,0 +1,70 @@
+"""
+Cache partagé des expressions régulières compilées
+Utilisé par EXTRACT, FILTER et GET DATE pour ne compiler chaque motif qu'une fois par processus
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Pattern
+
+
+class RegexCache:
+    """Cache LRU borné de motifs compilés, indexé par (motif, flags)"""
+
+    # Nombre maximal de motifs conservés (les moins récemment utilisés sont évincés)
+    MAX_SIZE = 256
+
+    @staticmethod
+    @lru_cache(maxsize=MAX_SIZE)
+    def _compile(pattern: str, flags: int) -> Pattern:
+        return re.compile(pattern, flags)
+
+    @classmethod
+    def compile(cls, pattern: str, flags: int = 0) -> Pattern:
+        """
+        Retourne le motif compilé, depuis le cache si possible
+
+        Raises:
+            re.error: Si l'expression régulière est invalide (les erreurs ne sont pas mises en cache)
+        """
+        return cls._compile(pattern, flags)
+
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """Statistiques du cache: hits, misses, taille courante et taille maximale"""
+        info = cls._compile.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+
+    @classmethod
+    def clear(cls) -> None:
+        """Vide le cache et remet les statistiques à zéro"""
+        cls._compile.cache_clear()
+
+
+class Patterns:
+    """Motifs intégrés, compilés à l'import du module"""
+
+    # Adresses email
+    EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+    # URLs dans le texte: http://, https://, ftp:// et www.
+    URL = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+|ftp://[^\s<>"{}|\\^`\[\]]+|www\.[^\s<>"{}|\\^`\[\]]+\.[a-zA-Z]{2,}')
+    # Ponctuation de fin à retirer des URLs trouvées dans le texte
+    URL_TRAILING_PUNCTUATION = re.compile(r'[.,;:!?)\]}]+$')
+
+    # Nombres entiers et décimaux: 123, 123.45, -123, 1,234.56
+    NUMBER = re.compile(r'-?\d{1,3}(?:,\d{3})*(?:\.\d+)?|-?\d+(?:\.\d+)?')
+
+    # Espaces multiples (nettoyage de texte)
+    WHITESPACE = re.compile(r'\s+')
+
+    # Dates courantes, recherchées sans tenir compte de la casse
+    DATES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\d{1,2}[/-]\d{1,2}[/-]\d{4}',  # DD/MM/YYYY ou MM/DD/YYYY
+        r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',  # YYYY/MM/DD
+        r'\d{1,2}\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{4}',  # DD mois YYYY (français)
+        r'(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+\d{1,2},?\s+\d{4}',  # mois DD, YYYY
+        r'\d{1,2}\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}',  # DD mois YYYY (anglais)
+        r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s+\d{4}',  # mois DD, YYYY
+        r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD (ISO)
+        r'\d{2}:\d{2}:\d{2}',  # HH:MM:SS (time)
+    ))
@@ -0,0 +1,189 @@
+"""
+Moteur de sélection partagé par les sous-commandes SELECT
+Parcourt l'arbre paresseusement pour arrêter la recherche dès que possible
+"""
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, Tag
+
+from .document_cache import DocumentCache
+from .element_list import ElementList
+
+
+# Une portée de recherche: un document/élément unique ou une liste de sous-arbres
+Scope = Union[Tag, List[Tag]]
+
+
+class SelectionEngine:
+    """Sélection d'éléments par nom de balise avec poussée des limites"""
+
+    @staticmethod
+    def outermost_roots(elements: Iterable[Tag]) -> List[Tag]:
+        """
+        Réduit un ensemble d'éléments à ses sous-arbres disjoints, en ordre document
+
+        Les doublons et les éléments contenus dans un autre élément de l'ensemble
+        sont écartés: leurs descendants sont déjà couverts par l'ancêtre.
+        """
+        candidates = [element for element in elements if isinstance(element, Tag)]
+        ids = {id(element) for element in candidates}
+
+        roots = []
+        seen = set()
+        for element in candidates:
+            if id(element) in seen:
+                continue
+            seen.add(id(element))
+            parent = element.parent
+            while parent is not None and id(parent) not in ids:
+                parent = parent.parent
+            if parent is None:
+                roots.append(element)
+
+        # Ordre document via la position source (html.parser), sinon ordre reçu
+        if all(root.sourceline is not None for root in roots):
+            roots.sort(key=lambda root: (root.sourceline, root.sourcepos or 0))
+        return roots
+
+    @staticmethod
+    def _roots(scope: Scope) -> List[Tag]:
+        """Normalise une portée en liste de racines"""
+        if isinstance(scope, Tag):
+            return [scope]
+        return scope
+
+    @classmethod
+    def document_of(cls, scope: Scope) -> Optional[BeautifulSoup]:
+        """Retourne le document contenant la portée (None s'il est inconnu)"""
+        roots = cls._roots(scope)
+        if not roots:
+            return None
+        node = roots[0]
+        while node.parent is not None:
+            node = node.parent
+        return node if isinstance(node, BeautifulSoup) else None
+
+    @classmethod
+    def iter_matches(cls, scope: Scope, tag: str) -> Iterator[Tag]:
+        """Itère paresseusement sur les descendants nommés tag, en ordre document"""
+        for root in cls._roots(scope):
+            for node in root.descendants:
+                if isinstance(node, Tag) and node.name == tag:
+                    yield node
+
+    @classmethod
+    def iter_matches_reversed(cls, scope: Scope, tag: str) -> Iterator[Tag]:
+        """Itère sur les descendants nommés tag, en ordre document inverse"""
+        for root in reversed(cls._roots(scope)):
+            # Descend jusqu'au dernier nœud du sous-arbre (dernier en ordre document)
+            node = root
+            while isinstance(node, Tag) and node.contents:
+                node = node.contents[-1]
+
+            # Remonte la chaîne previous_element jusqu'à la racine (exclue)
+            while node is not None and node is not root:
+                if isinstance(node, Tag) and node.name == tag:
+                    yield node
+                node = node.previous_element
+
+    @staticmethod
+    def _indexed(scope: Scope, tag: str) -> Optional[ElementList]:
+        """Retourne la liste indexée des éléments tag si le document en possède une"""
+        if not isinstance(scope, BeautifulSoup):
+            return None
+        cache = DocumentCache.peek(scope)
+        if cache is None:
+            return None
+        return cache.tag_index.get(tag)
+
+    @classmethod
+    def matches(cls, scope: Scope, tag: str) -> Iterable[Tag]:
+        """Éléments tag en ordre document: liste indexée si le document en possède une, sinon parcours paresseux"""
+        indexed = cls._indexed(scope, tag)
+        return indexed if indexed is not None else cls.iter_matches(scope, tag)
+
+    @classmethod
+    def select_all(cls, scope: Scope, tag: str) -> ElementList:
+        """Sélectionne tous les éléments et alimente l'index de balises du document"""
+        indexed = cls._indexed(scope, tag)
+        if indexed is not None:
+            # Copie pour que l'appelant ne modifie pas l'index
+            return indexed.copy()
+
+        document = cls.document_of(scope)
+
+        if not isinstance(scope, Tag):
+            # Sous-arbres disjoints: la concaténation reste en ordre document
+            return ElementList(cls.iter_matches(scope, tag), document)
+
+        elements = ElementList(scope.find_all(tag), document)
+        if isinstance(scope, BeautifulSoup):
+            DocumentCache.for_document(scope).tag_index[tag] = elements.copy()
+        return elements
+
+    @classmethod
+    def select_first(cls, scope: Scope, tag: str) -> Optional[Tag]:
+        """Sélectionne le premier élément (arrêt au premier trouvé)"""
+        indexed = cls._indexed(scope, tag)
+        if indexed is not None:
+            return indexed[0] if indexed else None
+        return next(cls.iter_matches(scope, tag), None)
+
+    @classmethod
+    def select_nth(cls, scope: Scope, tag: str, index: int) -> Tuple[Optional[Tag], int]:
+        """
+        Sélectionne le n-ième élément (1-based) en arrêtant le parcours après n correspondances
+
+        Returns:
+            (élément ou None, nombre de correspondances parcourues)
+        """
+        indexed = cls._indexed(scope, tag)
+        if indexed is not None:
+            if index <= len(indexed):
+                return indexed[index - 1], index
+            return None, len(indexed)
+
+        elements = list(islice(cls.iter_matches(scope, tag), index))
+        if len(elements) < index:
+            return None, len(elements)
+        return elements[-1], index
+
+    @classmethod
+    def select_last(cls, scope: Scope, tag: str) -> Optional[Tag]:
+        """Sélectionne le dernier élément en parcourant l'arbre à rebours"""
+        indexed = cls._indexed(scope, tag)
+        if indexed is not None:
+            return indexed[-1] if indexed else None
+        return next(cls.iter_matches_reversed(scope, tag), None)
+
+    @classmethod
+    def select_many(cls, scope: Scope, fields: Dict[str, str]) -> Dict[str, ElementList]:
+        """
+        Évalue plusieurs sélecteurs en un seul parcours de l'arbre
+
+        Args:
+            scope: Document, élément ou liste de sous-arbres à parcourir
+            fields: Correspondance nom de champ -> nom de balise
+
+        Returns:
+            Correspondance nom de champ -> éléments trouvés, en ordre document
+        """
+        # Un seul test par nœud: nom de balise -> liste partagée par les champs
+        matches_by_tag: Dict[str, List[Tag]] = {tag: [] for tag in fields.values()}
+
+        for root in cls._roots(scope):
+            for node in root.descendants:
+                if isinstance(node, Tag):
+                    matches = matches_by_tag.get(node.name)
+                    if matches is not None:
+                        matches.append(node)
+
+        # Le parcours était complet: alimente l'index de balises du document
+        document = cls.document_of(scope)
+        if isinstance(scope, BeautifulSoup):
+            tag_index = DocumentCache.for_document(scope).tag_index
+            for tag, matches in matches_by_tag.items():
+                tag_index[tag] = ElementList(matches, document)
+
+        return {field: ElementList(matches_by_tag[tag], document) for field, tag in fields.items()}
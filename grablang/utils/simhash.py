@@ -0,0 +1,212 @@
+"""
+Détection de pages quasi identiques (SKIP IF DUPLICATE)
+Empreinte SimHash 64 bits du texte de la page et index par bandes: une page à
+distance de Hamming <= d d'une page déjà vue partage forcément une bande avec elle
+"""
+import hashlib
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .raw_body import RawBody
+from .regex_cache import RegexCache
+from .text_normalizer import TextNormalizer
+from .text_stream import TextStream
+
+
+class SimHash:
+    """Empreinte SimHash du texte d'une page"""
+
+    BITS = 64
+    MASK = (1 << BITS) - 1
+    # Nombre de mots par fragment (shingle) haché
+    SHINGLE = 3
+    # Mots du texte (insensibles à la casse)
+    WORD = re.compile(r'\w+')
+    # Balises et contenus non textuels du corps brut (LOAD URL "..." RAW)
+    RAW_SKIPPED = r'<(script|style|template)\b.*?</\1\s*>|<!--.*?-->|<[^>]*>'
+
+    @classmethod
+    def _hash(cls, shingle: str) -> int:
+        """Hash 64 bits stable d'un fragment (identique d'une exécution à l'autre)"""
+        return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    @classmethod
+    def fingerprint(cls, text: str) -> int:
+        """
+        Empreinte SimHash d'un texte
+
+        Chaque fragment de SHINGLE mots consécutifs vote pour les bits de son hash,
+        pondéré par son nombre d'occurrences; un bit de l'empreinte vaut 1 si la
+        majorité des votes l'a mis à 1. Des textes proches ont des empreintes proches.
+        """
+        words = cls.WORD.findall(text.lower())
+        size = min(cls.SHINGLE, len(words)) or 1
+        shingles = Counter(" ".join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1)))
+
+        votes = [0] * cls.BITS
+        for shingle, weight in shingles.items():
+            value = cls._hash(shingle)
+            for bit in range(cls.BITS):
+                if value >> bit & 1:
+                    votes[bit] += weight
+                else:
+                    votes[bit] -= weight
+
+        fingerprint = 0
+        for bit, vote in enumerate(votes):
+            if vote > 0:
+                fingerprint |= 1 << bit
+        return fingerprint
+
+    @staticmethod
+    def distance(first: int, second: int) -> int:
+        """Distance de Hamming entre deux empreintes"""
+        return bin(first ^ second).count('1')
+
+    @classmethod
+    def page_text(cls, variables: Dict[str, Any], command: str) -> Tuple[Any, str]:
+        """
+        Texte de la page courante: document HTML chargé, sinon corps brut sans balises
+
+        Returns:
+            (objet source, texte) - la source identifie la page pour le cache d'empreinte
+        """
+        document = variables.get('_original_html')
+        if document is not None:
+            return document, TextNormalizer.collapse(TextStream.element_chunks(document))
+
+        body = RawBody.get(variables, command)
+        text = RawBody.decode(bytes(body), RawBody.encoding(variables))
+        skipped = RegexCache.compile(cls.RAW_SKIPPED, re.IGNORECASE | re.DOTALL)
+        return variables['_raw_body'], skipped.sub(' ', text)
+
+    @classmethod
+    def of_page(cls, variables: Dict[str, Any], command: str) -> Tuple[Any, int]:
+        """
+        Empreinte de la page courante, calculée une seule fois par page chargée
+
+        Returns:
+            (objet source de la page, empreinte)
+        """
+        cached = variables.get('_fingerprint')
+        source = variables.get('_original_html')
+        if source is None:
+            source = variables.get('_raw_body')
+        if cached is not None and source is not None and cached[0] is source:
+            return cached
+
+        source, text = cls.page_text(variables, command)
+        variables['_fingerprint'] = (source, cls.fingerprint(text))
+        return variables['_fingerprint']
+
+
+class SimHashIndex:
+    """
+    Index des empreintes déjà vues, interrogé par bandes de bits
+
+    Avec une distance maximale d, l'empreinte est découpée en d + 1 bandes: deux
+    empreintes à distance <= d ont au moins une bande identique, donc seules les
+    empreintes partageant une bande sont comparées.
+    Avec un fichier, l'index est relu au démarrage et chaque nouvelle page y est
+    ajoutée (une ligne « empreinte hexadécimale<TAB>étiquette »).
+    """
+
+    DEFAULT_DISTANCE = 3
+    MAX_DISTANCE = 16
+
+    def __init__(self, distance: int = DEFAULT_DISTANCE, path: Optional[str] = None):
+        if not 0 <= distance <= self.MAX_DISTANCE:
+            raise ValueError(f"Distance {distance} invalide (0 à {self.MAX_DISTANCE})")
+        self.distance = distance
+        self.path = Path(path) if path else None
+
+        # Bandes: (décalage, masque) couvrant les 64 bits
+        count = distance + 1
+        width, extra = divmod(SimHash.BITS, count)
+        self.bands: List[Tuple[int, int]] = []
+        shift = 0
+        for index in range(count):
+            size = width + (1 if index < extra else 0)
+            self.bands.append((shift, (1 << size) - 1))
+            shift += size
+
+        # Par bande: valeur de la bande -> empreintes
+        self.buckets: List[Dict[int, List[int]]] = [{} for _ in self.bands]
+        self.labels: Dict[int, str] = {}
+        # Dernière page ajoutée (document ou corps brut) et itération de boucle où elle l'a été:
+        # un second SKIP sur la même page dans la même itération ne la compare pas à elle-même
+        self.last_source: Any = None
+        self.last_iteration: Any = None
+
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def _load(self) -> None:
+        """Relit les empreintes enregistrées (lignes invalides ignorées)"""
+        with open(self.path, 'r', encoding='utf-8') as handle:
+            for line in handle:
+                value, _, label = line.rstrip('\n').partition('\t')
+                try:
+                    self._insert(int(value, 16), label)
+                except ValueError:
+                    continue
+
+    def _insert(self, fingerprint: int, label: str) -> None:
+        if fingerprint in self.labels:
+            return
+        self.labels[fingerprint] = label
+        for bucket, (shift, mask) in zip(self.buckets, self.bands):
+            bucket.setdefault(fingerprint >> shift & mask, []).append(fingerprint)
+
+    def nearest(self, fingerprint: int) -> Optional[Tuple[str, int]]:
+        """
+        Page déjà vue la plus proche dans la distance maximale
+
+        Returns:
+            (étiquette, distance) ou None si aucune page n'est assez proche
+        """
+        if fingerprint in self.labels:
+            return self.labels[fingerprint], 0
+
+        best = None
+        seen = set()
+        for bucket, (shift, mask) in zip(self.buckets, self.bands):
+            for candidate in bucket.get(fingerprint >> shift & mask, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = SimHash.distance(fingerprint, candidate)
+                if distance <= self.distance and (best is None or distance < best[1]):
+                    best = (self.labels[candidate], distance)
+        return best
+
+    def add(self, fingerprint: int, label: str = "", source: Any = None, iteration: Any = None) -> None:
+        """Ajoute une page (et l'enregistre dans le fichier de l'index s'il y en a un)"""
+        self.last_source = source
+        self.last_iteration = iteration
+        if fingerprint in self.labels:
+            return
+        self._insert(fingerprint, label)
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as handle:
+                handle.write(f"{fingerprint:016x}\t{label}\n")
+
+    def added_in(self, source: Any, iteration: Any) -> bool:
+        """Vrai si cette page vient d'être ajoutée pendant cette même itération"""
+        return source is not None and self.last_source is source and self.last_iteration == iteration
+
+    @classmethod
+    def for_run(cls, variables: Dict[str, Any], distance: int, path: Optional[str]) -> 'SimHashIndex':
+        """Index de l'exécution en cours pour cette distance et ce fichier (créé au premier appel)"""
+        indexes = variables.setdefault('_duplicate_indexes', {})
+        key = (distance, str(Path(path).resolve()) if path else None)
+        index = indexes.get(key)
+        if index is None:
+            index = indexes[key] = cls(distance, path)
+        return index
@@ -0,0 +1,243 @@
+"""
+Données structurées d'une page (EXTRACT JSONLD, EXTRACT MICRODATA)
+Les blocs sont repérés par un balayage en octets du corps brut, sans arbre HTML;
+le JSON est décodé avec orjson s'il est installé, sinon avec le module json
+"""
+import html
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson est optionnel: repli sur le module json de la bibliothèque standard
+    orjson = None
+
+from .raw_body import RawBody
+from .regex_cache import RegexCache
+from .text_normalizer import TextNormalizer
+
+
+class StructuredData:
+    """Balayage des blocs JSON-LD et des éléments microdata"""
+
+    # <script type="application/ld+json"> ... </script>
+    JSONLD_SCRIPT = re.compile(
+        rb'<script\b[^>]*?\btype\s*=\s*["\']?\s*application/ld\+json\s*["\']?[^>]*>(.*?)</script\s*>',
+        re.IGNORECASE | re.DOTALL,
+    )
+    # Enveloppes parfois laissées autour du JSON (<!-- -->, CDATA)
+    JSON_WRAPPERS = re.compile(rb'^\s*(?:<!--|<!\[CDATA\[)|(?:-->|\]\]>)\s*$')
+
+    # Balises ouvrantes/fermantes, commentaires et déclarations
+    TAG = re.compile(rb'<!--.*?-->|<([/!?]?)([a-zA-Z][a-zA-Z0-9:-]*)((?:"[^"]*"|\'[^\']*\'|[^\'">])*)>', re.DOTALL)
+    ATTRIBUTE = re.compile(rb'([^\s"\'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+)))?')
+    # Préfiltre: une page sans microdata n'est pas parcourue
+    ITEMSCOPE = re.compile(rb'itemscope', re.IGNORECASE)
+    # Contenu non HTML sauté jusqu'à la balise fermante
+    RAW_TEXT_TAGS = (b'script', b'style', b'template', b'textarea')
+    # Balises sans contenu ni balise fermante
+    VOID_TAGS = frozenset((b'area', b'base', b'br', b'col', b'embed', b'hr', b'img', b'input',
+                           b'link', b'meta', b'param', b'source', b'track', b'wbr'))
+
+    # Balises fermées implicitement par l'ouverture d'une balise sœur de même nom
+    IMPLIED_END_TAGS = frozenset((b'p', b'li', b'dt', b'dd', b'option', b'tr', b'td', b'th'))
+    # Balises de bloc qui ferment implicitement un <p> ouvert
+    CLOSES_PARAGRAPH = frozenset((b'address', b'article', b'aside', b'blockquote', b'div', b'dl', b'fieldset',
+                                  b'footer', b'form', b'h1', b'h2', b'h3', b'h4', b'h5', b'h6', b'header',
+                                  b'hr', b'main', b'nav', b'ol', b'p', b'pre', b'section', b'table', b'ul'))
+
+    # Attribut portant la valeur d'un itemprop selon la balise (sinon le texte de l'élément)
+    VALUE_ATTRIBUTES = {
+        b'meta': 'content',
+        b'audio': 'src', b'embed': 'src', b'iframe': 'src', b'img': 'src',
+        b'source': 'src', b'track': 'src', b'video': 'src',
+        b'a': 'href', b'area': 'href', b'link': 'href',
+        b'object': 'data',
+        b'data': 'value', b'meter': 'value',
+    }
+
+    @staticmethod
+    def source(variables: Dict[str, Any], command: str) -> Tuple[memoryview, str]:
+        """
+        Corps brut chargé par LOAD (vue sans copie) et son encodage
+
+        Sans corps brut (LOAD URL sans RAW, document choisi avec USE), le document
+        courant est resérialisé.
+
+        Raises:
+            ValueError: Si aucune page n'est chargée
+        """
+        return RawBody.get(variables, command), RawBody.encoding(variables)
+
+    @staticmethod
+    def loads(data: bytes, encoding: str) -> Any:
+        """Décode un document JSON (orjson si disponible)"""
+        if orjson is not None:
+            return orjson.loads(data if encoding.lower().replace('_', '-') in ('utf-8', 'utf8') else data.decode(encoding))
+        return json.loads(data.decode(encoding))
+
+    @classmethod
+    def jsonld(cls, body: memoryview, encoding: str) -> Tuple[List[Any], int]:
+        """
+        Objets JSON-LD de la page, dans l'ordre des blocs
+
+        Les tableaux de premier niveau et les @graph sont aplatis en objets.
+
+        Returns:
+            (objets décodés, nombre de blocs illisibles ignorés)
+        """
+        items: List[Any] = []
+        invalid = 0
+        for match in cls.JSONLD_SCRIPT.finditer(body):
+            block = cls.JSON_WRAPPERS.sub(b'', match.group(1))
+            if not block.strip():
+                continue
+            try:
+                data = cls.loads(block, encoding)
+            except ValueError:
+                invalid += 1
+                continue
+            for item in (data if isinstance(data, list) else [data]):
+                if isinstance(item, dict) and isinstance(item.get('@graph'), list):
+                    items.extend(item['@graph'])
+                else:
+                    items.append(item)
+        return items, invalid
+
+    @staticmethod
+    def has_type(item: Any, wanted: str) -> bool:
+        """Vrai si l'objet a le @type demandé (insensible à la casse, préfixe d'URL ignoré)"""
+        if not isinstance(item, dict):
+            return False
+        types = item.get('@type', [])
+        wanted = wanted.lower()
+        for item_type in (types if isinstance(types, list) else [types]):
+            if isinstance(item_type, str) and item_type.lower().rsplit('/', 1)[-1] == wanted:
+                return True
+        return False
+
+    @classmethod
+    def _attributes(cls, raw: bytes, encoding: str) -> Dict[str, Optional[str]]:
+        """Attributs d'une balise ouvrante (valeurs décodées, entités HTML résolues)"""
+        attributes: Dict[str, Optional[str]] = {}
+        for match in cls.ATTRIBUTE.finditer(raw):
+            name = match.group(1).decode('ascii', errors='replace').lower()
+            value = next((group for group in match.groups()[1:] if group is not None), None)
+            if name not in attributes:
+                attributes[name] = html.unescape(RawBody.decode(value, encoding)) if value is not None else None
+        return attributes
+
+    @staticmethod
+    def _finish_text(collectors: List[tuple], encoding: str) -> None:
+        """Complète les valeurs itemprop lues dans le texte d'un élément qui se ferme"""
+        for values, parts, slot in collectors:
+            text = html.unescape(RawBody.decode(b''.join(parts), encoding))
+            values[slot] = TextNormalizer.collapse((text,))
+
+    @classmethod
+    def microdata(cls, body: memoryview, encoding: str) -> List[Dict[str, Any]]:
+        """
+        Items microdata de premier niveau, au format JSON microdata du W3C:
+        {"type": [...], "id": ..., "properties": {nom: [valeurs]}}
+
+        Les balises sont lues une à une avec une pile d'éléments ouverts, sans
+        construire d'arbre; une page sans « itemscope » n'est pas parcourue.
+        """
+        if cls.ITEMSCOPE.search(body) is None:
+            return []
+
+        items: List[Dict[str, Any]] = []
+        # Pile des éléments ouverts: [nom, item ouvert ou None, valeurs texte en attente]
+        stack: List[list] = []
+        position = 0
+        length = len(body)
+
+        def current_item() -> Optional[Dict[str, Any]]:
+            for entry in reversed(stack):
+                if entry[1] is not None:
+                    return entry[1]
+            return None
+
+        def add_text(text: bytes) -> None:
+            for entry in stack:
+                for collector in entry[2]:
+                    collector[1].append(text)
+
+        while position < length:
+            match = cls.TAG.search(body, position)
+            end = match.start() if match else length
+            if end > position and any(entry[2] for entry in stack):
+                add_text(bytes(body[position:end]))
+            if match is None:
+                break
+            position = match.end()
+
+            kind, name = match.group(1), match.group(2)
+            if name is None or kind in (b'!', b'?'):
+                continue
+            name = name.lower()
+
+            if kind == b'/':
+                # Ferme jusqu'à l'élément correspondant (balises implicitement fermées comprises)
+                for index in range(len(stack) - 1, -1, -1):
+                    if stack[index][0] == name:
+                        for entry in stack[index:]:
+                            cls._finish_text(entry[2], encoding)
+                        del stack[index:]
+                        break
+                continue
+
+            if name in cls.RAW_TEXT_TAGS:
+                # Contenu de script/style: saute jusqu'à la balise fermante
+                closing = RegexCache.compile(rb'</' + name + rb'\s*>', re.IGNORECASE).search(body, position)
+                position = closing.end() if closing else length
+                continue
+
+            open_tag = stack[-1][0] if stack else None
+            if (open_tag == name and name in cls.IMPLIED_END_TAGS) or (open_tag == b'p' and name in cls.CLOSES_PARAGRAPH):
+                cls._finish_text(stack.pop()[2], encoding)
+
+            attributes = cls._attributes(match.group(3), encoding)
+            prop_names = (attributes.get('itemprop') or '').split()
+            parent_item = current_item()
+            item = None
+            collectors = []
+
+            if 'itemscope' in attributes:
+                item = {}
+                if attributes.get('itemtype'):
+                    item['type'] = attributes['itemtype'].split()
+                if attributes.get('itemid'):
+                    item['id'] = attributes['itemid'].strip()
+                item['properties'] = {}
+                if not prop_names or parent_item is None:
+                    items.append(item)
+
+            if prop_names and parent_item is not None:
+                attribute = cls.VALUE_ATTRIBUTES.get(name)
+                if item is not None:
+                    value = item
+                elif attribute is not None:
+                    value = attributes.get(attribute) or ''
+                elif name == b'time' and attributes.get('datetime'):
+                    value = attributes['datetime']
+                else:
+                    value = None  # texte de l'élément, connu à sa fermeture
+                for prop_name in prop_names:
+                    values = parent_item['properties'].setdefault(prop_name, [])
+                    values.append(value)
+                    if value is None:
+                        collectors.append((values, [], len(values) - 1))
+
+            if name in cls.VOID_TAGS or match.group(3).rstrip().endswith(b'/'):
+                # Élément sans contenu: une valeur texte est vide
+                cls._finish_text(collectors, encoding)
+            else:
+                stack.append([name, item, collectors])
+
+        # Éléments jamais fermés: leurs valeurs texte sont complétées en fin de document
+        for entry in stack:
+            cls._finish_text(entry[2], encoding)
+
+        return items
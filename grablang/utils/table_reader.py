@@ -0,0 +1,157 @@
+"""
+Lecture d'un tableau HTML en colonnes (EXTRACT TABLE)
+Le tableau est parcouru une seule fois, rowspan/colspan compris, et les en-têtes sont déduits
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bs4 import Tag
+
+from .records import ColumnTable
+from .regex_cache import Patterns
+from .text_normalizer import TextNormalizer
+from .text_stream import TextStream
+
+
+class TableReader:
+    """Conversion d'un <table> en ColumnTable"""
+
+    # Bornes des fusions de cellules (valeurs aberrantes ramenées à ces limites, comme les navigateurs)
+    MAX_COLSPAN = 1000
+    MAX_ROWSPAN = 65534
+    # Sections contenant les lignes
+    SECTION_TAGS = ('thead', 'tbody', 'tfoot')
+    # Séparateur des niveaux d'en-tête (plusieurs lignes dans <thead>)
+    HEADER_SEPARATOR = " / "
+
+    @classmethod
+    def rows(cls, table: Tag) -> Iterator[Tuple[Tag, str]]:
+        """Lignes du tableau en ordre document avec leur section (hors tableaux imbriqués)"""
+        for child in table.children:
+            if not isinstance(child, Tag):
+                continue
+            if child.name == 'tr':
+                yield child, 'tbody'
+            elif child.name in cls.SECTION_TAGS:
+                for row in child.children:
+                    if isinstance(row, Tag) and row.name == 'tr':
+                        yield row, child.name
+
+    @staticmethod
+    def _span(cell: Tag, attribute: str, limit: int) -> int:
+        """Valeur de colspan/rowspan (1 si absente ou invalide)"""
+        try:
+            span = int(str(cell.get(attribute, 1)).strip())
+        except ValueError:
+            return 1
+        return min(max(span, 1), limit)
+
+    @staticmethod
+    def cell_text(cell: Tag) -> Optional[str]:
+        """Texte nettoyé d'une cellule (None si elle est vide)"""
+        return TextNormalizer.collapse(TextStream.element_chunks(cell)) or None
+
+    @classmethod
+    def grid(cls, table: Tag) -> Tuple[List[List[Optional[str]]], int]:
+        """
+        Grille des textes de cellules, les fusions recopiées dans chaque case couverte
+
+        Returns:
+            (lignes de la grille, nombre de lignes d'en-tête en tête de grille)
+        """
+        grid: List[List[Optional[str]]] = []
+        # Colonne -> [lignes restantes, texte] des cellules fusionnées verticalement
+        pending: Dict[int, List[Any]] = {}
+        header_rows = 0
+        in_header = True
+        has_thead = table.find('thead', recursive=False) is not None
+
+        def take_pending(row: List[Optional[str]], column: int) -> None:
+            span = pending[column]
+            row.append(span[1])
+            span[0] -= 1
+            if span[0] == 0:
+                del pending[column]
+
+        for tr, section in cls.rows(table):
+            cells = [cell for cell in tr.children if isinstance(cell, Tag) and cell.name in ('td', 'th')]
+            if not cells and not pending:
+                continue
+
+            row: List[Optional[str]] = []
+            for cell in cells:
+                while len(row) in pending:
+                    take_pending(row, len(row))
+                text = cls.cell_text(cell)
+                rowspan = cls._span(cell, 'rowspan', cls.MAX_ROWSPAN)
+                for _ in range(cls._span(cell, 'colspan', cls.MAX_COLSPAN)):
+                    if rowspan > 1:
+                        pending[len(row)] = [rowspan - 1, text]
+                    row.append(text)
+
+            # Cellules fusionnées depuis les lignes précédentes, au-delà de la dernière cellule
+            for column in sorted(column for column in pending if column >= len(row)):
+                row.extend([None] * (column - len(row)))
+                take_pending(row, column)
+
+            # En-têtes: lignes de <thead>, sinon premières lignes composées uniquement de <th>
+            is_header = section == 'thead' if has_thead else bool(cells) and all(cell.name == 'th' for cell in cells)
+            if in_header and is_header:
+                header_rows += 1
+            else:
+                in_header = False
+            grid.append(row)
+
+        return grid, header_rows
+
+    @staticmethod
+    def header_names(header: List[List[Optional[str]]], width: int) -> List[str]:
+        """Noms de colonnes uniques (niveaux d'en-tête joints, colN pour une colonne sans nom)"""
+        names = []
+        seen: Dict[str, int] = {}
+        for index in range(width):
+            parts = []
+            for row in header:
+                text = row[index] if index < len(row) else None
+                if text and text not in parts:
+                    parts.append(text)
+            name = TableReader.HEADER_SEPARATOR.join(parts) or f"col{index + 1}"
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}_{seen[name]}"
+            else:
+                seen[name] = 1
+            names.append(name)
+        return names
+
+    @staticmethod
+    def typed_column(values: List[Optional[str]]) -> List[Any]:
+        """Convertit une colonne en int ou float si toutes ses valeurs non vides sont numériques"""
+        present = [value for value in values if value is not None]
+        if not present or not all(Patterns.NUMBER.fullmatch(value) for value in present):
+            return values
+        convert = float if any('.' in value for value in present) else int
+        return [convert(value.replace(',', '')) if value is not None else None for value in values]
+
+    @classmethod
+    def read(cls, table: Tag, typed: bool = False) -> ColumnTable:
+        """
+        Lit un tableau en colonnes
+
+        Args:
+            table: Élément <table>
+            typed: Convertit les colonnes numériques en int/float
+
+        Returns:
+            ColumnTable (cellules vides et lignes trop courtes: None)
+        """
+        grid, header_rows = cls.grid(table)
+        width = max((len(row) for row in grid), default=0)
+
+        names = cls.header_names(grid[:header_rows], width) if header_rows else [f"col{index + 1}" for index in range(width)]
+
+        data = grid[header_rows:]
+        columns = [[row[index] if index < len(row) else None for row in data] for index in range(width)]
+        if typed:
+            columns = [cls.typed_column(column) for column in columns]
+
+        return ColumnTable(names, columns)
@@ -0,0 +1,102 @@
+"""
+Cache du texte des éléments partagé par les commandes (FILTER, GET, EXTRACT, PRINT, JSON)
+Le texte est calculé de bas en haut: le texte d'un parent réutilise celui de ses enfants
+"""
+from typing import Any, Dict, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+from .document_cache import DocumentCache
+
+
+class TextCache:
+    """Équivalent mis en cache de element.get_text() et element.get_text(strip=True)"""
+
+    # Chaînes retenues par get_text() pour les balises ordinaires (hors script, style, template)
+    CONTENT_STRING_TYPES = frozenset(Tag.MAIN_CONTENT_STRING_TYPES)
+
+    @staticmethod
+    def _document_of(element: Tag) -> Any:
+        """Remonte jusqu'à la racine de l'arbre contenant l'élément"""
+        root = element
+        while root.parent is not None:
+            root = root.parent
+        return root
+
+    @classmethod
+    def _fill(cls, element: Tag, texts: Dict[int, str], strip: bool) -> str:
+        """
+        Calcule le texte du sous-arbre en post-ordre, sans récursion
+
+        Chaque balise du sous-arbre reçoit son entrée dans le cache; les
+        sous-arbres déjà calculés ne sont pas reparcourus.
+        """
+        content_types = cls.CONTENT_STRING_TYPES
+        stack = [(element, False)]
+
+        while stack:
+            node, children_done = stack.pop()
+
+            if not children_done:
+                if id(node) in texts:
+                    continue
+                stack.append((node, True))
+                for child in node.contents:
+                    if isinstance(child, Tag) and id(child) not in texts:
+                        stack.append((child, False))
+                continue
+
+            parts = []
+            for child in node.contents:
+                if isinstance(child, Tag):
+                    parts.append(texts[id(child)])
+                elif type(child) in content_types:
+                    if strip:
+                        child = child.strip()
+                        if child:
+                            parts.append(child)
+                    else:
+                        parts.append(child)
+            texts[id(node)] = "".join(parts)
+
+        return texts[id(element)]
+
+    @classmethod
+    def text(cls, element: Any, strip: bool = False) -> str:
+        """
+        Retourne le texte d'un élément, comme element.get_text(strip=strip)
+
+        Args:
+            element: Balise, document ou chaîne
+            strip: Supprime les espaces autour de chaque fragment de texte
+
+        Returns:
+            Le texte concaténé du sous-arbre
+        """
+        # Chaînes isolées et balises à types de texte spécifiques (script, style, template)
+        if not isinstance(element, Tag) or element.interesting_string_types != cls.CONTENT_STRING_TYPES:
+            return element.get_text(strip=strip)
+
+        document = cls._document_of(element)
+        if not isinstance(document, BeautifulSoup):
+            # Élément détaché d'un document: pas de cache
+            return element.get_text(strip=strip)
+
+        cache = DocumentCache.for_document(document)
+        texts = cache.stripped_texts if strip else cache.raw_texts
+
+        text = texts.get(id(element))
+        if text is None:
+            text = cls._fill(element, texts, strip)
+        return text
+
+    @classmethod
+    def cached(cls, element: Tag, strip: bool = False) -> Optional[str]:
+        """Texte déjà en cache pour cet élément, sans le calculer (None sinon)"""
+        if element.interesting_string_types != cls.CONTENT_STRING_TYPES:
+            return None
+        cache = DocumentCache.peek(cls._document_of(element))
+        if cache is None:
+            return None
+        texts = cache.stripped_texts if strip else cache.raw_texts
+        return texts.get(id(element))
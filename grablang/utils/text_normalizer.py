@@ -0,0 +1,103 @@
+"""
+Normalisation du texte des éléments (EXTRACT TEXT CLEAN)
+Les espaces sont réduits en un seul passage sur les fragments de texte, sans
+construire puis réécrire le texte complet de chaque élément
+"""
+import unicodedata
+from typing import Any, Dict, Iterable, List
+
+from bs4 import Tag
+
+from .selection import SelectionEngine
+from .text_cache import TextCache
+from .text_stream import TextStream
+
+
+class TextNormalizer:
+    """Réduction des espaces, NFKC et suppression des caractères invisibles"""
+
+    # Caractères de largeur nulle et de mise en forme invisibles (césure conditionnelle,
+    # marques de direction, BOM)
+    ZERO_WIDTH = "\u00ad\u200b\u200c\u200d\u200e\u200f\u2060\u2061\u2062\u2063\u2064\ufeff"
+
+    # Table de suppression pour str.translate: caractères de contrôle (hors espaces,
+    # déjà réduits) et caractères de largeur nulle
+    INVISIBLE_TABLE = dict.fromkeys(
+        [code for code in (*range(0x20), *range(0x7f, 0xa0)) if not chr(code).isspace()]
+        + [ord(char) for char in ZERO_WIDTH]
+    )
+
+    @staticmethod
+    def collapse(chunks: Iterable[str]) -> str:
+        """
+        Équivalent de re.sub(r'\\s+', ' ', ''.join(chunks)).strip() en un seul passage
+
+        Un mot coupé entre deux fragments (ex: 4<b>2</b>0) reste entier.
+        """
+        words: List[str] = []
+        glued = False  # le fragment précédent se termine au milieu d'un mot
+        for chunk in chunks:
+            parts = chunk.split()
+            if not parts:
+                # Un fragment fait uniquement d'espaces termine le mot en cours
+                if chunk:
+                    glued = False
+                continue
+            if glued and not chunk[0].isspace():
+                words[-1] += parts[0]
+                words.extend(parts[1:])
+            else:
+                words.extend(parts)
+            glued = not chunk[-1].isspace()
+        return " ".join(words)
+
+    @classmethod
+    def normalize_chunks(cls, chunks: Iterable[str], nfkc: bool = False, strip_invisible: bool = False) -> str:
+        """
+        Texte normalisé d'un flux de fragments
+
+        Args:
+            chunks: Fragments de texte
+            nfkc: Applique la forme de normalisation Unicode NFKC
+            strip_invisible: Supprime les caractères de contrôle et de largeur nulle
+        """
+        if strip_invisible:
+            table = cls.INVISIBLE_TABLE
+            chunks = (chunk.translate(table) for chunk in chunks)
+
+        text = cls.collapse(chunks)
+
+        # NFKC après réduction: les espaces sont déjà simples; une décomposition
+        # qui introduit un espace (ex: ¨ -> espace + tréma) demande une nouvelle réduction
+        if nfkc and not unicodedata.is_normalized('NFKC', text):
+            text = cls.collapse((unicodedata.normalize('NFKC', text),))
+
+        return text
+
+    @classmethod
+    def normalize_all(cls, elements: Iterable[Any], nfkc: bool = False, strip_invisible: bool = False) -> List[str]:
+        """
+        Texte normalisé de chaque élément d'un ensemble, dans l'ordre reçu
+
+        Un élément présent plusieurs fois n'est normalisé qu'une fois. Si des
+        éléments sont imbriqués, le texte des racines est calculé une fois de bas
+        en haut dans le cache partagé et les éléments intérieurs le réutilisent.
+        """
+        elements = list(elements)
+        tags = [element for element in elements if isinstance(element, Tag)]
+
+        roots = SelectionEngine.outermost_roots(tags)
+        if len(roots) < len({id(tag) for tag in tags}):
+            for root in roots:
+                TextCache.text(root)
+
+        results: Dict[int, str] = {}
+        texts = []
+        for element in elements:
+            text = results.get(id(element))
+            if text is None:
+                text = results[id(element)] = cls.normalize_chunks(
+                    TextStream.element_chunks(element), nfkc, strip_invisible
+                )
+            texts.append(text)
+        return texts
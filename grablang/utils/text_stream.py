@@ -0,0 +1,108 @@
+"""
+Recherche d'expressions régulières sur un flux de fragments de texte
+Évite de construire le texte complet d'une page (get_text(), ' '.join(...)) avant la recherche
+"""
+from typing import Any, Iterable, Iterator, Optional, Pattern
+
+from bs4 import Tag
+
+from .text_cache import TextCache
+
+
+class TextStream:
+    """Fragments de texte d'un élément ou d'une liste, et finditer en flux"""
+
+    # Nombre de caractères gardés en réserve en fin de tampon: une correspondance
+    # qui se termine dans cette zone peut encore s'étendre au fragment suivant
+    MARGIN = 1024
+    # Contexte conservé avant la reprise (\b, lookbehind, ^ en mode MULTILINE)
+    CONTEXT = 64
+
+    @staticmethod
+    def element_chunks(element: Any) -> Iterator[str]:
+        """
+        Fragments de texte d'un élément, dont la concaténation vaut element.get_text()
+
+        Si le texte de l'élément est déjà en cache, il est retourné en un seul fragment.
+        """
+        if not isinstance(element, Tag):
+            yield str(element)
+            return
+
+        text = TextCache.cached(element)
+        if text is not None:
+            yield text
+            return
+
+        # .strings respecte les types de texte de la balise (script, style, template)
+        yield from element.strings
+
+    @staticmethod
+    def item_chunks(items: Iterable[Any], separator: str = ' ') -> Iterator[str]:
+        """Fragments d'une liste, équivalents à separator.join(str(item) for item in items)"""
+        first = True
+        for item in items:
+            if not first:
+                yield separator
+            first = False
+            yield str(item)
+
+    @classmethod
+    def finditer(cls, pattern: Pattern, chunks: Iterable[str], margin: Optional[int] = None) -> Iterator[Any]:
+        """
+        Équivalent de pattern.finditer(''.join(chunks)) sans construire le texte complet
+
+        Seuls un reliquat du fragment précédent et le fragment courant sont en
+        mémoire. Une correspondance qui se termine à moins de `margin` caractères
+        de la fin du tampon est reportée au fragment suivant, ce qui traite les
+        correspondances à cheval sur deux fragments. Le résultat est identique à
+        la recherche sur le texte joint tant que le motif n'a pas besoin de plus
+        de `margin` caractères au-delà de la fin d'une correspondance (ou d'un
+        début de correspondance encore incomplet) pour décider.
+
+        Les positions des correspondances sont relatives à leur tampon: seules
+        les valeurs (group, groups, lastgroup) sont à utiliser.
+        """
+        if margin is None:
+            margin = cls.MARGIN
+
+        buffer = ""
+        base = 0           # Position absolue de buffer[0]
+        scan_from = 0      # Index de reprise de la recherche dans buffer
+        empty_at = -1      # Position absolue de la dernière correspondance vide émise
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            buffer += chunk
+            safe_end = len(buffer) - margin
+            if safe_end <= scan_from:
+                continue
+
+            resume = None
+            last_end = scan_from
+            for match in pattern.finditer(buffer, scan_from):
+                if match.end() > safe_end:
+                    # Peut encore s'étendre avec le fragment suivant: recherche reprise ici
+                    resume = match.start()
+                    break
+                if match.start() == match.end():
+                    if base + match.start() == empty_at:
+                        continue
+                    empty_at = base + match.start()
+                yield match
+                last_end = match.end()
+
+            if resume is None:
+                resume = max(last_end, safe_end)
+
+            # Le tampon ne garde que la zone non parcourue et un peu de contexte
+            keep = max(0, resume - cls.CONTEXT)
+            buffer = buffer[keep:]
+            base += keep
+            scan_from = resume - keep
+
+        for match in pattern.finditer(buffer, scan_from):
+            if match.start() == match.end() and base + match.start() == empty_at:
+                continue
+            yield match
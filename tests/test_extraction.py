@@ -0,0 +1,395 @@
+"""
+Tests pour les commandes EXTRACT et leurs utilitaires partagés
+"""
+
+import gc
+import json
+import tempfile
+import unittest
+import weakref
+from unittest import mock
+import sys
+from pathlib import Path
+
+# Ajoute le répertoire parent au PYTHONPATH pour pouvoir importer grablang
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from grablang.core.interpreter import GrabInterpreter
+from grablang.utils.date_scanner import DateScanner
+from grablang.utils.document_cache import DocumentCache
+from grablang.utils.keyword_automaton import KeywordAutomaton
+from grablang.utils.regex_cache import Patterns, RegexCache
+from grablang.utils.text_stream import TextStream
+
+
+HTML = """
+<html><body>
+  <p class="contact">Écrivez à info@example.com ou Support@Example.com avant le 12 mars 2024.</p>
+  <p class="links">Voir https://example.com/docs, puis www.example.org.</p>
+  <p class="prices">Prix: 1,234.50 EUR, remise -15 et 3 articles</p>
+</body></html>
+"""
+
+
+class TestRegexCache(unittest.TestCase):
+    """Tests pour le cache partagé d'expressions régulières"""
+
+    def setUp(self):
+        RegexCache.clear()
+
+    def test_compiled_once_per_pattern_and_flags(self):
+        """Un même (motif, flags) n'est compilé qu'une fois"""
+        first = RegexCache.compile(r"\d+")
+        self.assertIs(RegexCache.compile(r"\d+"), first)
+        self.assertIsNot(RegexCache.compile(r"\d+", 2), first)
+        self.assertEqual(RegexCache.stats()["hits"], 1)
+        self.assertEqual(RegexCache.stats()["misses"], 2)
+
+    def test_builtin_patterns(self):
+        """Les motifs intégrés sont précompilés"""
+        self.assertEqual(Patterns.NUMBER.findall("1,234.50 et -15"), ["1,234.50", "-15"])
+        self.assertTrue(any(pattern.search("12 MARS 2024") for pattern in Patterns.DATES))
+
+
+class TestTextStream(unittest.TestCase):
+    """Tests pour la recherche en flux sur des fragments de texte"""
+
+    def test_matches_across_chunks(self):
+        """Les correspondances à cheval sur plusieurs fragments sont trouvées une seule fois"""
+        text = "réf 1,234.50 puis contact@example.com et 42"
+        chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+        for pattern in (Patterns.NUMBER, Patterns.EMAIL):
+            expected = pattern.findall(text)
+            found = [match.group() for match in TextStream.finditer(pattern, chunks, margin=32)]
+            self.assertEqual(found, expected)
+
+    def test_element_chunks_match_get_text(self):
+        """Les fragments d'un élément reconstituent get_text()"""
+        soup = BeautifulSoup("<div>Total: 1<b>2</b>34 <script>var x = 5;</script>EUR</div>", "html.parser")
+        self.assertEqual("".join(TextStream.element_chunks(soup.div)), soup.div.get_text())
+
+
+class TestDateScanner(unittest.TestCase):
+    """Tests pour le moteur de détection de dates de GET DATE"""
+
+    def test_contains_date(self):
+        """Motifs courants, fenêtres lues par dateutil et texte sans date"""
+        self.assertTrue(DateScanner.contains_date("Publié le 12 mars 2024"))
+        self.assertTrue(DateScanner.contains_date("Mis à jour: May 5 à 12h30"))
+        self.assertFalse(DateScanner.contains_date("Écrivez-nous pour un devis gratuit"))
+
+    def test_prefilter_skips_unreadable_windows(self):
+        """Les fenêtres contenant un mot inconnu de dateutil ne sont pas parsées"""
+        DateScanner._parses.cache_clear()
+        self.assertFalse(DateScanner.contains_date("article réf10, lot b42 au choix"))
+        self.assertEqual(DateScanner._parses.cache_info().currsize, 0)
+
+
+class TestExtractCommands(unittest.TestCase):
+    """Tests des commandes EXTRACT exécutées depuis un script"""
+
+    def setUp(self):
+        self.interpreter = GrabInterpreter(debug_mode=False)
+        self.interpreter.set_variable("_original_html", BeautifulSoup(HTML, "html.parser"))
+
+    def run_script(self, script):
+        """Exécute un script en laissant remonter les erreurs"""
+        ast = self.interpreter.parser.parse(script)
+        self.interpreter.executor.execute(ast)
+
+    def test_extract_regex_uses_cache(self):
+        """EXTRACT REGEX ne recompile pas le motif pour chaque élément"""
+        RegexCache.clear()
+        self.run_script('SELECT ALL "p"\nEXTRACT REGEX "[0-9]+"\nSAVE numbers')
+        self.assertIn("2024", self.interpreter.get_variable("numbers"))
+        self.assertEqual(RegexCache.stats()["misses"], 1)
+
+    def test_extract_numbers_across_tags(self):
+        """Un nombre découpé par des balises est extrait entier, comme avec get_text()"""
+        self.interpreter.set_variable("_original_html", BeautifulSoup("<p>Total: 4<b>2</b>0 EUR</p>", "html.parser"))
+        self.run_script('SELECT ALL "p"\nEXTRACT NUMBERS\nSAVE numbers')
+        self.assertEqual(self.interpreter.get_variable("numbers"), ["420"])
+
+    def test_extract_numbers_as_float_and_aggregates(self):
+        """EXTRACT NUMBERS AS FLOAT retourne un tableau agrégé par SUM, AVG et PERCENTILE"""
+        self.interpreter.set_variable("_original_html", BeautifulSoup("<p>10 et 20</p><p>30, puis 40</p>", "html.parser"))
+        self.run_script('SELECT ALL "p"\nEXTRACT NUMBERS AS FLOAT\nSAVE prices\nSUM prices\nSAVE total\n'
+                        'AVG prices\nSAVE average\nPERCENTILE 50 prices\nSAVE median')
+        self.assertEqual(list(self.interpreter.get_variable("prices")), [10.0, 20.0, 30.0, 40.0])
+        self.assertEqual(self.interpreter.get_variable("total"), 100.0)
+        self.assertEqual(self.interpreter.get_variable("average"), 25.0)
+        self.assertEqual(self.interpreter.get_variable("median"), 25.0)
+
+    def test_extract_numbers_as_int_out_of_range(self):
+        """EXTRACT NUMBERS AS INT signale un nombre hors de la plage int64"""
+        self.interpreter.set_variable("_original_html", BeautifulSoup(
+            "<p>Total 999,999,999,999,999,999,999,999</p>", "html.parser"))
+        with self.assertRaisesRegex(ValueError, "EXTRACT NUMBERS: .*int64"):
+            self.run_script('SELECT ALL "p"\nEXTRACT NUMBERS AS INT')
+
+    def test_extract_text_clean_batch(self):
+        """EXTRACT TEXT CLEAN réduit les espaces sur un lot imbriqué; NFKC et INVISIBLE sont optionnels"""
+        html = "<div>\n  Total :\t4<b>2</b>0\u00a0€ <div>e\u200bﬀet\x07 x²</div></div>"
+        self.interpreter.set_variable("_original_html", BeautifulSoup(html, "html.parser"))
+        self.run_script('SELECT ALL "div"\nEXTRACT TEXT CLEAN\nSAVE plain\n'
+                        'SELECT ALL "div"\nEXTRACT TEXT CLEAN NFKC INVISIBLE\nSAVE normalized')
+        self.assertEqual(self.interpreter.get_variable("plain"),
+                         ["Total : 420 € e\u200bﬀet\x07 x²", "e\u200bﬀet\x07 x²"])
+        self.assertEqual(self.interpreter.get_variable("normalized"), ["Total : 420 € effet x2", "effet x2"])
+
+    def test_extract_keywords_and_contains_any(self):
+        """EXTRACT KEYWORDS compte les mots entiers; l'automate est mis en cache sur disque par empreinte"""
+        with tempfile.TemporaryDirectory() as tmp:
+            keywords_file = Path(tmp) / "brands.txt"
+            keywords_file.write_text("# marques\nSamsung\nSamsung Galaxy\nLG\n", encoding="utf-8")
+            cache_dir = KeywordAutomaton.CACHE_DIR
+            KeywordAutomaton.CACHE_DIR = Path(tmp) / "cache"
+            try:
+                html = "<p>Le SAMSUNG\n galaxy et un algorithme LG</p><p>rien</p>"
+                self.interpreter.set_variable("_original_html", BeautifulSoup(html, "html.parser"))
+                self.run_script(f'SELECT ALL "p"\nEXTRACT KEYWORDS FROM "{keywords_file.as_posix()}"\nSAVE found\n'
+                                f'SELECT ALL "p"\nFILTER ALL WHERE text NOT CONTAINS ANY "{keywords_file.as_posix()}"\nSAVE others')
+                cached = list(KeywordAutomaton.CACHE_DIR.glob("*.json"))
+                self.assertEqual(len(cached), 1)
+                automaton = KeywordAutomaton.from_data(json.loads(cached[0].read_text(encoding="utf-8")))
+                self.assertEqual(automaton.keywords, ["Samsung", "Samsung Galaxy", "LG"])
+                self.assertEqual(list(automaton.find("un lg samsung")), [(3, 2), (6, 0)])
+            finally:
+                KeywordAutomaton.CACHE_DIR = cache_dir
+
+        self.assertEqual(self.interpreter.get_variable("found"), [
+            {"keyword": "Samsung", "count": 1, "offsets": [[0, 3]]},
+            {"keyword": "Samsung Galaxy", "count": 1, "offsets": [[0, 3]]},
+            {"keyword": "LG", "count": 1, "offsets": [[0, 35]]},
+        ])
+        self.assertEqual([p.get_text() for p in self.interpreter.get_variable("others")], ["rien"])
+
+    def test_extract_structured_data_from_raw_body(self):
+        """EXTRACT JSONLD et MICRODATA lisent le corps brut, sans arbre HTML"""
+        body = """<html><head><script type="application/ld+json">
+          {"@context": "https://schema.org", "@graph": [{"@type": "Product", "name": "Vélo"}, {"@type": "Organization"}]}
+        </script><script type="application/ld+json">{invalide</script></head>
+        <body><div itemscope itemtype="https://schema.org/Product"><h1 itemprop="name">Vélo <b>rouge</b></h1>
+        <div itemprop="offers" itemscope itemtype="https://schema.org/Offer"><meta itemprop="price" content="199"></div>
+        </div></body></html>""".encode("utf-8")
+        self.interpreter.set_variable("_raw_body", body)
+        self.interpreter.set_variable("_original_html", None)
+        self.run_script('EXTRACT JSONLD "Product"\nSAVE products\nEXTRACT MICRODATA\nSAVE items')
+        self.assertEqual(self.interpreter.get_variable("products"), [{"@type": "Product", "name": "Vélo"}])
+        self.assertEqual(self.interpreter.get_variable("items"), [{
+            "type": ["https://schema.org/Product"],
+            "properties": {
+                "name": ["Vélo rouge"],
+                "offers": [{"type": ["https://schema.org/Offer"], "properties": {"price": ["199"]}}],
+            },
+        }])
+
+    def test_extract_table_spans_and_headers(self):
+        """EXTRACT TABLE recopie les cellules fusionnées et déduit les en-têtes sur deux niveaux"""
+        html = """<table><tr><td>autre</td></tr></table>
+        <table><thead><tr><th rowspan="2">Produit</th><th colspan="2">Prix</th></tr><tr><th>HT</th><th>TTC</th></tr></thead>
+        <tbody><tr><td rowspan="2">Vélo</td><td>1,000.50</td><td>1200</td></tr><tr><td>10</td><td></td></tr></tbody></table>"""
+        self.interpreter.set_variable("_original_html", BeautifulSoup(html, "html.parser"))
+        self.run_script('SELECT ALL "table"\nEXTRACT TABLE ONCE 2 TYPED\nSAVE prices')
+        table = self.interpreter.get_variable("prices")
+        self.assertEqual(table.to_columns(), {
+            "Produit": ["Vélo", "Vélo"],
+            "Prix / HT": [1000.5, 10.0],
+            "Prix / TTC": [1200, None],
+        })
+        self.assertEqual(table.records()[1], {"Produit": "Vélo", "Prix / HT": 10.0, "Prix / TTC": None})
+
+    def test_json_append_lines_in_loop(self):
+        """JSON ... APPEND ajoute une ligne par élément; le fichier est vidé en fin de script"""
+        self.interpreter.set_variable("_original_html", BeautifulSoup(
+            '<a href="/a" data-id="1">a</a><a href="/b">b</a>', "html.parser"))
+        with tempfile.TemporaryDirectory() as tmp:
+            output = (Path(tmp) / "liens.jsonl").as_posix()
+            self.run_script(f'SELECT ALL "a"\nGET ATTRS "href" "data-id"\nSAVE links\n'
+                            f'FOR i IN RANGE 2 {{\n  JSON links APPEND "{output}"\n}}\nJSON i APPEND "{output}"')
+            self.assertNotIn("_json_sink", self.interpreter.variables)
+            lines = Path(output).read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[:2], ['{"href":"/a","data-id":"1"}', '{"href":"/b","data-id":null}'])
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[-1], "1")
+
+    def test_json_keeps_nested_structures_native(self):
+        """JSON écrit les dict et listes d'une liste tels quels; les autres valeurs restent des chaînes"""
+        self.interpreter.set_variable("items", [{"@type": "Product"}, ["a"], 1, None])
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "items.json"
+            self.run_script(f'JSON items "{output.as_posix()}"')
+            written = json.loads(output.read_text(encoding="utf-8"))
+        self.assertEqual(written, [{"@type": "Product"}, ["a"], "1", "None"])
+
+    def test_get_attrs_aligned_records(self):
+        """GET ATTRS garde les valeurs alignées par élément, avec None pour un attribut absent"""
+        self.interpreter.set_variable("_original_html", BeautifulSoup(
+            '<a href="/a" class="x y">a</a><a data-id="7">b</a>', "html.parser"))
+        self.run_script('SELECT ALL "a"\nGET ATTRS "href" "data-id" "class"\nSAVE links')
+        links = self.interpreter.get_variable("links")
+        self.assertEqual(links.records(), [
+            {"href": "/a", "data-id": None, "class": "x y"},
+            {"href": None, "data-id": "7", "class": None},
+        ])
+        self.assertEqual(links.column("data-id"), [None, "7"])
+
+    def test_extract_urls_nested_elements(self):
+        """Les sous-arbres imbriqués ne sont parcourus qu'une fois; ABSOLUTE résout les liens relatifs"""
+        html = """<html><head><base href="https://example.com/docs/"></head><body>
+          <div><div><a href="guide.html">Guide</a> <a href="javascript:void(0)">x</a></div>
+          <a href="/contact">Contact</a> <a href="#top">Haut</a></div></body></html>"""
+        self.interpreter.set_variable("_original_html", BeautifulSoup(html, "html.parser"))
+        self.run_script('SELECT ALL "div"\nEXTRACT URLS\nSAVE links\nSELECT ALL "div"\nEXTRACT URLS ABSOLUTE\nSAVE absolute')
+        self.assertEqual(self.interpreter.get_variable("links"), ["guide.html", "/contact"])
+        self.assertEqual(self.interpreter.get_variable("absolute"),
+                         ["https://example.com/docs/guide.html", "https://example.com/contact"])
+
+    def test_get_date_first_and_last(self):
+        """GET DATE FIRST/LAST trouvent le premier et le dernier élément daté (un nombre seul compte comme date)"""
+        self.run_script('GET DATE FIRST "p"\nSAVE first\nGET DATE LAST "p"\nSAVE last')
+        self.assertEqual(self.interpreter.get_variable("first")["class"], ["contact"])
+        self.assertEqual(self.interpreter.get_variable("last")["class"], ["prices"])
+
+    def test_get_positional_modifiers(self):
+        """FIRST/LAST/ONCE n/SLICE a:b s'appliquent à GET ATTR, GET TEXT et GET ATTRS"""
+        self.interpreter.set_variable("_original_html", BeautifulSoup(
+            '<a href="/1">un</a><a>deux</a><a href="/3">trois</a><a href="/4">quatre</a>', "html.parser"))
+        self.run_script('\n'.join([
+            'GET ATTR FIRST "a" "href"', 'SAVE first',
+            'GET ATTR LAST "a" "href"', 'SAVE last',
+            'GET ATTR ONCE "a" 3 "href"', 'SAVE legacy_once',
+            'SELECT ALL "a"', 'GET TEXT SLICE 2:3', 'SAVE middle',
+            'SELECT ALL "a"', 'GET ATTRS ONCE 3 "href"', 'SAVE third',
+            'SELECT ALL "a"', 'GET ATTR SLICE 3: "href"', 'SAVE tail',
+            'SELECT ALL "a"', 'GET TEXT SLICE :2', 'SAVE head',
+        ]))
+        self.assertEqual(self.interpreter.get_variable("first"), "/1")
+        self.assertEqual(self.interpreter.get_variable("last"), "/4")
+        self.assertEqual(self.interpreter.get_variable("legacy_once"), "/3")
+        self.assertEqual(self.interpreter.get_variable("middle"), ["deux", "trois"])
+        self.assertEqual(self.interpreter.get_variable("third").as_dict(), {"href": "/3"})
+        self.assertEqual(self.interpreter.get_variable("tail"), ["/3", "/4"])
+        self.assertEqual(self.interpreter.get_variable("head"), ["un", "deux"])
+        with self.assertRaises(ValueError):
+            self.run_script('GET TEXT ONCE 9 "a"')
+
+    def test_skip_if_duplicate_in_loop(self):
+        """SKIP IF DUPLICATE passe les pages quasi identiques à une page déjà traitée; l'index peut être persistant"""
+        catalogue = " ".join(f"article {i} au prix de {i * 3} euros" for i in range(60))
+        pages = [
+            BeautifulSoup(f"<h1>Catalogue</h1><p>{catalogue}</p><p>Version imprimable</p>", "html.parser"),
+            BeautifulSoup(f"<h1>Catalogue</h1><p>{catalogue}</p><p>Version mobile</p>", "html.parser"),
+            BeautifulSoup("<h1>Contact</h1><p>Écrivez-nous pour toute question sur votre commande</p>", "html.parser"),
+        ]
+        self.interpreter.set_variable("pages", pages)
+        with tempfile.TemporaryDirectory() as tmp:
+            index_file = (Path(tmp) / "pages.idx").as_posix()
+            script = f'FOR page IN pages {{\n  USE page\n  SKIP IF DUPLICATE INDEX "{index_file}"\n  SELECT FIRST "h1"\n  SAVE kept\n}}'
+            self.run_script(script)
+            self.assertEqual(len(Path(index_file).read_text(encoding="utf-8").splitlines()), 2)
+            self.assertEqual(self.interpreter.get_variable("kept").get_text(), "Contact")
+
+            # Nouvelle exécution: toutes les pages sont déjà dans l'index persistant
+            self.interpreter.variables.pop("_duplicate_indexes")
+            self.interpreter.set_variable("kept", None)
+            self.run_script(script)
+            self.assertIsNone(self.interpreter.get_variable("kept"))
+
+    def test_skip_if_duplicate_twice_on_same_page(self):
+        """Un second SKIP IF DUPLICATE sur la page qui vient d'être ajoutée ne la prend pas pour un doublon"""
+        self.interpreter.set_variable("pages", [
+            BeautifulSoup("<h1>Catalogue</h1><p>Vélos, trottinettes et accessoires en stock</p>", "html.parser"),
+            BeautifulSoup("<h1>Contact</h1><p>Écrivez-nous pour toute question sur votre commande</p>", "html.parser"),
+        ])
+        self.run_script('FOR page IN pages {\n  USE page\n  SKIP IF DUPLICATE\n  SELECT FIRST "h1"\n'
+                        '  SKIP IF DUPLICATE\n  GET TEXT\n  SAVE kept\n}')
+        self.assertEqual(self.interpreter.get_variable("kept"), ["Contact"])
+        self.assertEqual(len(next(iter(self.interpreter.variables["_duplicate_indexes"].values()))), 2)
+
+    def test_skip_if_duplicate_same_document_in_later_iteration(self):
+        """Le même document revenu à une itération suivante est ignoré"""
+        page = BeautifulSoup("<h1>Accueil</h1><p>Bienvenue sur notre boutique en ligne de fromages</p>", "html.parser")
+        self.interpreter.set_variable("pages", [page, page])
+        with tempfile.TemporaryDirectory() as tmp:
+            output = (Path(tmp) / "pages.jsonl").as_posix()
+            self.run_script(f'FOR page IN pages {{\n  USE page\n  SKIP IF DUPLICATE\n  SELECT FIRST "h1"\n'
+                            f'  SKIP IF DUPLICATE\n  JSON page_index APPEND "{output}"\n}}')
+            lines = Path(output).read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines, ["0"])
+
+    def test_use_releases_replaced_document_cache(self):
+        """USE d'un autre document libère l'index de balises et les textes en cache de l'ancien"""
+        old = self.interpreter.get_variable("_original_html")
+        self.interpreter.set_variable("other", BeautifulSoup("<p>autre</p>", "html.parser"))
+        self.run_script('SELECT ALL "p"\nGET TEXT')
+        self.assertIsNotNone(DocumentCache.peek(old))
+        self.run_script('USE other\nSELECT ALL "p"')
+        self.assertIsNone(DocumentCache.peek(old))
+
+    def test_document_cache_freed_with_document(self):
+        """Le cache d'un document ne le garde pas en vie une fois l'interpréteur libéré"""
+        interpreter = GrabInterpreter()
+        document = BeautifulSoup(HTML, "html.parser")
+        interpreter.set_variable("_original_html", document)
+        interpreter.executor.execute(interpreter.parser.parse('SELECT ALL "p"\nGET TEXT'))
+        self.assertIsNotNone(DocumentCache.peek(document))
+        reference = weakref.ref(document)
+        del interpreter, document
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_extract_multi_single_pass(self):
+        """EXTRACT MULTI retourne un dict réparti par SAVE"""
+        self.run_script('\n'.join([
+            'SELECT ALL "p"',
+            'EXTRACT MULTI REGEX "([0-9]+) mars" EMAILS URLS',
+            'SAVE refs mails links',
+        ]))
+        self.assertEqual(self.interpreter.get_variable("refs"), ["12"])
+        self.assertEqual(self.interpreter.get_variable("mails"), ["info@example.com", "Support@Example.com"])
+        self.assertEqual(self.interpreter.get_variable("links"), ["https://example.com/docs", "www.example.org"])
+
+    def test_extract_multi_matches_dedicated_commands(self):
+        """Sans recouvrement, EXTRACT MULTI donne les mêmes listes que les commandes dédiées"""
+        self.run_script('SELECT ALL "p"\nEXTRACT MULTI NUMBERS\nSAVE multi\nSELECT ALL "p"\nEXTRACT NUMBERS\nSAVE numbers')
+        self.assertEqual(self.interpreter.get_variable("multi")["numbers"], self.interpreter.get_variable("numbers"))
+
+    def test_raw_extraction_without_tree(self):
+        """Les extractions RAW lisent le corps brut, sans document HTML parsé"""
+        self.interpreter.variables.pop("_original_html")
+        self.interpreter.set_variable("_raw_body", HTML.encode("utf-8"))
+        self.run_script('EXTRACT REGEX RAW "class=.([a-z]+)."\nSAVE classes\nEXTRACT EMAILS RAW\nSAVE mails')
+        self.assertEqual(self.interpreter.get_variable("classes"), ["contact", "links", "prices"])
+        self.assertEqual(self.interpreter.get_variable("mails"), ["info@example.com", "Support@Example.com"])
+        self.run_script('EXTRACT REGEX RAW "Écrivez à ([a-z]+)"\nSAVE names')
+        self.assertEqual(self.interpreter.get_variable("names"), ["info"])
+
+        # Après un chargement normal, LOAD URL ... RAW ne laisse pas l'ancienne page aux commandes sur l'arbre
+        def fake_get(url, **kwargs):
+            body = f"<p>{url[-1]}@{'old' if url.endswith('a') else 'new'}.com</p>".encode("utf-8")
+            return mock.Mock(content=body, url=url, headers={}, raise_for_status=lambda: None)
+
+        with mock.patch("requests.get", side_effect=fake_get):
+            # Un chargement normal ne garde que l'arbre: RAW lit alors le document resérialisé
+            self.run_script('LOAD URL "http://a"\nEXTRACT EMAILS RAW\nSAVE old_mails')
+            self.assertNotIn("_raw_body", self.interpreter.variables)
+            self.assertEqual(self.interpreter.get_variable("old_mails"), ["a@old.com"])
+            self.run_script('LOAD URL "http://a"\nLOAD URL "http://b" RAW\nEXTRACT EMAILS RAW\nSAVE new_mails')
+            self.assertEqual(self.interpreter.get_variable("new_mails"), ["b@new.com"])
+            self.run_script('LOAD URL "http://a"\nLOAD URL "http://b" RAW')
+            for command in ('SELECT ALL "p"', 'GET TEXT', 'GET DATE'):
+                with self.assertRaises(ValueError):
+                    self.run_script(command)
+
+    def test_save_split_requires_matching_dict(self):
+        """SAVE avec plusieurs noms exige un dict de même taille"""
+        self.run_script('SELECT ALL "p"\nEXTRACT MULTI EMAILS URLS')
+        with self.assertRaises(ValueError):
+            self.run_script('SAVE a b c')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
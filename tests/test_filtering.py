@@ -0,0 +1,192 @@
+"""
+Tests pour le moteur de filtrage et les commandes FILTER
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajoute le répertoire parent au PYTHONPATH pour pouvoir importer grablang
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from grablang.core.interpreter import GrabInterpreter
+from grablang.utils.columnar import ColumnarFilter
+from grablang.utils.filter_engine import FilterEngine
+from grablang.utils.text_cache import TextCache
+
+
+HTML = """
+<html><body>
+  <div class="card featured"><a href="/news/1" title="Un">Article 2024</a></div>
+  <div class="card"><a href="https://ext.example.com">Externe</a></div>
+  <div class="other"><a>Sans lien</a><a href="/news/2">Suite 42</a></div>
+</body></html>
+"""
+
+
+class TestFilterEngine(unittest.TestCase):
+    """Tests pour la compilation des conditions WHERE"""
+
+    def setUp(self):
+        self.links = BeautifulSoup(HTML, "html.parser").find_all("a")
+
+    def matching(self, *condition):
+        """Retourne le texte des liens correspondant à la condition"""
+        predicate = FilterEngine.compile(list(condition))
+        return [link.get_text() for link in self.links if predicate(link)]
+
+    def test_contains_is_case_insensitive(self):
+        """CONTAINS ignore la casse et les guillemets"""
+        self.assertEqual(self.matching("href", "CONTAINS", '"NEWS"'), ["Article 2024", "Suite 42"])
+
+    def test_matches_and_equals(self):
+        """MATCHES utilise une regex compilée, = compare exactement"""
+        self.assertEqual(self.matching("text", "MATCHES", '"\\d+$"'), ["Article 2024", "Suite 42"])
+        self.assertEqual(self.matching("title", "=", '"Un"'), ["Article 2024"])
+
+    def test_null_conditions(self):
+        """NULL et NOT NULL, y compris sous la forme attr NOM"""
+        self.assertEqual(self.matching("href", "NULL"), ["Sans lien"])
+        self.assertEqual(len(self.matching("attr", "href", "NOT", "NULL")), 3)
+
+    def test_numeric_comparisons(self):
+        """>, <, >=, <= comparent des nombres; les valeurs non numériques sont écartées"""
+        soup = BeautifulSoup('<b data-n="3"></b><b data-n="12.5"></b><b data-n="abc"></b><b></b>', "html.parser")
+        items = soup.find_all("b")
+        predicate = FilterEngine.compile(["data-n", ">", "5"])
+        self.assertEqual([item for item in items if predicate(item)], [items[1]])
+        predicate = FilterEngine.compile(["data-n", "<=", '"12.5"'])
+        self.assertEqual([item for item in items if predicate(item)], items[:2])
+        with self.assertRaises(ValueError):
+            FilterEngine.compile(["data-n", ">", '"beaucoup"'])
+
+    @unittest.skipUnless(ColumnarFilter.available(), "NumPy n'est pas installé")
+    def test_columnar_matches_row_mode(self):
+        """Le mode colonnes donne les mêmes éléments que le mode ligne par ligne"""
+        conditions = [
+            ["href", "NOT", "NULL"],
+            ["href", "CONTAINS", '"NEWS"', "AND", "NOT", "title", "=", '"Un"'],
+            ["text", "!=", '"Externe"', "OR", "parent", "div", "class", "CONTAINS", '"card"'],
+            ["text", "MATCHES", '"\\d"', "AND", "text", ">=", "42"],
+        ]
+        for condition in conditions:
+            predicate = FilterEngine.compile(condition)
+            expected = [link for link in self.links if predicate(link)]
+            self.assertEqual(ColumnarFilter(self.links).filter(FilterEngine.parse(condition)), expected)
+
+    @unittest.skipUnless(ColumnarFilter.available(), "NumPy n'est pas installé")
+    def test_columnar_contains_with_longer_lowercase(self):
+        """CONTAINS en colonnes trouve la valeur même si la minuscule allonge le texte ('İ')"""
+        items = BeautifulSoup("<b>İx</b><b>Ab</b>", "html.parser").find_all("b")
+        for condition in (["text", "CONTAINS", '"x"'], ["text", "NOT", "CONTAINS", '"x"']):
+            predicate = FilterEngine.compile(condition)
+            expected = [item for item in items if predicate(item)]
+            self.assertEqual(ColumnarFilter(items).filter(FilterEngine.parse(condition)), expected)
+
+    def test_parent_condition(self):
+        """parent TAG champ OP valeur teste les ancêtres"""
+        self.assertEqual(self.matching("parent", "div", "class", "CONTAINS", '"featured"'), ["Article 2024"])
+
+    def test_parent_condition_memoized(self):
+        """Chaque ancêtre n'est évalué qu'une fois par prédicat compilé"""
+        soup = BeautifulSoup("<section><div class='card'>" + "<p><a>x</a></p>" * 50 + "</div></section>", "html.parser")
+        links = soup.find_all("a")
+        condition = ["parent", "div", "class", "CONTAINS", '"card"']
+        predicate = FilterEngine.compile(condition)
+        self.assertTrue(predicate(links[0]))
+        # Le résultat du div est réutilisé pour les liens suivants, sans relire sa classe
+        soup.div["class"] = ["other"]
+        self.assertTrue(all(predicate(link) for link in links[1:]))
+        self.assertFalse(FilterEngine.compile(condition)(links[1]))
+
+    def test_boolean_expressions(self):
+        """AND, OR, NOT et parenthèses se combinent avec court-circuit"""
+        self.assertEqual(self.matching("href", "NOT", "NULL", "AND", "text", "NOT", "CONTAINS", '"2024"'),
+                         ["Externe", "Suite 42"])
+        self.assertEqual(self.matching("NOT", "(", "href", "CONTAINS", '"news"', "OR", "href", "NULL", ")"),
+                         ["Externe"])
+
+    def test_cheap_conditions_run_first(self):
+        """Les conditions coûteuses ne sont évaluées que si les moins coûteuses passent"""
+        result = self.matching("text", "MATCHES", '"4"', "AND", "title", "NOT", "NULL")
+        self.assertEqual(result, ["Article 2024"])
+        # Seul le lien qui a un title a eu son texte calculé (et mis en cache)
+        self.assertEqual([TextCache.cached(link, strip=True) for link in self.links],
+                         ["Article 2024", None, None, None])
+
+    def test_find_stops_early(self):
+        """FIRST, LAST et n-ième s'arrêtent dès la correspondance trouvée"""
+        calls = []
+
+        def predicate(element):
+            calls.append(element)
+            return element.get("href") is not None
+
+        self.assertEqual(FilterEngine.find_first(self.links, predicate), (self.links[0], 0))
+        self.assertEqual(len(calls), 1)
+        del calls[:]
+        self.assertEqual(FilterEngine.find_last(self.links, predicate), (self.links[-1], 3))
+        self.assertEqual(len(calls), 1)
+        del calls[:]
+        self.assertEqual(FilterEngine.find_nth(self.links, predicate, 2), (self.links[1], 2))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(FilterEngine.find_nth(self.links, predicate, 9), (self.links[-1], 3))
+
+    def test_unknown_operator(self):
+        """Un opérateur inconnu est signalé à la compilation"""
+        with self.assertRaises(ValueError):
+            FilterEngine.compile(["href", "STARTS", '"x"'])
+        with self.assertRaises(ValueError):
+            FilterEngine.compile(["(", "href", "NULL"])
+
+
+class TestFilterCommands(unittest.TestCase):
+    """Tests des commandes FILTER exécutées depuis un script"""
+
+    def setUp(self):
+        self.interpreter = GrabInterpreter(debug_mode=False)
+        self.interpreter.set_variable("_original_html", BeautifulSoup(HTML, "html.parser"))
+
+    def run_script(self, script):
+        """Exécute un script en laissant remonter les erreurs"""
+        ast = self.interpreter.parser.parse(script)
+        self.interpreter.executor.execute(ast)
+
+    def test_filter_variants(self):
+        """ALL, FIRST, LAST et ONCE partagent le même moteur"""
+        self.run_script('\n'.join([
+            'SELECT ALL "a"',
+            'SAVE links',
+            'FILTER ALL WHERE href CONTAINS "news"',
+            'SAVE news',
+            'USE links',
+            'FILTER FIRST WHERE href NOT NULL',
+            'SAVE first',
+            'USE links',
+            'FILTER LAST WHERE href NOT NULL',
+            'SAVE last',
+            'USE links',
+            'FILTER ONCE 2 WHERE href NOT NULL',
+            'SAVE second',
+        ]))
+        self.assertEqual(len(self.interpreter.get_variable("news")), 2)
+        self.assertEqual(self.interpreter.get_variable("first")["href"], "/news/1")
+        self.assertEqual(self.interpreter.get_variable("last")["href"], "/news/2")
+        self.assertEqual(self.interpreter.get_variable("second")["href"], "https://ext.example.com")
+
+    def test_filter_boolean_where(self):
+        """Une seule commande FILTER remplace un enchaînement de filtres"""
+        self.run_script('\n'.join([
+            'SELECT ALL "a"',
+            'FILTER ALL WHERE href NOT NULL AND (text CONTAINS "suite" OR title = "Un")',
+            'SAVE links',
+        ]))
+        links = self.interpreter.get_variable("links")
+        self.assertEqual([link["href"] for link in links], ["/news/1", "/news/2"])
+        self.assertIs(links.source, self.interpreter.get_variable("_original_html"))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
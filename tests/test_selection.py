@@ -0,0 +1,117 @@
+"""
+Tests pour le moteur de sélection et les commandes SELECT
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajoute le répertoire parent au PYTHONPATH pour pouvoir importer grablang
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from grablang.core.interpreter import GrabInterpreter
+from grablang.utils.element_list import ElementList, is_element_list
+from grablang.utils.selection import SelectionEngine
+
+
+HTML = """
+<html><body>
+  <div class="card"><a href="/1">Un</a><p>premier</p></div>
+  <div class="card"><a href="/2">Deux</a><div><a href="/3">Trois</a></div></div>
+  <p>dernier</p>
+</body></html>
+"""
+
+
+class TestSelectionEngine(unittest.TestCase):
+    """Tests pour la poussée des limites dans le moteur de sélection"""
+
+    def setUp(self):
+        self.soup = BeautifulSoup(HTML, "html.parser")
+
+    def test_first_nth_last_match_find_all(self):
+        """FIRST, ONCE et LAST donnent les mêmes éléments que find_all"""
+        links = self.soup.find_all("a")
+        self.assertIs(SelectionEngine.select_first(self.soup, "a"), links[0])
+        self.assertIs(SelectionEngine.select_last(self.soup, "a"), links[-1])
+        element, count = SelectionEngine.select_nth(self.soup, "a", 2)
+        self.assertIs(element, links[1])
+        self.assertEqual(count, 2)
+
+    def test_nth_out_of_range(self):
+        """ONCE au-delà du nombre d'éléments retourne le compte exact"""
+        element, count = SelectionEngine.select_nth(self.soup, "a", 10)
+        self.assertIsNone(element)
+        self.assertEqual(count, 3)
+
+    def test_reverse_walk_matches_document_order(self):
+        """Le parcours inverse visite les éléments en ordre document inverse"""
+        reversed_divs = list(SelectionEngine.iter_matches_reversed(self.soup, "div"))
+        self.assertEqual(reversed_divs, list(reversed(self.soup.find_all("div"))))
+
+    def test_outermost_roots_drops_nested(self):
+        """Les sous-arbres imbriqués ne sont parcourus qu'une fois"""
+        divs = self.soup.find_all("div")
+        roots = SelectionEngine.outermost_roots(list(reversed(divs)) + divs)
+        self.assertEqual(roots, divs[:2])
+
+    def test_select_all_returns_element_list(self):
+        """SELECT ALL retourne une ElementList rattachée au document"""
+        links = SelectionEngine.select_all(self.soup, "a")
+        self.assertIsInstance(links, ElementList)
+        self.assertIs(links.source, self.soup)
+        self.assertIsInstance(links[1:], ElementList)
+        self.assertIs(links[1:].source, self.soup)
+        self.assertTrue(is_element_list(self.soup.find_all("a")))
+        self.assertFalse(hasattr(links, "__dict__"))
+
+    def test_last_uses_tag_index(self):
+        """LAST utilise l'index de balises alimenté par SELECT ALL"""
+        SelectionEngine.select_all(self.soup, "p")
+        self.assertEqual(SelectionEngine.select_last(self.soup, "p").get_text(), "dernier")
+
+
+class TestSelectCommands(unittest.TestCase):
+    """Tests des commandes SELECT exécutées depuis un script"""
+
+    def setUp(self):
+        self.interpreter = GrabInterpreter(debug_mode=False)
+        self.interpreter.set_variable("_original_html", BeautifulSoup(HTML, "html.parser"))
+
+    def run_script(self, script):
+        """Exécute un script en laissant remonter les erreurs"""
+        ast = self.interpreter.parser.parse(script)
+        self.interpreter.executor.execute(ast)
+
+    def test_select_once(self):
+        """SELECT ONCE retourne l'élément à l'index demandé"""
+        self.run_script('SELECT ONCE 2 "a"\nSAVE link')
+        self.assertEqual(self.interpreter.get_variable("link")["href"], "/2")
+
+    def test_select_all_within(self):
+        """SELECT ALL ... WITHIN cherche dans les sous-arbres du résultat précédent"""
+        self.run_script('SELECT ALL "div"\nSELECT ALL "a" WITHIN\nSAVE links')
+        hrefs = [link["href"] for link in self.interpreter.get_variable("links")]
+        self.assertEqual(hrefs, ["/1", "/2", "/3"])
+        # Des textes (GET TEXT) ne délimitent aucun sous-arbre
+        self.run_script('SELECT ALL "div"\nGET TEXT')
+        with self.assertRaisesRegex(ValueError, "WITHIN"):
+            self.run_script('SELECT ALL "a" WITHIN')
+
+    def test_select_many(self):
+        """SELECT MANY remplit une variable par champ en un seul parcours"""
+        self.run_script('SELECT MANY links="a" paragraphs="p"')
+        self.assertEqual(len(self.interpreter.get_variable("links")), 3)
+        self.assertEqual(len(self.interpreter.get_variable("paragraphs")), 2)
+        self.assertEqual(set(self.interpreter.get_variable("_last_result")), {"links", "paragraphs"})
+
+    def test_select_last(self):
+        """SELECT LAST retourne le dernier élément"""
+        self.run_script('SELECT LAST "a"\nSAVE link')
+        self.assertEqual(self.interpreter.get_variable("link")["href"], "/3")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
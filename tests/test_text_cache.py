@@ -0,0 +1,57 @@
+"""
+Tests pour le cache de texte partagé par les commandes
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Ajoute le répertoire parent au PYTHONPATH pour pouvoir importer grablang
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from grablang.utils.document_cache import DocumentCache
+from grablang.utils.text_cache import TextCache
+
+
+HTML = """
+<html><head><title> Titre </title><style>p { color: red; }</style></head>
+<body>
+  <div> Bonjour <!-- commentaire --> <b> le </b>monde<script>var x = 1;</script></div>
+  <p>  plusieurs
+     lignes </p>
+</body></html>
+"""
+
+
+class TestTextCache(unittest.TestCase):
+    """Tests pour l'équivalence avec get_text et la réutilisation du cache"""
+
+    def setUp(self):
+        self.soup = BeautifulSoup(HTML, "html.parser")
+
+    def test_matches_get_text(self):
+        """Le texte mis en cache est identique à get_text, avec ou sans strip"""
+        elements = list(reversed(self.soup.find_all(True))) + [self.soup]
+        for strip in (False, True):
+            for element in elements:
+                self.assertEqual(TextCache.text(element, strip=strip), element.get_text(strip=strip))
+
+    def test_parent_reuses_children(self):
+        """Le calcul d'un parent remplit aussi le cache de ses descendants"""
+        TextCache.text(self.soup.body, strip=True)
+        cache = DocumentCache.peek(self.soup)
+        self.assertIn(id(self.soup.find("b")), cache.stripped_texts)
+        self.assertNotIn(id(self.soup.find("b")), cache.raw_texts)
+
+    def test_invalidate(self):
+        """Une modification de l'arbre suivie d'invalidate est prise en compte"""
+        self.assertTrue(TextCache.text(self.soup.p, strip=True).startswith("plusieurs"))
+        self.soup.p.string = "nouveau"
+        DocumentCache.invalidate(self.soup)
+        self.assertEqual(TextCache.text(self.soup.p, strip=True), "nouveau")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)